@@ -0,0 +1,133 @@
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from gc import collect
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+)
+
+import lpm.evaluator as evaluator
+from lpm.ast import (
+    Integer as IntegerNode,
+    Program,
+    StringLiteral,
+)
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Integer,
+    String,
+)
+from lpm.parser import Parser
+
+# Loop-style recursion: counters, accumulators and literals on every step.
+_PROGRAMS: Dict[str, str] = {
+    'countdown': '''
+        variable cuenta = procedimiento(n) { si (n == 0) { 0 } si_no { cuenta(n - 1) } };
+        cuenta({n});
+    ''',
+    'accumulate': '''
+        variable suma = procedimiento(n, total) {
+            si (n < 1) { regresa total; }
+            suma(n - 1, total + n * 2 - 1)
+        };
+        suma({n}, 0);
+    ''',
+    'strings': '''
+        variable cuenta = procedimiento(n, texto) {
+            si (n == 0) { regresa texto == "fin"; }
+            cuenta(n - 1, "fin")
+        };
+        cuenta({n}, "");
+    ''',
+}
+
+
+# Runs the evaluator as it was before literals and small integers were
+# cached: a new object for every literal evaluation and every result.
+@contextmanager
+def _uncached() -> Iterator[None]:
+    saved = (evaluator._to_integer_object, evaluator._integer_literal, evaluator._string_literal)
+
+    def integer_literal(node: IntegerNode) -> Integer:
+        assert node.value is not None
+        return Integer(node.value)
+
+    def string_literal(node: StringLiteral) -> String:
+        return String(node.value)
+
+    evaluator._to_integer_object = Integer
+    evaluator._integer_literal = integer_literal
+    evaluator._string_literal = string_literal
+    try:
+        yield
+    finally:
+        evaluator._to_integer_object, evaluator._integer_literal, evaluator._string_literal = saved
+
+
+# Counts the Integer and String objects created during one run.
+def _objects(program: Program) -> int:
+    created = 0
+    initializers: Dict[type, Any] = {Integer: Integer.__init__, String: String.__init__}
+
+    def counting(cls: type) -> Callable[..., None]:
+        initializer = initializers[cls]
+
+        def __init__(self: Any, value: Any) -> None:
+            nonlocal created
+            created += 1
+            initializer(self, value)
+
+        return __init__
+
+    for cls in initializers:
+        setattr(cls, '__init__', counting(cls))
+    try:
+        evaluator.evaluate(program, Environment())
+    finally:
+        for cls, initializer in initializers.items():
+            setattr(cls, '__init__', initializer)
+
+    return created
+
+
+def _time(program: Program, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        collect()
+        begin = perf_counter()
+        evaluator.evaluate(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Objects created by the evaluator with and without cached values.')
+    arguments.add_argument('--n', type=int, default=20000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    print(f'{"program":<12}{"uncached":>12}{"objects":>10}{"cached":>12}{"objects":>10}{"speedup":>9}')
+    for name, source in _PROGRAMS.items():
+        source = source.replace('{n}', str(options.n))
+
+        with _uncached():
+            program = Parser(tokenize(source)).parse_program()
+            uncached_objects = _objects(program)
+            uncached = _time(program, options.repeat)
+
+        program = Parser(tokenize(source)).parse_program()
+        cached_objects = _objects(program)
+        cached = _time(program, options.repeat)
+
+        print(f'{name:<12}{uncached * 1000:>10.1f}ms{uncached_objects:>10}'
+              f'{cached * 1000:>10.1f}ms{cached_objects:>10}{uncached / cached:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
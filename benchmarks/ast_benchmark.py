@@ -0,0 +1,101 @@
+from argparse import ArgumentParser
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Tuple,
+)
+from unittest.mock import patch
+
+from benchmarks.corpus import generate_program
+from lpm import parser as parser_module
+from lpm.ast import (
+    ASTNode,
+    Program,
+)
+from lpm.lexer import Lexer
+from lpm.parser import Parser
+
+# The node layout before slots: a per-instance __dict__ holding the token the
+# parser handed over plus the node's fields, assigned in constructor order.
+_LEGACY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'Program': ('statements',),
+    'Identifier': ('value',),
+    'LetStatement': ('name', 'value'),
+    'ReturnStatement': ('return_value',),
+    'ExpressionStatement': ('expression',),
+    'Integer': ('value',),
+    'Prefix': ('operator', 'right'),
+    'Infix': ('left', 'operator', 'right'),
+    'Boolean': ('value',),
+    'Block': ('statements',),
+    'If': ('condition', 'consequence', 'alternative'),
+    'Function': ('parameters', 'body'),
+    'Call': ('function', 'arguments'),
+    'StringLiteral': ('value',),
+}
+
+
+def _legacy_node(name: str, fields: Tuple[str, ...]) -> type:
+    def __init__(self: Any, *args: Any, start: int = -1, **kwargs: Any) -> None:
+        if name != 'Program':
+            self.token = kwargs['token'] if 'token' in kwargs else args[0]
+            args = args[1:]
+
+        for idx, field in enumerate(fields):
+            setattr(self, field, args[idx] if idx < len(args) else kwargs.get(field))
+
+    return type(name, (), {'__init__': __init__})
+
+
+def _children(node: Any) -> Iterator[Any]:
+    for field in _LEGACY_FIELDS[type(node).__name__]:
+        value = getattr(node, field)
+        if isinstance(value, list):
+            yield from value
+        elif isinstance(value, ASTNode):
+            yield value
+
+
+def _count(node: Any) -> int:
+    return 1 + sum(_count(child) for child in _children(node))
+
+
+def _measure(parse: Callable[[], Program]) -> Tuple[Program, int]:
+    start()
+    program = parse()
+    retained, _ = get_traced_memory()
+    stop()
+
+    return program, retained
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Retained memory per AST node, legacy vs slotted layout.')
+    arguments.add_argument('--statements', type=int, default=20000)
+    options = arguments.parse_args()
+
+    source = generate_program(options.statements)
+
+    program, compact = _measure(lambda: Parser(Lexer(source)).parse_program())
+    nodes = _count(program)
+    del program
+
+    legacy_nodes = {name: _legacy_node(name, fields) for name, fields in _LEGACY_FIELDS.items()}
+    with patch.dict(parser_module.__dict__, legacy_nodes):
+        _, legacy = _measure(lambda: Parser(Lexer(source)).parse_program())
+
+    print(f'nodes:   {nodes:>10}')
+    print(f'legacy:  {legacy / 2 ** 20:>8.2f} MiB  {legacy / nodes:>6.1f} bytes/node')
+    print(f'slotted: {compact / 2 ** 20:>8.2f} MiB  {compact / nodes:>6.1f} bytes/node '
+          f'({legacy / compact:.2f}x smaller)')
+
+
+if __name__ == '__main__':
+    main()
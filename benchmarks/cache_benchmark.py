@@ -0,0 +1,42 @@
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.corpus import generate_program
+from lpm.cache import ParseCache
+from lpm.lexer import Lexer
+from lpm.parser import Parser
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Front-end time with and without the parse cache.')
+    arguments.add_argument('--statements', type=int, default=20000)
+    arguments.add_argument('--repeat', type=int, default=5)
+    options = arguments.parse_args()
+
+    source = generate_program(options.statements)
+
+    begin = perf_counter()
+    Parser(Lexer(source)).parse_program()
+    parse = perf_counter() - begin
+
+    with TemporaryDirectory() as directory:
+        cache = ParseCache(directory)
+
+        begin = perf_counter()
+        cache.parse(source)
+        miss = perf_counter() - begin
+
+        hit = float('inf')
+        for _ in range(options.repeat):
+            begin = perf_counter()
+            cache.parse(source)
+            hit = min(hit, perf_counter() - begin)
+
+    print(f'lex + parse: {parse * 1000:>9.1f}ms')
+    print(f'cache miss:  {miss * 1000:>9.1f}ms')
+    print(f'cache hit:   {hit * 1000:>9.1f}ms ({parse / hit:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
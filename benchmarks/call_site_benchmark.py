@@ -0,0 +1,82 @@
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from gc import collect
+from time import perf_counter
+from typing import (
+    Any,
+    Iterator,
+    List,
+)
+
+from lpm.ast import Program
+from lpm.callsite import (
+    CallSiteCache,
+    statistics,
+)
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import Environment
+from lpm.parser import Parser
+
+# A tail-recursive loop calling a small helper on every step. paso reads the
+# global incremento, so it is not memoized.
+_SOURCE = '''
+    variable incremento = 3;
+    variable paso = procedimiento(total, n) { total + n * incremento };
+    variable bucle = procedimiento(n, total) {
+        si (n < 1) { regresa total; }
+        bucle(n - 1, paso(total, n))
+    };
+    bucle({n}, 0);
+'''
+
+
+# Every call takes the generic path, as before call sites had caches.
+@contextmanager
+def _uncached() -> Iterator[None]:
+    saved = CallSiteCache.update
+
+    def update(self: CallSiteCache, fn: Any, args: List[Any]) -> None:
+        self.function = None
+
+    CallSiteCache.update = update  # type: ignore
+    try:
+        yield
+    finally:
+        CallSiteCache.update = saved  # type: ignore
+
+
+def _time(n: int, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        program = Parser(tokenize(_SOURCE.replace('{n}', str(n)))).parse_program()
+        collect()
+        begin = perf_counter()
+        evaluate(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Procedimiento calls with and without inline caches.')
+    arguments.add_argument('--iterations', type=int, default=50000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    with _uncached():
+        generic = _time(options.iterations, options.repeat)
+    cached = _time(options.iterations, options.repeat)
+
+    print(f'generic  {generic * 1000:>9.1f}ms')
+    print(f'cached   {cached * 1000:>9.1f}ms  {generic / cached:>5.2f}x')
+
+    program: Program = Parser(tokenize(_SOURCE.replace('{n}', str(options.iterations)))).parse_program()
+    evaluate(program, Environment())
+    for source, hits, misses in statistics(program):
+        print(f'{source:<40} {hits:>8} hits {misses:>4} misses')
+
+
+if __name__ == '__main__':
+    main()
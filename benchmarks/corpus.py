@@ -0,0 +1,62 @@
+from random import Random
+from typing import List
+
+_OPERATORS: List[str] = ['+', '-', '*', '/']
+
+
+def _expression(random: Random, names: List[str], depth: int = 0) -> str:
+    if depth > 2 or random.random() < 0.3:
+        if names and random.random() < 0.5:
+            return random.choice(names)
+
+        return str(random.randint(1, 999))
+
+    operator = random.choice(_OPERATORS)
+    left = _expression(random, names, depth + 1)
+
+    # Keep values bounded so evaluation benchmarks do not turn into bignum ones.
+    if operator == '/':
+        return f'({left} / {random.randint(1, 9)})'
+    elif operator == '*':
+        return f'({left} * {random.randint(0, 9)})'
+
+    return f'({left} {operator} {_expression(random, names, depth + 1)})'
+
+
+def generate_program(statements: int, seed: int = 0) -> str:
+    random: Random = Random(seed)
+    variables: List[str] = []
+    functions: List[str] = []
+    lines: List[str] = []
+
+    for idx in range(statements):
+        choice = random.random()
+
+        if choice < 0.4 or not functions:
+            if choice < 0.1 or not variables:
+                name = f'f{idx}'
+                lines.append(
+                    f'variable {name} = procedimiento(a, b) {{\n'
+                    f'    si (a < b) {{\n'
+                    f'        regresa a * 2 + b;\n'
+                    f'    }} si_no {{\n'
+                    f'        regresa b - a;\n'
+                    f'    }}\n'
+                    f'}};')
+                functions.append(name)
+            else:
+                name = f'v{idx}'
+                lines.append(f'variable {name} = {_expression(random, variables)};')
+                variables.append(name)
+        elif choice < 0.6:
+            function = random.choice(functions)
+            lines.append(f'variable v{idx} = {function}({_expression(random, variables)}, {random.randint(0, 99)});')
+            variables.append(f'v{idx}')
+        elif choice < 0.75:
+            lines.append(f'variable s{idx} = "cadena número {idx}" + "!";')
+        elif choice < 0.9:
+            lines.append(f'si ({_expression(random, variables)} > {random.randint(0, 999)}) {{ verdadero; }} si_no {{ !falso; }}')
+        else:
+            lines.append(f'longitud("texto {idx}") == {random.randint(0, 20)};')
+
+    return '\n'.join(lines) + '\n'
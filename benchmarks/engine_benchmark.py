@@ -0,0 +1,75 @@
+from argparse import ArgumentParser
+from gc import collect
+from time import perf_counter
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+)
+
+from lpm.ast import Program
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Object,
+)
+from lpm.parser import Parser
+from lpm.repl import ENGINES
+
+_PROGRAMS: Dict[str, str] = {
+    'fibonacci': '''
+        variable fib = procedimiento(n) {
+            si (n < 2) { regresa n; }
+            regresa fib(n - 1) + fib(n - 2);
+        };
+        fib({n});
+    ''',
+    'closures': '''
+        variable sumador = procedimiento(x) { procedimiento(y) { x + y } };
+        variable arbol = procedimiento(n) {
+            si (n < 1) { 1 } si_no { sumador(arbol(n - 1))(arbol(n - 1)) }
+        };
+        arbol({n});
+    ''',
+}
+
+_SIZES: Dict[str, int] = {
+    'fibonacci': 22,
+    'closures': 14,
+}
+
+
+# The evaluator runs without memoization, which the other engines lack and
+# which would otherwise skip most calls.
+def _unmemoized(program: Program, env: Environment) -> Optional[Object]:
+    return evaluate(program, env, 0)
+
+
+def _time(engine: Callable[[Program, Environment], Optional[Object]], program: Program, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        collect()
+        begin = perf_counter()
+        engine(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Run time of each execution engine, and speedup over the evaluator.')
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    print(f'{"program":<12}' + ''.join(f'{engine:>20}' for engine in ENGINES))
+    for name, source in _PROGRAMS.items():
+        program = Parser(tokenize(source.replace('{n}', str(_SIZES[name])))).parse_program()
+        engines = [_unmemoized if engine is evaluate else engine for engine in ENGINES.values()]
+        times = [_time(engine, program, options.repeat) for engine in engines]
+        print(f'{name:<12}' + ''.join(f'{time * 1000:>10.1f}ms {times[0] / time:>6.1f}x' for time in times))
+
+
+if __name__ == '__main__':
+    main()
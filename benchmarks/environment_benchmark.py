@@ -0,0 +1,141 @@
+from argparse import ArgumentParser
+from timeit import repeat
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+from typing import (
+    Callable,
+    cast,
+    List,
+    Tuple,
+)
+
+from lpm.ast import (
+    ExpressionStatement,
+    Function as FunctionNode,
+    Identifier,
+    Infix,
+    Program,
+    Statement,
+)
+from lpm.evaluator import (
+    _evaluate_identifier,
+    _evaluate_program,
+    _extend_function_environment,
+    evaluate,
+)
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Function,
+    Integer,
+    Object,
+)
+from lpm.parser import Parser
+from lpm.resolver import resolve
+
+# Four nested procedimientos with two parameters and one variable each; the
+# innermost body reads variables zero to three frames out and a builtin.
+_NESTED = '''
+    procedimiento(a, b) { variable c = a;
+        procedimiento(d, e) { variable f = d;
+            procedimiento(g, h) { variable i = g;
+                procedimiento(j, k) { variable l = j; j + g + d + a + longitud } } } };
+'''
+
+_CALL = '''
+    variable suma = procedimiento(a, b) { variable c = a; c + b };
+    suma(1, 2);
+'''
+
+_ARGS: List[Object] = [Integer(1), Integer(2)]
+
+
+def _parse(source: str, resolved: bool) -> Program:
+    program = Parser(tokenize(source)).parse_program()
+    if resolved:
+        resolve(program)
+
+    return program
+
+
+# The chain of scopes the innermost body runs in, and its identifiers.
+def _nested(resolved: bool) -> Tuple[Function, Environment, List[Identifier]]:
+    statement = cast(ExpressionStatement, _parse(_NESTED, resolved).statements[0])
+    node = cast(FunctionNode, statement.expression)
+    env = Environment()
+
+    while True:
+        assert node.body is not None
+        function = Function(node.parameters, node.body, env, node.slots)
+        env = _extend_function_environment(function, _ARGS)
+        last = cast(ExpressionStatement, node.body.statements[-1]).expression
+        if type(last) != FunctionNode:
+            break
+        node = cast(FunctionNode, last)
+
+    identifiers: List[Identifier] = []
+    while type(last) == Infix:
+        identifiers.insert(0, cast(Identifier, cast(Infix, last).right))
+        last = cast(Infix, last).left
+    identifiers.insert(0, cast(Identifier, last))
+
+    return function, env, identifiers
+
+
+def _best(operation: Callable[[], object], number: int) -> float:
+    return min(repeat(operation, number=number, repeat=5)) / number
+
+
+def _frame_bytes(function: Function) -> float:
+    start()
+    frames = [_extend_function_environment(function, _ARGS) for _ in range(10000)]
+    current, _ = get_traced_memory()
+    stop()
+
+    return current / len(frames)
+
+
+def _call(resolved: bool) -> Tuple[Statement, Environment]:
+    program = _parse(_CALL, resolved)
+    env = Environment()
+    _evaluate_program(program, env)
+
+    return program.statements[1], env
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Per-call cost of procedimiento scopes: looked up by name vs slot frames.')
+    arguments.add_argument('--number', type=int, default=200000)
+    options = arguments.parse_args()
+    number = options.number
+
+    by_name, resolved = _nested(False), _nested(True)
+    by_name_call, resolved_call = _call(False), _call(True)
+
+    rows: List[Tuple[str, float, float, str]] = [
+        ('new scope',
+         _best(lambda: _extend_function_environment(by_name[0], _ARGS), number) * 1e9,
+         _best(lambda: _extend_function_environment(resolved[0], _ARGS), number) * 1e9,
+         'ns'),
+        ('scope size', _frame_bytes(by_name[0]), _frame_bytes(resolved[0]), 'B'),
+    ]
+    for plain, slotted in zip(by_name[2], resolved[2]):
+        rows.append((f'lookup {plain.value}',
+                     _best(lambda: _evaluate_identifier(plain, by_name[1]), number) * 1e9,
+                     _best(lambda: _evaluate_identifier(slotted, resolved[1]), number) * 1e9,
+                     'ns'))
+    rows.append(('call suma(1, 2)',
+                 _best(lambda: evaluate(by_name_call[0], by_name_call[1]), number // 10) * 1e9,
+                 _best(lambda: evaluate(resolved_call[0], resolved_call[1]), number // 10) * 1e9,
+                 'ns'))
+
+    print(f'{"":<18}{"by name":>12}{"slots":>12}')
+    for name, plain_cost, slotted_cost, unit in rows:
+        print(f'{name:<18}{plain_cost:>10.0f}{unit:<2}{slotted_cost:>10.0f}{unit:<2}{plain_cost / slotted_cost:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from benchmarks.corpus import generate_program
+from lpm.incremental import Document
+from lpm.lexer import tokenize
+from lpm.parser import Parser
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Edit latency of the incremental front end vs a full re-parse.')
+    arguments.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    arguments.add_argument('--edits', type=int, default=50)
+    options = arguments.parse_args()
+
+    print(f'{"statements":>10} {"full parse":>12} {"edit":>12}')
+    for size in options.sizes:
+        source = generate_program(size)
+
+        begin = perf_counter()
+        Parser(tokenize(source)).parse_program()
+        full = perf_counter() - begin
+
+        document = Document(source)
+        offset = source.index('variable', len(source) // 2) + len('variable ')
+        begin = perf_counter()
+        for idx in range(options.edits):
+            # Rename a binding in the middle of the file back and forth.
+            if idx % 2 == 0:
+                document.edit(offset, 0, 'x')
+            else:
+                document.edit(offset, 1, '')
+        edit = (perf_counter() - begin) / options.edits
+
+        print(f'{size:>10} {full * 1000:>10.2f}ms {edit * 1000:>10.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
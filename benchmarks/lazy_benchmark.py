@@ -0,0 +1,71 @@
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from typing import (
+    Dict,
+    List,
+)
+
+from lpm.evaluator import evaluate
+from lpm.lexer import (
+    TokenBuffer,
+    tokenize,
+)
+from lpm.object import Environment
+from lpm.parser import Parser
+
+
+# Many procedimiento definitions with bodies of a few dozen statements, of
+# which only the first few are called.
+def _script(functions: int, body: int, calls: int, seed: int = 0) -> str:
+    random = Random(seed)
+    lines: List[str] = []
+
+    for idx in range(functions):
+        statements = [f'variable v{step} = x * {random.randint(1, 9)} + {random.randint(0, 99)};'
+                      for step in range(body)]
+        statements.append(f'si (v0 > 100) {{ regresa v0 - 1; }} si_no {{ regresa v{body - 1}; }}')
+        lines.append(f'variable f{idx} = procedimiento(x) {{ {" ".join(statements)} }};')
+
+    lines.extend(f'f{idx}({idx});' for idx in range(calls))
+
+    return '\n'.join(lines)
+
+
+def _time(tokens: TokenBuffer, repeat: int, run: bool, **options: bool) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        begin = perf_counter()
+        program = Parser(tokens, **options).parse_program()
+        if run:
+            evaluate(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Eager vs lazy parsing of procedimiento bodies.')
+    arguments.add_argument('--functions', type=int, default=200)
+    arguments.add_argument('--body', type=int, default=30)
+    arguments.add_argument('--calls', type=int, default=5)
+    arguments.add_argument('--repeat', type=int, default=5)
+    options = arguments.parse_args()
+
+    tokens = tokenize(_script(options.functions, options.body, options.calls))
+    modes: Dict[str, Dict[str, bool]] = {
+        'eager': {},
+        'lazy': {'lazy': True},
+        'lazy + validate': {'lazy': True, 'validate': True},
+    }
+
+    print(f'{options.functions} functions, {options.calls} called, {len(tokens)} tokens')
+    for name, mode in modes.items():
+        parse = _time(tokens, options.repeat, False, **mode)
+        run = _time(tokens, options.repeat, True, **mode)
+        print(f'{name:<16} parse {parse * 1000:>8.1f}ms   parse + run {run * 1000:>8.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
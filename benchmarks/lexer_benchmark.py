@@ -0,0 +1,205 @@
+from argparse import ArgumentParser
+from re import match
+from time import perf_counter
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+
+from benchmarks.corpus import generate_program
+from lpm.lexer import (
+    Lexer,
+    tokenize,
+)
+from lpm.token import (
+    Token,
+    TokenType,
+    lookup_token_type,
+)
+
+
+# The per-character regex lexer lpm used before the table-driven one, kept
+# only as the baseline this benchmark compares against.
+class RegexLexer:
+
+    _TOKENS = {
+        r'^\+$': TokenType.PLUS,
+        r'^\($': TokenType.LPAREN,
+        r'^\)$': TokenType.RPAREN,
+        r'^{$': TokenType.LBRACE,
+        r'^}$': TokenType.RBRACE,
+        r'^,$': TokenType.COMMA,
+        r'^;$': TokenType.SEMICOLON,
+        r'^$': TokenType.EOF,
+        r'^<$': TokenType.LT,
+        r'^>$': TokenType.GT,
+        r'^-$': TokenType.SUBSTRACT,
+        r'^/$': TokenType.DIVIDE,
+        r'^\*$': TokenType.MULTIPLICATION,
+    }
+
+    def __init__(self, source: str) -> None:
+        self._source = source
+        self._character = ''
+        self._read_position = 0
+        self._position = 0
+        self._read_character()
+
+    def next_token(self) -> Token:
+        while match(r'^\s$', self._character):
+            self._read_character()
+
+        token = None
+        for regex, token_type in self._TOKENS.items():
+            if match(regex, self._character):
+                token = Token(token_type, self._character)
+                break
+
+        if match(r'^=$', self._character):
+            if self._peek_character() == '=':
+                token = self._two_character_token(TokenType.EQ)
+            else:
+                token = Token(TokenType.ASSIGN, self._character)
+        elif match(r'^!$', self._character):
+            if self._peek_character() == '=':
+                token = self._two_character_token(TokenType.NOT_EQ)
+            else:
+                token = Token(TokenType.DIFFERENT, self._character)
+        elif match(r'^"$', self._character):
+            self._read_character()
+            start = self._position
+            while self._character != '"' and self._read_position <= len(self._source):
+                self._read_character()
+            literal = self._source[start:self._position]
+            self._read_character()
+
+            return Token(TokenType.STRING, literal)
+
+        if token is None:
+            token = Token(TokenType.ILLEGAL, self._character)
+
+        if self._is_letter(self._character):
+            start = self._position
+            while self._is_letter(self._character) or self._is_number(self._character):
+                self._read_character()
+            literal = self._source[start:self._position]
+
+            return Token(lookup_token_type(literal), literal)
+        elif self._is_number(self._character):
+            start = self._position
+            while self._is_number(self._character):
+                self._read_character()
+
+            return Token(TokenType.INT, self._source[start:self._position])
+
+        self._read_character()
+
+        return token
+
+    def _is_letter(self, character: str) -> bool:
+        return bool(match(r'^[a-záéíóúA-ZÁÉÍÓÚñÑ_]$', character))
+
+    def _is_number(self, character: str) -> bool:
+        return bool(match(r'^\d$', character))
+
+    def _two_character_token(self, token_type: TokenType) -> Token:
+        prefix = self._character
+        self._read_character()
+
+        return Token(token_type, f'{prefix}{self._character}')
+
+    def _peek_character(self) -> str:
+        if self._read_position >= len(self._source):
+            return ''
+
+        return self._source[self._read_position]
+
+    def _read_character(self) -> None:
+        if self._read_position >= len(self._source):
+            self._character = ''
+        else:
+            self._character = self._source[self._read_position]
+
+        self._position = self._read_position
+        self._read_position += 1
+
+
+def _lex(lexer_class: Callable, source: str) -> List[Token]:
+    lexer = lexer_class(source)
+    tokens: List[Token] = []
+
+    while (token := lexer.next_token()).token_type != TokenType.EOF:
+        tokens.append(token)
+
+    return tokens
+
+
+def _measure(lexer_class: Callable, source: str, repeat: int) -> Tuple[float, List[Token]]:
+    best = float('inf')
+    tokens: List[Token] = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        tokens = _lex(lexer_class, source)
+        best = min(best, perf_counter() - start)
+
+    return best, tokens
+
+
+def _measure_tokenize(source: str, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        begin = perf_counter()
+        tokenize(source)
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def _traced_size(build: Callable[[], object]) -> int:
+    start()
+    result = build()
+    size, _ = get_traced_memory()
+    stop()
+    del result
+
+    return size
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Throughput of the LPM lexer in tokens/sec.')
+    arguments.add_argument('--statements', type=int, default=20000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    source = generate_program(options.statements)
+    print(f'source: {len(source)} characters, {options.statements} statements')
+
+    elapsed, tokens = _measure(Lexer, source, options.repeat)
+    print(f'table-driven lexer: {len(tokens) / elapsed:>12,.0f} tokens/sec ({elapsed:.3f}s)')
+
+    buffer_elapsed = _measure_tokenize(source, options.repeat)
+    print(f'tokenize() buffer:  {len(tokens) / buffer_elapsed:>12,.0f} tokens/sec ({buffer_elapsed:.3f}s)')
+
+    assert list(tokenize(source))[:-1] == tokens, 'token buffer differs'
+    list_size = _traced_size(lambda: _lex(Lexer, source))
+    buffer_size = _traced_size(lambda: tokenize(source))
+    print(f'memory: List[Token] {list_size / len(tokens):.1f} bytes/token, '
+          f'TokenBuffer {buffer_size / len(tokens):.1f} bytes/token')
+
+    baseline_elapsed, baseline_tokens = _measure(RegexLexer, source, 1)
+    print(f'regex lexer:        {len(baseline_tokens) / baseline_elapsed:>12,.0f} tokens/sec ({baseline_elapsed:.3f}s)')
+
+    assert tokens == baseline_tokens, 'token streams differ'
+    print(f'speedup: {baseline_elapsed / elapsed:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+from argparse import ArgumentParser
+from gc import collect
+from time import perf_counter
+
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import Environment
+from lpm.parser import Parser
+from lpm.purity import DEFAULT_MEMO_SIZE
+
+# Naive doubly recursive fibonacci, exponential unless its calls are memoized.
+_SOURCE = '''
+    variable fib = procedimiento(n) { si (n < 2) { n } si_no { fib(n - 1) + fib(n - 2) } };
+    fib({n});
+'''
+
+
+def _time(n: int, memo_size: int, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        program = Parser(tokenize(_SOURCE.replace('{n}', str(n)))).parse_program()
+        collect()
+        begin = perf_counter()
+        evaluate(program, Environment(), memo_size)
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Recursive fibonacci with and without memoized calls.')
+    arguments.add_argument('--n', type=int, default=22)
+    arguments.add_argument('--memo-size', type=int, default=DEFAULT_MEMO_SIZE)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    plain = _time(options.n, 0, options.repeat)
+    memoized = _time(options.n, options.memo_size, options.repeat)
+
+    print(f'plain     {plain * 1000:>9.1f}ms')
+    print(f'memoized  {memoized * 1000:>9.1f}ms  {plain / memoized:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
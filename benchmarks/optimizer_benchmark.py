@@ -0,0 +1,65 @@
+from argparse import ArgumentParser
+from gc import collect
+from time import perf_counter
+
+from lpm.ast import Program
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import Environment
+from lpm.optimizer import optimize
+from lpm.parser import Parser
+
+# A loop whose body is mostly constant arithmetic, branches on literals and
+# code after regresa, the way generated scripts tend to look.
+_SOURCE = '''
+    variable paso = procedimiento(n, total) {
+        si (n < 1) { regresa total; }
+        variable escala = 2 * (5 - 3) + 10 / 2;
+        variable limite = si (!falso) { 100 * 100 } si_no { 0 };
+        si (verdadero) { variable total = total + escala; }
+        si (1 > 2) { regresa -1; }
+        regresa paso(n - 1, total + limite - 10000);
+        total * 2;
+    };
+    paso({n}, 0);
+'''
+
+
+def _parse(n: int) -> Program:
+    return Parser(tokenize(_SOURCE.replace('{n}', str(n)))).parse_program()
+
+
+def _time(program: Program, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        collect()
+        begin = perf_counter()
+        evaluate(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Evaluation time with and without the AST optimization pass.')
+    arguments.add_argument('--iterations', type=int, default=20000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    plain = _time(_parse(options.iterations), options.repeat)
+
+    program = _parse(options.iterations)
+    begin = perf_counter()
+    report = optimize(program)
+    optimize_time = perf_counter() - begin
+    optimized = _time(program, options.repeat)
+
+    print(f'{report.folded} folded, {report.pruned} pruned, {report.removed} removed '
+          f'in {optimize_time * 1000:.2f}ms')
+    print(f'plain     {plain * 1000:>9.1f}ms')
+    print(f'optimized {optimized * 1000:>9.1f}ms  {plain / optimized:>5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
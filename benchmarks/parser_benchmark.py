@@ -0,0 +1,62 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import (
+    Callable,
+    List,
+)
+
+from benchmarks.corpus import generate_program
+from lpm.lexer import (
+    TokenBuffer,
+    tokenize,
+)
+from lpm.parser import Parser
+
+
+def _nested(depth: int) -> str:
+    return '-(' * depth + '1' + ')' * depth + ';'
+
+
+def _nested_calls(depth: int) -> str:
+    return 'f(' * depth + '1' + ')' * depth + ';'
+
+
+def _right_chain(depth: int) -> str:
+    return ''.join(f'{idx} + (' for idx in range(depth)) + '1' + ')' * depth + ';'
+
+
+def _time(tokens: TokenBuffer, iterative: bool, repeat: int) -> str:
+    best = float('inf')
+
+    for _ in range(repeat):
+        begin = perf_counter()
+        try:
+            Parser(tokens, iterative=iterative).parse_program()
+        except RecursionError:
+            return f'{"RecursionError":>12}'
+        best = min(best, perf_counter() - begin)
+
+    return f'{best * 1000:>10.1f}ms'
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Recursive vs iterative Pratt parsing.')
+    arguments.add_argument('--statements', type=int, default=20000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    print(f'{"input":<24} {"recursive":>12} {"iterative":>12}')
+
+    tokens = tokenize(generate_program(options.statements))
+    print(f'{"corpus":<24} {_time(tokens, False, options.repeat)} {_time(tokens, True, options.repeat)}')
+
+    shapes: List[Callable[[int], str]] = [_nested, _nested_calls, _right_chain]
+    for shape in shapes:
+        for depth in [100, 1000, 10000, 100000]:
+            tokens = tokenize(shape(depth))
+            name = f'{shape.__name__.lstrip("_")} {depth}'
+            print(f'{name:<24} {_time(tokens, False, options.repeat)} {_time(tokens, True, options.repeat)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from gc import collect
+from time import perf_counter
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+)
+
+import lpm.evaluator as evaluator
+from lpm.ast import (
+    Infix,
+    Program,
+)
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Object,
+)
+from lpm.parser import Parser
+
+# Arithmetic-heavy recursion: comparisons, additions and multiplications of
+# integers on every call. k is a global, so the procedimientos are not
+# memoized.
+_PROGRAMS: Dict[str, str] = {
+    'fibonacci': '''
+        variable k = 0;
+        variable fib = procedimiento(n) { si (n < 2) { n + k } si_no { fib(n - 1) + fib(n - 2) } };
+        fib({n});
+    ''',
+    'polynomial': '''
+        variable k = 0;
+        variable suma = procedimiento(n, total) {
+            si (n < 1) { regresa total; }
+            suma(n - 1, total + (n * n - 3 * n + 7) / 2 + k)
+        };
+        suma({n}, 0);
+    ''',
+}
+
+# Runs the evaluator as it was before Infix nodes specialized themselves.
+@contextmanager
+def _generic() -> Iterator[None]:
+    saved = evaluator._quicken
+
+    def quicken(node: Infix, left: Object, right: Object) -> Object:
+        return evaluator._evaluate_infix_expression(node.operator, left, right)
+
+    evaluator._quicken = quicken
+    try:
+        yield
+    finally:
+        evaluator._quicken = saved
+
+
+def _time(run: Callable[[Program, Environment], object], source: str, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        program = Parser(tokenize(source)).parse_program()
+        collect()
+        begin = perf_counter()
+        run(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Integer arithmetic with and without quickened Infix nodes.')
+    arguments.add_argument('--fibonacci', type=int, default=20)
+    arguments.add_argument('--iterations', type=int, default=50000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+    sizes = {'fibonacci': options.fibonacci, 'polynomial': options.iterations}
+
+    print(f'{"program":<12} {"engine":<10} {"generic":>10} {"quickened":>10}')
+    for name, template in _PROGRAMS.items():
+        source = template.replace('{n}', str(sizes[name]))
+
+        for engine, run in (('evaluator', evaluator.evaluate), ('iterative', evaluator.evaluate_iterative)):
+            with _generic():
+                generic = _time(run, source, options.repeat)
+            quickened = _time(run, source, options.repeat)
+
+            print(f'{name:<12} {engine:<10} {generic * 1000:>8.1f}ms {quickened * 1000:>8.1f}ms'
+                  f'  {generic / quickened:>5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import (
+    List,
+    Tuple,
+)
+
+from benchmarks.corpus import generate_program
+from lpm.lexer import tokenize
+from lpm.parser import Parser
+
+
+# Breaks every nth top-level let or si statement with a single syntax error:
+# a missing '=' or a missing ')' before the consequence block.
+def _inject_errors(source: str, every: int) -> Tuple[str, int]:
+    lines: List[str] = []
+    candidates = 0
+    injected = 0
+
+    for line in source.split('\n'):
+        if line.startswith('variable ') or line.startswith('si ('):
+            candidates += 1
+            if candidates % every == 0:
+                if line.startswith('variable '):
+                    line = line.replace(' = ', ' ', 1)
+                else:
+                    line = line.replace(') {', ' {', 1)
+                injected += 1
+
+        lines.append(line)
+
+    return '\n'.join(lines), injected
+
+
+def _parse(source: str) -> Tuple[float, int]:
+    tokens = tokenize(source)
+
+    begin = perf_counter()
+    parser = Parser(tokens)
+    parser.parse_program()
+
+    return perf_counter() - begin, len(parser.errors)
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Error recovery on large sources with injected syntax errors.')
+    arguments.add_argument('--statements', type=int, default=100000)
+    arguments.add_argument('--every', type=int, default=50)
+    options = arguments.parse_args()
+
+    clean = generate_program(options.statements)
+    broken, injected = _inject_errors(clean, options.every)
+
+    clean_time, clean_errors = _parse(clean)
+    broken_time, broken_errors = _parse(broken)
+
+    print(f'source: {len(broken.encode("utf-8")) / 2 ** 20:.1f} MiB, {injected} injected errors')
+    print(f'clean   {clean_time * 1000:>9.1f}ms  {clean_errors:>7} errors')
+    print(f'broken  {broken_time * 1000:>9.1f}ms  {broken_errors:>7} errors')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+from typing import (
+    Callable,
+    Optional,
+)
+
+from lpm.ast import Program
+from lpm.evaluator import (
+    evaluate,
+    evaluate_iterative,
+)
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Object,
+)
+from lpm.parser import Parser
+
+# Non-tail recursion n calls deep, so every call stays in progress until the
+# deepest one returns.
+_SOURCE = '''
+    variable cuenta = procedimiento(n) { si (n == 0) { 0 } si_no { 1 + cuenta(n - 1) } };
+    cuenta({n});
+'''
+
+
+def _run(engine: Callable[[Program, Environment], Optional[Object]], program: Program) -> str:
+    try:
+        evaluated = engine(program, Environment())
+    except RecursionError:
+        return 'RecursionError'
+
+    return evaluated.inspect() if evaluated is not None else ''
+
+
+def _measure(name: str, engine: Callable[[Program, Environment], Optional[Object]], depth: int) -> None:
+    program = Parser(tokenize(_SOURCE.replace('{n}', str(depth)))).parse_program()
+
+    begin = perf_counter()
+    result = _run(engine, program)
+    elapsed = perf_counter() - begin
+
+    start()
+    _run(engine, program)
+    _, peak = get_traced_memory()
+    stop()
+
+    frames = f'{(depth + 1) / elapsed:>12,.0f} frames/sec' if result != 'RecursionError' else f'{"":>23}'
+    print(f'{name:<10} depth {depth:>8} {elapsed * 1000:>10.1f}ms {frames} {peak / 2 ** 20:>8.1f} MiB peak  {result}')
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Deep non-tail recursion: recursive vs explicit-stack evaluator.')
+    arguments.add_argument('--depths', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    options = arguments.parse_args()
+
+    for depth in options.depths:
+        _measure('recursive', evaluate, depth)
+        _measure('iterative', lambda program, env: evaluate_iterative(program, env, max_depth=depth + 1), depth)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import (
+    Callable,
+    List,
+)
+
+from lpm.evaluator import evaluate
+from lpm.lexer import Lexer
+from lpm.object import Environment
+from lpm.parser import Parser
+from lpm.repl import Session
+
+
+def _line(idx: int) -> str:
+    if idx == 0:
+        return 'variable sucesor = procedimiento(x) { regresa x + 1; }; variable v0 = 0;'
+
+    return f'variable v{idx} = sucesor(v{idx - 1});'
+
+
+# What start_repl used to do: re-run the whole history in a fresh
+# Environment for every new line.
+def _replay_runner() -> Callable[[str], None]:
+    scanned: List[str] = []
+
+    def run(source: str) -> None:
+        scanned.append(source)
+        evaluate(Parser(Lexer(' '.join(scanned))).parse_program(), Environment())
+
+    return run
+
+
+def _session_runner() -> Callable[[str], None]:
+    session = Session()
+
+    def run(source: str) -> None:
+        session.execute(source)
+
+    return run
+
+
+def _report(name: str, run: Callable[[str], None], lines: int, window: int) -> None:
+    latencies: List[float] = []
+
+    for idx in range(lines):
+        source = _line(idx)
+        begin = perf_counter()
+        run(source)
+        latencies.append(perf_counter() - begin)
+
+    first = sum(latencies[:window]) / window
+    last = sum(latencies[-window:]) / window
+    print(f'{name:<8} {lines:>7} lines  first {window}: {first * 1e6:>9.1f}us/line  '
+          f'last {window}: {last * 1e6:>9.1f}us/line')
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Per-line latency of the REPL over long sessions.')
+    arguments.add_argument('--lines', type=int, default=5000)
+    arguments.add_argument('--replay-lines', type=int, default=300)
+    arguments.add_argument('--window', type=int, default=100)
+    options = arguments.parse_args()
+
+    _report('session', _session_runner(), options.lines, options.window)
+    _report('replay', _replay_runner(), options.replay_lines, options.window)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+from argparse import ArgumentParser
+from gc import collect
+from time import perf_counter
+from typing import Callable
+
+from lpm.ast import Program
+from lpm.evaluator import (
+    _evaluate_program,
+    evaluate,
+)
+from lpm.lexer import tokenize
+from lpm.object import Environment
+from lpm.parser import Parser
+
+# The innermost procedimiento reads variables declared one to four levels out,
+# plus a builtin, on every iteration.
+_SOURCE = '''
+    variable nivel1 = procedimiento(a) {
+        procedimiento(b) {
+            procedimiento(c) {
+                procedimiento(d) {
+                    variable bucle = procedimiento(n, total) {
+                        si (n < 1) { regresa total; }
+                        bucle(n - 1, total + a + b + c + d + longitud("xy"))
+                    };
+                    bucle({n}, 0)
+                }
+            }
+        }
+    };
+    nivel1(1)(2)(3)(4);
+'''
+
+
+def _time(run: Callable[[Program, Environment], object], n: int, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        program = Parser(tokenize(_SOURCE.replace('{n}', str(n)))).parse_program()
+        collect()
+        begin = perf_counter()
+        run(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Identifier lookup with and without the resolver pass.')
+    arguments.add_argument('--iterations', type=int, default=50000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    # _evaluate_program skips the resolver, so every identifier is looked up
+    # by name through the chain of environments.
+    by_name = _time(_evaluate_program, options.iterations, options.repeat)
+    resolved = _time(evaluate, options.iterations, options.repeat)
+
+    print(f'by name   {by_name * 1000:>9.1f}ms')
+    print(f'resolved  {resolved * 1000:>9.1f}ms  {by_name / resolved:>5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
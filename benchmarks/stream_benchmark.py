@@ -0,0 +1,90 @@
+from argparse import ArgumentParser
+from mmap import (
+    mmap,
+    ACCESS_READ,
+)
+from os import (
+    path,
+    remove,
+)
+from tempfile import mkstemp
+from time import perf_counter
+from tracemalloc import (
+    get_traced_memory,
+    start,
+    stop,
+)
+from typing import (
+    Callable,
+    Iterator,
+    Tuple,
+)
+
+from benchmarks.corpus import generate_program
+from lpm.lexer import (
+    Lexer,
+    StreamLexer,
+)
+from lpm.token import (
+    Token,
+    TokenType,
+)
+
+
+def _in_memory(file_path: str) -> Iterator[Token]:
+    with open(file_path, encoding='utf-8', newline='') as stream:
+        lexer = Lexer(stream.read())
+
+    while (token := lexer.next_token()).token_type != TokenType.EOF:
+        yield token
+
+    yield token
+
+
+def _streamed(file_path: str) -> Iterator[Token]:
+    yield from StreamLexer(file_path)
+
+
+def _memory_mapped(file_path: str) -> Iterator[Token]:
+    with open(file_path, 'rb') as stream:
+        with mmap(stream.fileno(), 0, access=ACCESS_READ) as mapped:
+            yield from StreamLexer(mapped)
+
+
+def _measure(tokens: Callable[[str], Iterator[Token]], file_path: str) -> Tuple[int, float, int]:
+    start()
+    begin = perf_counter()
+
+    count = sum(1 for _ in tokens(file_path))
+
+    elapsed = perf_counter() - begin
+    _, peak = get_traced_memory()
+    stop()
+
+    return count, elapsed, peak
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Peak memory of in-memory vs streaming lexing.')
+    arguments.add_argument('--statements', type=int, default=100000)
+    options = arguments.parse_args()
+
+    descriptor, file_path = mkstemp(suffix='.lpm')
+    try:
+        with open(descriptor, 'w', encoding='utf-8') as stream:
+            stream.write(generate_program(options.statements))
+
+        print(f'source: {path.getsize(file_path) / 2 ** 20:.1f} MiB')
+
+        for name, tokens in [('in-memory', _in_memory),
+                             ('streamed', _streamed),
+                             ('mmap', _memory_mapped)]:
+            count, elapsed, peak = _measure(tokens, file_path)
+            print(f'{name:<10} {count:>10} tokens  {count / elapsed:>10,.0f} tokens/sec  '
+                  f'peak {peak / 2 ** 20:>7.2f} MiB')
+    finally:
+        remove(file_path)
+
+
+if __name__ == '__main__':
+    main()
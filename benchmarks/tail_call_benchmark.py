@@ -0,0 +1,56 @@
+from argparse import ArgumentParser
+from time import perf_counter
+
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import Environment
+from lpm.parser import Parser
+
+# A counting loop written the only way the language allows, as recursion:
+# through regresa, and as the last expression of a si block.
+_LOOPS = {
+    'regresa': '''
+        variable cuenta = procedimiento(n, total) {
+            si (n == 0) { regresa total; }
+            regresa cuenta(n - 1, total + 2);
+        };
+        cuenta({n}, 0);
+    ''',
+    'last expression': '''
+        variable cuenta = procedimiento(n, total) {
+            si (n == 0) { total } si_no { cuenta(n - 1, total + 2) }
+        };
+        cuenta({n}, 0);
+    ''',
+    'not a tail call': '''
+        variable cuenta = procedimiento(n) {
+            si (n == 0) { regresa 0; }
+            regresa 2 + cuenta(n - 1);
+        };
+        cuenta({n});
+    ''',
+}
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Tail-recursive loops in the evaluator.')
+    arguments.add_argument('--iterations', type=int, nargs='+', default=[1000, 100000, 1000000])
+    options = arguments.parse_args()
+
+    for name, source in _LOOPS.items():
+        for iterations in options.iterations:
+            program = Parser(tokenize(source.replace('{n}', str(iterations)))).parse_program()
+
+            begin = perf_counter()
+            try:
+                evaluated = evaluate(program, Environment())
+                result = evaluated.inspect() if evaluated is not None else ''
+            except RecursionError:
+                result = 'RecursionError'
+            elapsed = perf_counter() - begin
+
+            print(f'{name:<16} {iterations:>9} iterations {elapsed * 1000:>10.1f}ms  {result}')
+
+
+if __name__ == '__main__':
+    main()
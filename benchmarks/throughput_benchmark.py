@@ -0,0 +1,89 @@
+from argparse import ArgumentParser
+from datetime import (
+    datetime,
+    timezone,
+)
+from json import dumps
+from platform import python_version
+from subprocess import (
+    CalledProcessError,
+    check_output,
+    DEVNULL,
+)
+from time import perf_counter
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from benchmarks.corpus import generate_program
+from lpm.lexer import (
+    Lexer,
+    TokenBuffer,
+    tokenize,
+)
+from lpm.parser import Parser
+
+
+def _revision() -> Optional[str]:
+    try:
+        return check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=DEVNULL, text=True).strip()
+    except (CalledProcessError, OSError):
+        return None
+
+
+def _statements_per_second(source: Callable[[], Union[Lexer, TokenBuffer]],
+                           iterative: bool,
+                           repeat: int) -> float:
+    best = float('inf')
+    statements = 0
+
+    for _ in range(repeat):
+        lexer = source()
+        begin = perf_counter()
+        statements = len(Parser(lexer, iterative=iterative).parse_program().statements)
+        best = min(best, perf_counter() - begin)
+
+    return statements / best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Parsing throughput in statements per second.')
+    arguments.add_argument('--statements', type=int, default=50000)
+    arguments.add_argument('--repeat', type=int, default=5)
+    arguments.add_argument('--results', help='append the measurements as a JSON line to this file')
+    options = arguments.parse_args()
+
+    source = generate_program(options.statements)
+    tokens = tokenize(source)
+
+    sources: List[Tuple[str, Callable[[], Union[Lexer, TokenBuffer]]]] = [
+        ('lexer', lambda: Lexer(source)),
+        ('token_buffer', lambda: tokens),
+    ]
+    results: Dict[str, float] = {}
+    for name, lexer in sources:
+        for mode, iterative in [('recursive', False), ('iterative', True)]:
+            rate = _statements_per_second(lexer, iterative, options.repeat)
+            results[f'{name}/{mode}'] = round(rate)
+            print(f'{name + "/" + mode:<24} {rate:>12,.0f} statements/sec')
+
+    if options.results:
+        record = {
+            'benchmark': 'parser_throughput',
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'revision': _revision(),
+            'python': python_version(),
+            'statements': options.statements,
+            'results': results,
+        }
+        with open(options.results, 'a', encoding='utf-8') as stream:
+            stream.write(dumps(record) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from gc import collect
+from time import perf_counter
+from typing import (
+    Dict,
+    Iterator,
+)
+
+import lpm.evaluator as evaluator
+from benchmarks.corpus import generate_program
+from lpm.lexer import tokenize
+from lpm.object import Environment
+from lpm.parser import Parser
+from lpm.resolver import resolve
+from lpm.typecheck import (
+    check,
+    TypeReport,
+)
+
+# Monomorphic procedimientos: every operation sees integers, or strings, only.
+# They are evaluated without memoization, which would otherwise skip most
+# calls.
+_PROGRAMS: Dict[str, str] = {
+    'fibonacci': '''
+        variable fib = procedimiento(n) { si (n < 2) { n } si_no { fib(n - 1) + fib(n - 2) } };
+        fib({n});
+    ''',
+    'polynomial': '''
+        variable suma = procedimiento(n, total) {
+            si (n < 1) { regresa total; }
+            suma(n - 1, total + (n * n - 3 * n + 7) / 2)
+        };
+        suma({n}, 0);
+    ''',
+    'strings': '''
+        variable repite = procedimiento(s, n) {
+            si (n < 1) { regresa s == ""; }
+            repite(s + "a" + "" + "", n - 1)
+        };
+        repite("", {n});
+    ''',
+}
+
+# Runs the evaluator as if lpm.typecheck had not inferred any type.
+@contextmanager
+def _unspecialized() -> Iterator[None]:
+    saved = evaluator._specialize
+
+    def specialize(report: TypeReport) -> None:
+        pass
+
+    evaluator._specialize = specialize
+    try:
+        yield
+    finally:
+        evaluator._specialize = saved
+
+
+def _time_evaluation(source: str, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        program = Parser(tokenize(source)).parse_program()
+        collect()
+        begin = perf_counter()
+        evaluator.evaluate(program, Environment(), 0)
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def _time_check(source: str, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        program = Parser(tokenize(source)).parse_program()
+        resolve(program)
+        collect()
+        begin = perf_counter()
+        check(program)
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Type inference time, and evaluation with and without its results.')
+    arguments.add_argument('--lines', type=int, default=10000)
+    arguments.add_argument('--fibonacci', type=int, default=20)
+    arguments.add_argument('--iterations', type=int, default=50000)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    # Statements of the corpus take a line and a half on average.
+    source = generate_program(options.lines * 2 // 3)
+
+    parsing = float('inf')
+    for _ in range(options.repeat):
+        begin = perf_counter()
+        resolve(Parser(tokenize(source)).parse_program())
+        parsing = min(parsing, perf_counter() - begin)
+    checking = _time_check(source, options.repeat)
+    lines = source.count('\n')
+    print(f'{lines} lines: parse and resolve {parsing * 1000:.1f}ms, check {checking * 1000:.1f}ms')
+    print()
+
+    sizes = {'fibonacci': options.fibonacci, 'polynomial': options.iterations, 'strings': options.iterations}
+    print(f'{"program":<12} {"unchecked":>10} {"checked":>10}')
+    for name, template in _PROGRAMS.items():
+        program_source = template.replace('{n}', str(sizes[name]))
+
+        with _unspecialized():
+            unchecked = _time_evaluation(program_source, options.repeat)
+        checked = _time_evaluation(program_source, options.repeat)
+
+        print(f'{name:<12} {unchecked * 1000:>8.1f}ms {checked * 1000:>8.1f}ms  {unchecked / checked:>5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
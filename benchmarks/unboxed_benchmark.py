@@ -0,0 +1,106 @@
+from argparse import ArgumentParser
+from gc import collect
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+)
+
+from lpm.ast import Program
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Integer,
+    Object,
+    String,
+)
+from lpm.parser import Parser
+from lpm.unboxed import execute
+
+Engine = Callable[[Program, Environment], Optional[Object]]
+
+# Loops that do little besides integer arithmetic, comparisons and string
+# concatenation, so nearly every step makes a new value.
+_PROGRAMS: Dict[str, str] = {
+    'arithmetic': '''
+        variable suma = procedimiento(n, total) {
+            si (n < 1) { regresa total; }
+            suma(n - 1, total + (n * n - n / 2) * 3 - (n + 1) * (n - 1))
+        };
+        suma({n}, 0);
+    ''',
+    'fibonacci': '''
+        variable fib = procedimiento(n) { si (n < 2) { n } si_no { fib(n - 1) + fib(n - 2) } };
+        fib({depth});
+    ''',
+    'strings': '''
+        variable repite = procedimiento(n, texto) {
+            si (n == 0) { regresa longitud(texto); }
+            repite(n - 1, texto + "ab" + "")
+        };
+        repite({n}, "");
+    ''',
+}
+
+
+def _time(engine: Engine, program: Program, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        collect()
+        begin = perf_counter()
+        engine(program, Environment())
+        best = min(best, perf_counter() - begin)
+
+    return best
+
+
+# Counts the Integer and String objects created during one run.
+def _boxes(engine: Engine, program: Program) -> int:
+    created = 0
+    initializers: Dict[type, Any] = {Integer: Integer.__init__, String: String.__init__}
+
+    def counting(cls: type) -> Callable[..., None]:
+        initializer = initializers[cls]
+
+        def __init__(self: Any, value: Any) -> None:
+            nonlocal created
+            created += 1
+            initializer(self, value)
+
+        return __init__
+
+    for cls in initializers:
+        setattr(cls, '__init__', counting(cls))
+    try:
+        engine(program, Environment())
+    finally:
+        for cls, initializer in initializers.items():
+            setattr(cls, '__init__', initializer)
+
+    return created
+
+
+def main() -> None:
+    arguments = ArgumentParser(description='Boxed evaluator vs the unboxed mode on arithmetic-heavy programs.')
+    arguments.add_argument('--n', type=int, default=20000)
+    arguments.add_argument('--depth', type=int, default=20)
+    arguments.add_argument('--repeat', type=int, default=3)
+    options = arguments.parse_args()
+
+    print(f'{"program":<12}{"boxed":>12}{"objects":>10}{"unboxed":>12}{"objects":>10}{"speedup":>9}')
+    for name, source in _PROGRAMS.items():
+        source = source.replace('{n}', str(options.n)).replace('{depth}', str(options.depth))
+        program = Parser(tokenize(source)).parse_program()
+
+        boxed = _time(evaluate, program, options.repeat)
+        unboxed = _time(execute, program, options.repeat)
+        print(f'{name:<12}{boxed * 1000:>10.1f}ms{_boxes(evaluate, program):>10}'
+              f'{unboxed * 1000:>10.1f}ms{_boxes(execute, program):>10}{boxed / unboxed:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,48 +2,68 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from lpm.token import Token
+from lpm.token import (
+    Token,
+    TokenType,
+)
 from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
     List,
-    Optional
+    Optional,
+    Tuple,
+    Union,
 )
 
+# Nodes keep only the source offset of the token that starts them (-1 when
+# unknown); the token itself is rebuilt from the node's own fields, so the
+# constructors still accept it but do not store it.
+
+
 class ASTNode(ABC):
+    __slots__ = ()
 
+    @property
     @abstractmethod
-    def token_literal(self) -> str:
+    def token(self) -> Token:
         pass
-    
+
+    def token_literal(self) -> str:
+        return self.token.literal
+
     @abstractmethod
     def __str__(self) -> str:
         pass
 
 
 class Statement(ASTNode):
-    def __init__(self, token: Token) -> None:
-        self.token = token
+    __slots__ = ('start',)
 
-    def token_literal(self) -> str:
-        return self.token.literal
+    def __init__(self, token: Token, start: int = -1) -> None:
+        self.start = start
 
 
 class Expression(ASTNode):
-    def __init__(self, token: Token) -> None:
-        self.token = token
+    __slots__ = ('start',)
 
-    def token_literal(self) -> str:
-        return self.token.literal
+    def __init__(self, token: Token, start: int = -1) -> None:
+        self.start = start
 
 
 class Program(ASTNode):
+    __slots__ = ('statements',)
+
     def __init__(self, statements: List[Statement]) -> None:
         self.statements = statements
 
-    def token_literal(self) -> str:
+    @property
+    def token(self) -> Token:
         if len(self.statements) > 0:
-            return self.statements[0].token_literal()
-        
-        return ''
+            return self.statements[0].token
+
+        return Token(TokenType.EOF, '')
 
     def __str__(self) -> str:
         output: List[str] = []
@@ -54,111 +74,269 @@ class Program(ASTNode):
 
 
 class Identifier(Expression):
-    def __init__(self, token: Token, value: str) -> None:
-        super().__init__(token)
+    __slots__ = ('value', 'depth', 'slot')
+
+    # depth and slot are filled in by lpm.resolver; depth stays None for the
+    # identifiers it has not seen.
+    def __init__(self, token: Token, value: str, start: int = -1) -> None:
+        super().__init__(token, start)
         self.value = value
+        self.depth: Optional[int] = None
+        self.slot: int = -1
+
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.IDENT, self.value)
 
     def __str__(self) -> str:
         return self.value
 
 
 class LetStatement(Statement):
-    def __init__(self, token: Token, name: Optional[Identifier] = None, value: Optional[Expression] = None) -> None:
-        super().__init__(token)
-        
+    __slots__ = ('name', 'value', 'depth', 'slot')
+
+    def __init__(self,
+                 token: Token,
+                 name: Optional[Identifier] = None,
+                 value: Optional[Expression] = None,
+                 start: int = -1) -> None:
+        super().__init__(token, start)
+
         self.name = name
         self.value = value
+        self.depth: Optional[int] = None
+        self.slot: int = -1
+
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.LET, 'variable')
 
     def __str__(self) -> str:
         return f'{self.token_literal()} {str(self.name)} = {str(self.value)};'
 
 
 class ReturnStatement(Statement):
-    def __init__(self, token: Token, return_value: Optional[Expression] = None) -> None:
-        super().__init__(token)
+    __slots__ = ('return_value',)
+
+    def __init__(self, token: Token, return_value: Optional[Expression] = None, start: int = -1) -> None:
+        super().__init__(token, start)
         self.return_value = return_value
 
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.RETURN, 'regresa')
+
     def __str__(self) -> str:
         return f'{self.token_literal()} {str(self.return_value)};'
 
 
 class ExpressionStatement(Statement):
+    __slots__ = ('parenthesized', 'expression')
 
-    def __init__(self, token: Token, expression: Optional[Expression] = None) -> None:
-        super().__init__(token)
+    # The statement starts either with a parenthesis, which no node keeps, or
+    # with the first token of its expression.
+    def __init__(self, token: Token, expression: Optional[Expression] = None, start: int = -1) -> None:
+        super().__init__(token, start)
+        self.parenthesized = token.token_type == TokenType.LPAREN
         self.expression = expression
 
+    @property
+    def token(self) -> Token:
+        if self.parenthesized:
+            return Token(TokenType.LPAREN, '(')
+
+        expression = self.expression
+        while True:
+            if type(expression) == Infix:
+                expression = cast(Infix, expression).left
+            elif type(expression) == Call:
+                expression = cast(Call, expression).function
+            elif expression is None:
+                return Token(TokenType.ILLEGAL, '')
+            else:
+                return expression.token
+
     def __str__(self) -> str:
         return str(self.expression)
 
-        
+
 class Integer(Expression):
-    def __init__(self, token: Token, value: Optional[int] = None) -> None:
-        super().__init__(token)
+    __slots__ = ('literal', 'value', 'constant')
+
+    # constant is the runtime object for the literal, made by the evaluator
+    # the first time it evaluates the node. literal is the spelling of the
+    # number when it is not the usual one, as with leading zeros.
+    def __init__(self, token: Token, value: Optional[int] = None, start: int = -1) -> None:
+        super().__init__(token, start)
+        self.literal = token.literal if value is None or str(value) != token.literal else None
         self.value = value
+        self.constant: Optional[Any] = None
+
+    @property
+    def token(self) -> Token:
+        if self.literal is None:
+            return Token(TokenType.INT, str(self.value))
+
+        return Token(TokenType.INT, self.literal)
 
     def __str__(self) -> str:
         return str(self.value)
 
 
 class Prefix(Expression):
-    
-    def __init__(self, token: Token, operator: str, right: Optional[Expression] = None) -> None:
-        super().__init__(token)
+    __slots__ = ('operator', 'right', 'static')
+
+    # static is the operation the evaluator applies without checking the
+    # operand, once lpm.typecheck has inferred its type.
+    def __init__(self, token: Token, operator: str, right: Optional[Expression] = None, start: int = -1) -> None:
+        super().__init__(token, start)
         self.operator = operator
         self.right = right
+        self.static: Optional[Any] = None
+
+    @property
+    def token(self) -> Token:
+        return _operator_token(self.operator)
 
     def __str__(self) -> str:
         return f'({self.operator}{str(self.right)})'
 
 
 class Infix(Expression):
+    __slots__ = ('left', 'operator', 'right', 'quick', 'generic', 'static')
 
+    # quick is the integer operation the evaluator specialized the node to
+    # after seeing it applied to two integers; generic is set once it has
+    # seen anything else while specialized, and stops it from specializing
+    # again. static is the operation it applies without checking the
+    # operands, once lpm.typecheck has inferred their types.
     def __init__(self,
                  token: Token,
                  left: Expression,
                  operator: str,
-                 right: Optional[Expression] = None) -> None:
-        super().__init__(token)
+                 right: Optional[Expression] = None,
+                 start: int = -1) -> None:
+        super().__init__(token, start)
         self.left = left
         self.operator = operator
         self.right = right
+        self.quick: Optional[Any] = None
+        self.generic = False
+        self.static: Optional[Any] = None
+
+    @property
+    def token(self) -> Token:
+        return _operator_token(self.operator)
 
     def __str__(self) -> str:
         return f'({str(self.left)} {self.operator} {str(self.right)})'
 
 
 class Boolean(Expression):
+    __slots__ = ('value',)
 
     def __init__(self,
                  token: Token,
-                 value: Optional[bool] = None) -> None:
-        super().__init__(token)
+                 value: Optional[bool] = None,
+                 start: int = -1) -> None:
+        super().__init__(token, start)
         self.value = value
 
+    @property
+    def token(self) -> Token:
+        if self.value:
+            return Token(TokenType.TRUE, 'verdadero')
+
+        return Token(TokenType.FALSE, 'falso')
+
     def __str__(self) -> str:
         return self.token_literal()
 
 
 class Block(Statement):
+    __slots__ = ('statements',)
 
-    def __init__(self, token: Token, statements: List[Statement]) -> None:
-        super().__init__(token)
+    def __init__(self, token: Token, statements: List[Statement], start: int = -1) -> None:
+        super().__init__(token, start)
         self.statements = statements
 
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.LBRACE, '{')
+
     def __str__(self) -> str:
         out: List[str] = [str(statement) for statement in self.statements]
 
         return ''.join(out)
 
+
+class LazyBlock(Statement):
+    __slots__ = ('end', 'first', 'last', '_parse', '_block', '_errors')
+
+    # A function body the parser only skimmed: first and last are the token
+    # buffer indexes of its braces and start/end its source span. The
+    # statements are parsed on first use with the parse callable the parser
+    # leaves here.
+    def __init__(self,
+                 token: Token,
+                 first: int,
+                 last: int,
+                 parse: Callable[[int, int], Tuple[Block, List[str]]],
+                 start: int = -1,
+                 end: int = -1) -> None:
+        super().__init__(token, start)
+        self.end = end
+        self.first = first
+        self.last = last
+        self._parse = parse
+        self._block: Optional[Block] = None
+        self._errors: List[str] = []
+
+    @property
+    def parsed(self) -> bool:
+        return self._block is not None
+
+    @property
+    def errors(self) -> List[str]:
+        self.parse()
+
+        return self._errors
+
+    @property
+    def statements(self) -> List[Statement]:
+        return self.parse().statements
+
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.LBRACE, '{')
+
+    def parse(self) -> Block:
+        if self._block is None:
+            self._block, self._errors = self._parse(self.first, self.last)
+
+        return self._block
+
+    def __str__(self) -> str:
+        return str(self.parse())
+
 class If(Expression):
+    __slots__ = ('condition', 'consequence', 'alternative')
 
-    def __init__(self, token: Token, condition: Optional[Expression] = None, consequence: Optional[Block] = None, alternative: Optional[Block] = None) -> None:
-        super().__init__(token)
+    def __init__(self,
+                 token: Token,
+                 condition: Optional[Expression] = None,
+                 consequence: Optional[Block] = None,
+                 alternative: Optional[Block] = None,
+                 start: int = -1) -> None:
+        super().__init__(token, start)
         self.condition = condition
         self.consequence = consequence
         self.alternative = alternative
 
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.IF, 'si')
+
     def __str__(self) -> str:
         out: str = f'si {str(self.condition)} {str(self.consequence)}'
 
@@ -169,14 +347,23 @@ class If(Expression):
 
 
 class Function(Expression):
+    __slots__ = ('parameters', 'body', 'slots', 'memo_size', 'types')
 
     def __init__(self,
                  token: Token,
                  parameters: List[Identifier] = [],
-                 body: Optional[Block] = None) -> None:
-        super().__init__(token)
+                 body: Optional[Union[Block, LazyBlock]] = None,
+                 start: int = -1) -> None:
+        super().__init__(token, start)
         self.parameters = parameters
         self.body = body
+        self.slots: Optional[Dict[str, int]] = None
+        self.memo_size = 0
+        self.types: Optional[Any] = None
+
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.FUNCTION, 'procedimiento')
 
     def __str__(self) -> str:
         param_list: List[str] = [str(parameter) for parameter in self.parameters]
@@ -187,14 +374,27 @@ class Function(Expression):
 
 
 class Call(Expression):
+    __slots__ = ('function', 'arguments', 'cache', 'expected', 'owner')
 
+    # cache is the lpm.callsite.CallSiteCache the evaluator gives the call
+    # the first time it evaluates it. expected is the class lpm.typecheck
+    # inferred for its result, and owner the lpm.typecheck.FunctionTypes
+    # that relies on it.
     def __init__(self,
                  token: Token,
                  function: Expression,
-                 arguments: Optional[List[Expression]] = None) -> None:
-        super().__init__(token)
+                 arguments: Optional[List[Expression]] = None,
+                 start: int = -1) -> None:
+        super().__init__(token, start)
         self.function = function
         self.arguments = arguments
+        self.cache: Optional[Any] = None
+        self.expected: Optional[Any] = None
+        self.owner: Optional[Any] = None
+
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.LPAREN, '(')
 
     def __str__(self) -> str:
         assert self.arguments is not None
@@ -205,12 +405,36 @@ class Call(Expression):
 
 
 class StringLiteral(Expression):
+    __slots__ = ('value', 'constant')
 
     def __init__(self,
                  token: Token,
-                 value: str) -> None:
-        super().__init__(token)
+                 value: str,
+                 start: int = -1) -> None:
+        super().__init__(token, start)
         self.value = value
+        self.constant: Optional[Any] = None
+
+    @property
+    def token(self) -> Token:
+        return Token(TokenType.STRING, self.value)
 
     def __str__(self) -> str:
-        return super().__str__()
\ No newline at end of file
+        return self.value
+
+
+_OPERATOR_TYPES = {
+    '==': TokenType.EQ,
+    '!=': TokenType.NOT_EQ,
+    '!': TokenType.DIFFERENT,
+    '+': TokenType.PLUS,
+    '-': TokenType.SUBSTRACT,
+    '*': TokenType.MULTIPLICATION,
+    '/': TokenType.DIVIDE,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+}
+
+
+def _operator_token(operator: str) -> Token:
+    return Token(_OPERATOR_TYPES.get(operator, TokenType.ILLEGAL), operator)
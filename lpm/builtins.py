@@ -1,6 +1,7 @@
 from typing import (
     cast,
     Dict,
+    FrozenSet,
 )
 
 from lpm.object import (
@@ -27,4 +28,7 @@ def longitud(*args: Object) -> Object:
 
 BUILTINS: Dict[str, Builtin] = {
     'longitud': Builtin(fn=longitud),
-}
\ No newline at end of file
+}
+# The builtins whose result only depends on their arguments and that change
+# nothing else, which memoized procedimientos may call.
+PURE_BUILTINS: FrozenSet[str] = frozenset({'longitud'})
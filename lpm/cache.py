@@ -0,0 +1,391 @@
+from gc import (
+    disable,
+    enable,
+    isenabled,
+)
+from hashlib import sha256
+from marshal import (
+    dumps,
+    loads,
+    version as marshal_version,
+)
+from os import (
+    fdopen,
+    listdir,
+    makedirs,
+    path,
+    remove,
+    replace,
+    stat,
+    utime,
+)
+from sys import version_info
+from tempfile import mkstemp
+from zlib import (
+    compress,
+    decompress,
+    error as ZlibError,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from lpm import __version__
+from lpm.ast import (
+    ASTNode,
+    Block,
+    Boolean,
+    Call,
+    ExpressionStatement,
+    Function,
+    Identifier,
+    If,
+    Infix,
+    Integer,
+    LetStatement,
+    Prefix,
+    Program,
+    ReturnStatement,
+    StringLiteral,
+)
+from lpm.lexer import Lexer
+from lpm.parser import Parser
+
+# Bump whenever the encoded layout below changes.
+CACHE_FORMAT = 3
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+
+_SUFFIX = '.lpmc'
+_MAGIC = b'LPMC'
+
+# Field kinds: a child node, a list of child nodes or a plain value.
+_NODE, _NODES, _VALUE = range(3)
+
+_NODE_FIELDS: List[Tuple[Type[ASTNode], Tuple[Tuple[str, int], ...]]] = [
+    (Program, (('statements', _NODES),)),
+    (LetStatement, (('name', _NODE), ('value', _NODE))),
+    (ReturnStatement, (('return_value', _NODE),)),
+    (ExpressionStatement, (('parenthesized', _VALUE), ('expression', _NODE))),
+    (Identifier, (('value', _VALUE),)),
+    (Integer, (('literal', _VALUE), ('value', _VALUE))),
+    (Prefix, (('operator', _VALUE), ('right', _NODE))),
+    (Infix, (('left', _NODE), ('operator', _VALUE), ('right', _NODE))),
+    (Boolean, (('value', _VALUE),)),
+    (Block, (('statements', _NODES),)),
+    (If, (('condition', _NODE), ('consequence', _NODE), ('alternative', _NODE))),
+    (Function, (('parameters', _NODES), ('body', _NODE))),
+    (Call, (('function', _NODE), ('arguments', _NODES))),
+    (StringLiteral, (('value', _VALUE),)),
+]
+_NODE_CODES: Dict[Type[ASTNode], int] = {node_type: code for code, (node_type, _) in enumerate(_NODE_FIELDS)}
+
+def encode(node: Optional[ASTNode]) -> Any:
+    if node is None:
+        return None
+
+    code = _NODE_CODES[type(node)]
+    data: List[Any] = [code, getattr(node, 'start', None)]
+
+    for field, kind in _NODE_FIELDS[code][1]:
+        value = getattr(node, field)
+        if kind == _NODE:
+            data.append(encode(value))
+        elif kind == _NODES and value is not None:
+            data.append([encode(item) for item in value])
+        else:
+            data.append(value)
+
+    return tuple(data)
+
+
+def decode(data: Any) -> Any:
+    if data is None:
+        return None
+
+    return _DECODERS[data[0]](data)
+
+
+def _decode_nodes(data: Any) -> Any:
+    if data is None:
+        return None
+
+    return [_DECODERS[item[0]](item) for item in data]
+
+
+def _decode_program(data: Any) -> Program:
+    node = Program.__new__(Program)
+    node.statements = _decode_nodes(data[2])
+    return node
+
+
+def _decode_let_statement(data: Any) -> LetStatement:
+    node = LetStatement.__new__(LetStatement)
+    node.start = data[1]
+    node.name = decode(data[2])
+    node.value = decode(data[3])
+    node.depth = None
+    node.slot = -1
+    return node
+
+
+def _decode_return_statement(data: Any) -> ReturnStatement:
+    node = ReturnStatement.__new__(ReturnStatement)
+    node.start = data[1]
+    node.return_value = decode(data[2])
+    return node
+
+
+def _decode_expression_statement(data: Any) -> ExpressionStatement:
+    node = ExpressionStatement.__new__(ExpressionStatement)
+    node.start = data[1]
+    node.parenthesized = data[2]
+    node.expression = decode(data[3])
+    return node
+
+
+def _decode_identifier(data: Any) -> Identifier:
+    node = Identifier.__new__(Identifier)
+    node.start = data[1]
+    node.value = data[2]
+    node.depth = None
+    node.slot = -1
+    return node
+
+
+def _decode_integer(data: Any) -> Integer:
+    node = Integer.__new__(Integer)
+    node.start = data[1]
+    node.literal = data[2]
+    node.value = data[3]
+    node.constant = None
+    return node
+
+
+def _decode_prefix(data: Any) -> Prefix:
+    node = Prefix.__new__(Prefix)
+    node.start = data[1]
+    node.operator = data[2]
+    node.right = decode(data[3])
+    node.static = None
+    return node
+
+
+def _decode_infix(data: Any) -> Infix:
+    node = Infix.__new__(Infix)
+    node.start = data[1]
+    node.left = decode(data[2])
+    node.operator = data[3]
+    node.right = decode(data[4])
+    node.quick = None
+    node.generic = False
+    node.static = None
+    return node
+
+
+def _decode_boolean(data: Any) -> Boolean:
+    node = Boolean.__new__(Boolean)
+    node.start = data[1]
+    node.value = data[2]
+    return node
+
+
+def _decode_block(data: Any) -> Block:
+    node = Block.__new__(Block)
+    node.start = data[1]
+    node.statements = _decode_nodes(data[2])
+    return node
+
+
+def _decode_if(data: Any) -> If:
+    node = If.__new__(If)
+    node.start = data[1]
+    node.condition = decode(data[2])
+    node.consequence = decode(data[3])
+    node.alternative = decode(data[4])
+    return node
+
+
+def _decode_function(data: Any) -> Function:
+    node = Function.__new__(Function)
+    node.start = data[1]
+    node.parameters = _decode_nodes(data[2])
+    node.body = decode(data[3])
+    node.slots = None
+    node.memo_size = 0
+    node.types = None
+    return node
+
+
+def _decode_call(data: Any) -> Call:
+    node = Call.__new__(Call)
+    node.start = data[1]
+    node.function = decode(data[2])
+    node.arguments = _decode_nodes(data[3])
+    node.cache = None
+    node.expected = None
+    node.owner = None
+    return node
+
+
+def _decode_string_literal(data: Any) -> StringLiteral:
+    node = StringLiteral.__new__(StringLiteral)
+    node.start = data[1]
+    node.value = data[2]
+    node.constant = None
+    return node
+
+
+# Indexed by the codes assigned in _NODE_FIELDS.
+_DECODERS: List[Callable[[Any], ASTNode]] = [
+    _decode_program,
+    _decode_let_statement,
+    _decode_return_statement,
+    _decode_expression_statement,
+    _decode_identifier,
+    _decode_integer,
+    _decode_prefix,
+    _decode_infix,
+    _decode_boolean,
+    _decode_block,
+    _decode_if,
+    _decode_function,
+    _decode_call,
+    _decode_string_literal,
+]
+
+
+class ParseCache:
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source: str) -> str:
+        digest = sha256()
+        digest.update(f'{__version__}:{CACHE_FORMAT}:{marshal_version}:{version_info[:2]}\0'.encode('utf-8'))
+        digest.update(source.encode('utf-8', 'surrogatepass'))
+
+        return digest.hexdigest()
+
+    def parse(self, source: str) -> Tuple[Program, List[str]]:
+        key = self.key(source)
+
+        program = self.load(key)
+        if program is not None:
+            self.hits += 1
+            return program, []
+
+        self.misses += 1
+        parser: Parser = Parser(Lexer(source))
+        program = parser.parse_program()
+
+        # Programs with errors are not cached so the errors are reported on
+        # every run.
+        if len(parser.errors) == 0:
+            self.store(key, program)
+
+        return program, parser.errors
+
+    def load(self, key: str) -> Optional[Program]:
+        file_path = self._path(key)
+
+        try:
+            with open(file_path, 'rb') as stream:
+                data = stream.read()
+        except OSError:
+            return None
+
+        try:
+            if not data.startswith(_MAGIC):
+                raise ValueError(file_path)
+
+            program = self._decode(loads(decompress(data[len(_MAGIC):])))
+            if type(program) != Program:
+                raise ValueError(file_path)
+        except (ValueError, TypeError, IndexError, KeyError, EOFError, ZlibError, RecursionError):
+            self._discard(file_path)
+            return None
+
+        # The modification time doubles as the last access time for eviction.
+        try:
+            utime(file_path)
+        except OSError:
+            pass
+
+        return program
+
+    def store(self, key: str, program: Program) -> None:
+        try:
+            data = _MAGIC + compress(dumps(encode(program)), 1)
+        except (ValueError, RecursionError):
+            return
+
+        try:
+            descriptor, temporary_path = mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            return
+
+        # Once replaced, the temporary file is gone and discarding it does
+        # nothing; otherwise it is removed however the write failed.
+        try:
+            with fdopen(descriptor, 'wb') as stream:
+                stream.write(data)
+            replace(temporary_path, self._path(key))
+        except OSError:
+            return
+        finally:
+            self._discard(temporary_path)
+
+        self._evict()
+
+    def _decode(self, data: Any) -> Any:
+        # Decoding only allocates acyclic nodes, so the cyclic collector has
+        # nothing to find and only slows the bulk allocation down.
+        collecting = isenabled()
+        disable()
+        try:
+            return decode(data)
+        finally:
+            if collecting:
+                enable()
+
+    def _evict(self) -> None:
+        entries: List[Tuple[float, int, str]] = []
+        for name in listdir(self.directory):
+            if not name.endswith(_SUFFIX):
+                continue
+
+            file_path = path.join(self.directory, name)
+            try:
+                status = stat(file_path)
+            except OSError:
+                continue
+
+            entries.append((status.st_mtime, status.st_size, file_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, file_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            self._discard(file_path)
+            total -= size
+
+    def _discard(self, file_path: str) -> None:
+        try:
+            remove(file_path)
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> str:
+        return path.join(self.directory, key + _SUFFIX)
@@ -0,0 +1,108 @@
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import lpm.ast as ast
+from lpm.object import (
+    _UNSET,
+    Function,
+)
+
+
+class CallSiteCache:
+    __slots__ = ('function', 'statements', 'padding', 'slots', 'hits', 'misses')
+
+    # The inline cache of one call expression: the procedimiento it called
+    # last and its binding plan. Parameters get the first slots of a frame,
+    # so the arguments followed by padding are the frame's values. A call of
+    # the same procedimiento goes straight to its body; calling another one
+    # replaces the cached procedimiento.
+    def __init__(self) -> None:
+        self.function: Optional[Function] = None
+        self.statements: List[ast.Statement] = []
+        self.padding: List[Any] = []
+        self.slots: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+
+        return self.hits / calls if calls > 0 else 0.0
+
+    # Caches fn unless its calls need more than a frame: memoized
+    # procedimientos, bodies the resolver has not seen, repeated parameter
+    # names and calls with a different number of arguments than parameters
+    # take the generic path every time.
+    def update(self, fn: Function, args: List[Any]) -> None:
+        if (fn.slots is None
+                or fn.memo is not None
+                or type(fn.body) != ast.Block
+                or len(args) != len(fn.parameters)
+                or [parameter.slot for parameter in fn.parameters] != list(range(len(args)))):
+            self.function = None
+            return
+
+        self.function = fn
+        self.statements = cast(ast.Block, fn.body).statements
+        self.padding = [_UNSET] * (len(fn.slots) - len(args))
+        self.slots = fn.slots
+
+
+# The source, hits and misses of every call expression under node that has
+# been evaluated, in source order. Bodies that are still unparsed are skipped.
+def statistics(node: Optional[ast.ASTNode]) -> List[Tuple[str, int, int]]:
+    sites: List[Tuple[str, int, int]] = []
+    _statistics(node, sites)
+
+    return sites
+
+
+def _statistics(node: Optional[ast.ASTNode], sites: List[Tuple[str, int, int]]) -> None:
+    node_type = type(node)
+
+    if node_type == ast.Call:
+        node = cast(ast.Call, node)
+
+        _statistics(node.function, sites)
+        for argument in node.arguments or []:
+            _statistics(argument, sites)
+        if node.cache is not None:
+            sites.append((str(node), node.cache.hits, node.cache.misses))
+    elif node_type == ast.Program:
+        for statement in cast(ast.Program, node).statements:
+            _statistics(statement, sites)
+    elif node_type == ast.Block:
+        for statement in cast(ast.Block, node).statements:
+            _statistics(statement, sites)
+    elif node_type == ast.LazyBlock:
+        lazy = cast(ast.LazyBlock, node)
+        if lazy.parsed:
+            _statistics(lazy.parse(), sites)
+    elif node_type == ast.ExpressionStatement:
+        _statistics(cast(ast.ExpressionStatement, node).expression, sites)
+    elif node_type == ast.LetStatement:
+        _statistics(cast(ast.LetStatement, node).value, sites)
+    elif node_type == ast.ReturnStatement:
+        _statistics(cast(ast.ReturnStatement, node).return_value, sites)
+    elif node_type == ast.If:
+        node = cast(ast.If, node)
+
+        _statistics(node.condition, sites)
+        _statistics(node.consequence, sites)
+        _statistics(node.alternative, sites)
+    elif node_type == ast.Prefix:
+        _statistics(cast(ast.Prefix, node).right, sites)
+    elif node_type == ast.Infix:
+        node = cast(ast.Infix, node)
+
+        _statistics(node.left, sites)
+        _statistics(node.right, sites)
+    elif node_type == ast.Function:
+        _statistics(cast(ast.Function, node).body, sites)
@@ -0,0 +1,315 @@
+from operator import (
+    add,
+    gt,
+    lt,
+    mul,
+    sub,
+)
+from typing import (
+    Callable,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+import lpm.ast as ast
+from lpm.builtins import BUILTINS
+from lpm.evaluator import (
+    _apply_function,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _new_error,
+    _SYNTAX_ERROR,
+    _UNKNOWN_IDENTIFIER,
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpm.object import (
+    Environment,
+    Error,
+    Function,
+    Integer,
+    Object,
+    Return,
+    String,
+)
+
+# Every node is turned once into a Python closure over its already compiled
+# children; running the program is then a chain of calls with no dispatch on
+# the node type.
+Node = Callable[[Environment], Optional[Object]]
+
+_ARITHMETIC: Dict[str, Callable[[int, int], int]] = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+}
+
+_COMPARISONS: Dict[str, Callable[[int, int], bool]] = {
+    '<': lt,
+    '>': gt,
+}
+
+
+class _Body:
+
+    # The body of one procedimiento literal, compiled on its first call so
+    # lazily parsed bodies are only parsed when they run.
+    def __init__(self, body: Union[ast.Block, ast.LazyBlock]) -> None:
+        self.body = body
+        self.run: Optional[Node] = None
+        self.errors: List[str] = []
+
+    def compile(self) -> Optional[Node]:
+        if self.run is None:
+            block = self.body
+            if type(block) == ast.LazyBlock:
+                lazy = cast(ast.LazyBlock, block)
+                block = lazy.parse()
+                self.errors = lazy.errors
+                if len(self.errors) > 0:
+                    return None
+
+            self.run = _compile_block(cast(ast.Block, block).statements)
+
+        return self.run
+
+
+class CompiledFunction(Function):
+
+    def __init__(self, parameters: List[ast.Identifier], body: _Body, env: Environment) -> None:
+        super().__init__(parameters, body.body, env)
+        self.compiled = body
+
+
+def execute(program: ast.Program, env: Environment) -> Optional[Object]:
+    return compile_program(program)(env)
+
+
+def compile_program(program: ast.Program) -> Node:
+    statements = [_compile(statement) for statement in program.statements]
+
+    def run(env: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+
+        for statement in statements:
+            result = statement(env)
+
+            if type(result) is Return:
+                return cast(Return, result).value
+            elif type(result) is Error:
+                return result
+
+        return result
+
+    return run
+
+
+def _compile(node: ast.ASTNode) -> Node:
+    node_type = type(node)
+
+    if node_type == ast.ExpressionStatement:
+        expression = cast(ast.ExpressionStatement, node).expression
+
+        assert expression is not None
+        return _compile(expression)
+    elif node_type == ast.Identifier:
+        return _compile_identifier(cast(ast.Identifier, node).value)
+    elif node_type == ast.Integer:
+        node = cast(ast.Integer, node)
+
+        assert node.value is not None
+        return _compile_constant(Integer(node.value))
+    elif node_type == ast.Infix:
+        node = cast(ast.Infix, node)
+
+        assert node.right is not None
+        return _compile_infix(node.operator, _compile(node.left), _compile(node.right))
+    elif node_type == ast.Call:
+        node = cast(ast.Call, node)
+
+        assert node.arguments is not None
+        return _compile_call(_compile(node.function), [_compile(argument) for argument in node.arguments])
+    elif node_type == ast.If:
+        return _compile_if(cast(ast.If, node))
+    elif node_type == ast.ReturnStatement:
+        node = cast(ast.ReturnStatement, node)
+
+        assert node.return_value is not None
+        return _compile_return(_compile(node.return_value))
+    elif node_type == ast.LetStatement:
+        node = cast(ast.LetStatement, node)
+
+        assert node.name is not None and node.value is not None
+        return _compile_let(node.name.value, _compile(node.value))
+    elif node_type == ast.Prefix:
+        node = cast(ast.Prefix, node)
+
+        assert node.right is not None
+        return _compile_prefix(node.operator, _compile(node.right))
+    elif node_type == ast.Boolean:
+        node = cast(ast.Boolean, node)
+
+        assert node.value is not None
+        return _compile_constant(TRUE if node.value else FALSE)
+    elif node_type == ast.StringLiteral:
+        return _compile_constant(String(cast(ast.StringLiteral, node).value))
+    elif node_type == ast.Function:
+        node = cast(ast.Function, node)
+
+        assert node.body is not None
+        return _compile_function(node.parameters, _Body(node.body))
+    elif node_type == ast.Block:
+        return _compile_block(cast(ast.Block, node).statements)
+
+    return _compile_constant(None)
+
+
+def _compile_constant(value: Optional[Object]) -> Node:
+    def constant(env: Environment) -> Optional[Object]:
+        return value
+
+    return constant
+
+
+def _compile_identifier(name: str) -> Node:
+    builtin = BUILTINS.get(name)
+
+    def identifier(env: Environment) -> Object:
+        try:
+            return env[name]
+        except KeyError:
+            if builtin is not None:
+                return builtin
+
+            return _new_error(_UNKNOWN_IDENTIFIER, [name])
+
+    return identifier
+
+
+def _compile_infix(operator: str, left: Node, right: Node) -> Node:
+    if operator in _ARITHMETIC:
+        arithmetic = _ARITHMETIC[operator]
+
+        def arithmetic_infix(env: Environment) -> Object:
+            left_value = left(env)
+            right_value = right(env)
+
+            if type(left_value) is Integer and type(right_value) is Integer:
+                return Integer(arithmetic(left_value.value, right_value.value))
+
+            return _evaluate_infix_expression(operator, cast(Object, left_value), cast(Object, right_value))
+
+        return arithmetic_infix
+    elif operator in _COMPARISONS:
+        comparison = _COMPARISONS[operator]
+
+        def comparison_infix(env: Environment) -> Object:
+            left_value = left(env)
+            right_value = right(env)
+
+            if type(left_value) is Integer and type(right_value) is Integer:
+                return TRUE if comparison(left_value.value, right_value.value) else FALSE
+
+            return _evaluate_infix_expression(operator, cast(Object, left_value), cast(Object, right_value))
+
+        return comparison_infix
+
+    def infix(env: Environment) -> Object:
+        left_value = left(env)
+        right_value = right(env)
+
+        return _evaluate_infix_expression(operator, cast(Object, left_value), cast(Object, right_value))
+
+    return infix
+
+
+def _compile_prefix(operator: str, right: Node) -> Node:
+    def prefix(env: Environment) -> Object:
+        return _evaluate_prefix_expression(operator, cast(Object, right(env)))
+
+    return prefix
+
+
+def _compile_block(statements: List[ast.Statement]) -> Node:
+    compiled = [_compile(statement) for statement in statements]
+
+    def block(env: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+
+        for statement in compiled:
+            result = statement(env)
+
+            if type(result) is Return or type(result) is Error:
+                return result
+
+        return result
+
+    return block
+
+
+def _compile_if(node: ast.If) -> Node:
+    assert node.condition is not None and node.consequence is not None
+    condition = _compile(node.condition)
+    consequence = _compile(node.consequence)
+    alternative = _compile(node.alternative) if node.alternative is not None else _compile_constant(NULL)
+
+    def if_expression(env: Environment) -> Optional[Object]:
+        value = condition(env)
+
+        if value is NULL or value is FALSE:
+            return alternative(env)
+
+        return consequence(env)
+
+    return if_expression
+
+
+def _compile_return(value: Node) -> Node:
+    def return_statement(env: Environment) -> Object:
+        return Return(cast(Object, value(env)))
+
+    return return_statement
+
+
+def _compile_let(name: str, value: Node) -> Node:
+    def let_statement(env: Environment) -> None:
+        env[name] = value(env)
+
+    return let_statement
+
+
+def _compile_function(parameters: List[ast.Identifier], body: _Body) -> Node:
+    def function(env: Environment) -> Object:
+        return CompiledFunction(parameters, body, env)
+
+    return function
+
+
+def _compile_call(function: Node, arguments: List[Node]) -> Node:
+    def call(env: Environment) -> Optional[Object]:
+        fn = function(env)
+        args = [argument(env) for argument in arguments]
+
+        if type(fn) is not CompiledFunction:
+            return _apply_function(cast(Object, fn), cast(List[Object], args))
+
+        fn = cast(CompiledFunction, fn)
+        run = fn.compiled.compile()
+        if run is None:
+            return _new_error(_SYNTAX_ERROR, ['; '.join(fn.compiled.errors)])
+
+        extended_environment = Environment(outer=fn.env)
+        for parameter, arg in zip(fn.parameters, args):
+            extended_environment[parameter.value] = arg
+
+        evaluated = run(extended_environment)
+        if type(evaluated) is Return:
+            return cast(Return, evaluated).value
+
+        return evaluated
+
+    return call
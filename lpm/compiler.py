@@ -0,0 +1,341 @@
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import lpm.ast as ast
+from lpm.evaluator import (
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpm.object import (
+    Integer,
+    String,
+)
+
+# Instructions are (opcode, argument) pairs; the argument is None for the
+# opcodes that take nothing from the instruction stream.
+(
+    LOAD_CONSTANT,
+    LOAD_LOCAL,
+    LOAD_FREE,
+    LOAD_GLOBAL,
+    STORE_LOCAL,
+    STORE_GLOBAL,
+    PUSH_NONE,
+    POP,
+    CHECK,
+    CHECK_JUMP,
+    RETURN,
+    WRAP_RETURN,
+    JUMP,
+    JUMP_IF_FALSE,
+    ADD,
+    SUBTRACT,
+    MULTIPLY,
+    DIVIDE,
+    LESS,
+    GREATER,
+    EQUAL,
+    NOT_EQUAL,
+    INFIX,
+    NEGATE,
+    NOT,
+    PREFIX,
+    CLOSURE,
+    CALL,
+) = range(28)
+
+Instruction = Tuple[int, Any]
+
+_INFIX_OPCODES: Dict[str, int] = {
+    '+': ADD,
+    '-': SUBTRACT,
+    '*': MULTIPLY,
+    '/': DIVIDE,
+    '<': LESS,
+    '>': GREATER,
+    '==': EQUAL,
+    '!=': NOT_EQUAL,
+}
+
+_PREFIX_OPCODES: Dict[str, int] = {
+    '-': NEGATE,
+    '!': NOT,
+}
+
+
+class Code:
+
+    # The compiled form of the program or of one procedimiento literal.
+    # Function bodies are compiled on their first call, so a Code starts with
+    # instructions set to None; parent is the Code of the enclosing literal
+    # and None at the top level, whose variables live in the Environment.
+    def __init__(self, function: Optional[ast.Function] = None, parent: Optional['Code'] = None) -> None:
+        self.function = function
+        self.parent = parent
+        self.instructions: Optional[List[Instruction]] = None
+        self.constants: List[Any] = []
+        self.names: List[str] = []
+        self.slots: Dict[str, int] = {}
+        self.arity: int = 0
+        self.errors: List[str] = []
+
+
+def compile_program(program: ast.Program) -> Code:
+    code = Code()
+    _Compiler(code).program(program)
+
+    return code
+
+
+def compile_function(code: Code) -> List[str]:
+    assert code.function is not None and code.function.body is not None
+    body = code.function.body
+
+    if type(body) == ast.LazyBlock:
+        lazy = cast(ast.LazyBlock, body)
+        block = lazy.parse()
+        code.errors = lazy.errors
+        if len(code.errors) > 0:
+            return code.errors
+    else:
+        block = cast(ast.Block, body)
+
+    _Compiler(code).function(code.function.parameters, block)
+
+    return code.errors
+
+
+class _Compiler:
+
+    def __init__(self, code: Code) -> None:
+        self._code = code
+        self._instructions: List[Instruction] = []
+        self._constants: Dict[Tuple[type, Any], int] = {}
+        # While an if is compiled as a value, a statement that yields an
+        # Error or a Return leaves its block by jumping to the end of the
+        # innermost such if instead of returning from the frame.
+        self._exits: List[List[int]] = []
+
+    def program(self, program: ast.Program) -> None:
+        self._block(program.statements, True)
+        self._finish()
+
+    def function(self, parameters: List[ast.Identifier], body: ast.Block) -> None:
+        for parameter in parameters:
+            self._declare(parameter.value)
+        self._code.arity = len(parameters)
+        for statement in body.statements:
+            self._collect(statement)
+
+        self._block(body.statements, True)
+        self._finish()
+
+    def _finish(self) -> None:
+        self._emit(RETURN)
+        self._code.instructions = self._instructions
+
+    def _emit(self, opcode: int, argument: Any = None) -> int:
+        self._instructions.append((opcode, argument))
+
+        return len(self._instructions) - 1
+
+    def _patch(self, index: int) -> None:
+        opcode, _ = self._instructions[index]
+        self._instructions[index] = (opcode, len(self._instructions))
+
+    def _constant(self, value: Any) -> int:
+        key = (type(value), value.value if isinstance(value, (Integer, String)) else id(value))
+
+        try:
+            return self._constants[key]
+        except KeyError:
+            self._code.constants.append(value)
+            self._constants[key] = len(self._code.constants) - 1
+
+            return self._constants[key]
+
+    def _declare(self, name: str) -> None:
+        if name not in self._code.slots:
+            self._code.slots[name] = len(self._code.names)
+            self._code.names.append(name)
+
+    # Every variable a function body may define gets a slot, including those
+    # in nested si blocks; the bodies of nested procedimientos have their own.
+    def _collect(self, node: Optional[ast.ASTNode]) -> None:
+        node_type = type(node)
+
+        if node_type == ast.LetStatement:
+            node = cast(ast.LetStatement, node)
+
+            assert node.name is not None
+            self._declare(node.name.value)
+            self._collect(node.value)
+        elif node_type == ast.ReturnStatement:
+            self._collect(cast(ast.ReturnStatement, node).return_value)
+        elif node_type == ast.ExpressionStatement:
+            self._collect(cast(ast.ExpressionStatement, node).expression)
+        elif node_type == ast.Block:
+            for statement in cast(ast.Block, node).statements:
+                self._collect(statement)
+        elif node_type == ast.If:
+            node = cast(ast.If, node)
+
+            self._collect(node.condition)
+            self._collect(node.consequence)
+            self._collect(node.alternative)
+        elif node_type == ast.Prefix:
+            self._collect(cast(ast.Prefix, node).right)
+        elif node_type == ast.Infix:
+            node = cast(ast.Infix, node)
+
+            self._collect(node.left)
+            self._collect(node.right)
+        elif node_type == ast.Call:
+            node = cast(ast.Call, node)
+
+            self._collect(node.function)
+            for argument in node.arguments or []:
+                self._collect(argument)
+
+    def _block(self, statements: List[ast.Statement], keep: bool) -> None:
+        for idx, statement in enumerate(statements):
+            self._statement(statement, keep and idx == len(statements) - 1)
+
+        if keep and len(statements) == 0:
+            self._emit(PUSH_NONE)
+
+    def _statement(self, statement: ast.Statement, keep: bool) -> None:
+        statement_type = type(statement)
+
+        if statement_type == ast.ExpressionStatement:
+            expression = cast(ast.ExpressionStatement, statement).expression
+
+            assert expression is not None
+            if type(expression) == ast.If:
+                # The values an if yields were already checked in its blocks.
+                self._if(cast(ast.If, expression), keep)
+                return
+
+            self._expression(expression)
+            if len(self._exits) > 0:
+                self._exits[-1].append(self._emit(CHECK_JUMP))
+            else:
+                self._emit(CHECK)
+            if not keep:
+                self._emit(POP)
+        elif statement_type == ast.ReturnStatement:
+            statement = cast(ast.ReturnStatement, statement)
+
+            assert statement.return_value is not None
+            self._expression(statement.return_value)
+            if len(self._exits) > 0:
+                self._emit(WRAP_RETURN)
+                self._exits[-1].append(self._emit(JUMP))
+            else:
+                self._emit(RETURN)
+        elif statement_type == ast.LetStatement:
+            statement = cast(ast.LetStatement, statement)
+
+            assert statement.name is not None and statement.value is not None
+            self._expression(statement.value)
+            if self._code.function is None:
+                self._emit(STORE_GLOBAL, statement.name.value)
+            else:
+                self._emit(STORE_LOCAL, self._code.slots[statement.name.value])
+            if keep:
+                self._emit(PUSH_NONE)
+
+    def _if(self, node: ast.If, keep: bool) -> None:
+        assert node.condition is not None and node.consequence is not None
+        self._expression(node.condition)
+        skip_consequence = self._emit(JUMP_IF_FALSE)
+        self._block(node.consequence.statements, keep)
+
+        if node.alternative is None and not keep:
+            self._patch(skip_consequence)
+            return
+
+        skip_alternative = self._emit(JUMP)
+        self._patch(skip_consequence)
+        if node.alternative is not None:
+            self._block(node.alternative.statements, keep)
+        else:
+            self._emit(LOAD_CONSTANT, self._constant(NULL))
+        self._patch(skip_alternative)
+
+    def _expression(self, node: ast.Expression) -> None:
+        node_type = type(node)
+
+        if node_type == ast.Identifier:
+            self._identifier(cast(ast.Identifier, node).value)
+        elif node_type == ast.Integer:
+            node = cast(ast.Integer, node)
+
+            assert node.value is not None
+            self._emit(LOAD_CONSTANT, self._constant(Integer(node.value)))
+        elif node_type == ast.Infix:
+            node = cast(ast.Infix, node)
+
+            assert node.right is not None
+            self._expression(node.left)
+            self._expression(node.right)
+            if node.operator in _INFIX_OPCODES:
+                self._emit(_INFIX_OPCODES[node.operator])
+            else:
+                self._emit(INFIX, node.operator)
+        elif node_type == ast.Call:
+            node = cast(ast.Call, node)
+
+            assert node.arguments is not None
+            self._expression(node.function)
+            for argument in node.arguments:
+                self._expression(argument)
+            self._emit(CALL, len(node.arguments))
+        elif node_type == ast.Prefix:
+            node = cast(ast.Prefix, node)
+
+            assert node.right is not None
+            self._expression(node.right)
+            if node.operator in _PREFIX_OPCODES:
+                self._emit(_PREFIX_OPCODES[node.operator])
+            else:
+                self._emit(PREFIX, node.operator)
+        elif node_type == ast.Boolean:
+            self._emit(LOAD_CONSTANT, self._constant(TRUE if cast(ast.Boolean, node).value else FALSE))
+        elif node_type == ast.StringLiteral:
+            self._emit(LOAD_CONSTANT, self._constant(String(cast(ast.StringLiteral, node).value)))
+        elif node_type == ast.If:
+            # An if inside an expression yields the Error or Return object
+            # that stopped its blocks as its value, like the evaluator does.
+            self._exits.append([])
+            self._if(cast(ast.If, node), True)
+            for index in self._exits.pop():
+                self._patch(index)
+        elif node_type == ast.Function:
+            node = cast(ast.Function, node)
+
+            assert node.body is not None
+            self._emit(CLOSURE, self._constant(Code(node, self._code)))
+
+    def _identifier(self, name: str) -> None:
+        if name in self._code.slots:
+            self._emit(LOAD_LOCAL, self._code.slots[name])
+            return
+
+        depth = 0
+        code = self._code.parent
+        while code is not None and code.function is not None:
+            if name in code.slots:
+                self._emit(LOAD_FREE, (depth, code.slots[name], name))
+                return
+            depth += 1
+            code = code.parent
+
+        self._emit(LOAD_GLOBAL, name)
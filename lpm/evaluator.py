@@ -1,13 +1,21 @@
 from typing import (
+    Callable,
     cast,
+    Dict,
+    Hashable,
     List,
     Optional,
+    Tuple,
     Type,
     Any,
 )
 
+from weakref import WeakValueDictionary
+
 import lpm.ast as ast
 from lpm.builtins import BUILTINS
+from lpm.callsite import CallSiteCache
+from lpm.memo import Memo
 from lpm.object import (
     Integer,
     Object,
@@ -17,27 +25,74 @@ from lpm.object import (
     Return,
     Error,
     Environment,
+    Frame,
     Function,
     String,
     Builtin,
+    _UNSET,
+)
+from lpm.purity import (
+    analyze,
+    DEFAULT_MEMO_SIZE,
+)
+from lpm.typecheck import (
+    check,
+    FunctionTypes,
+    TypeReport,
+)
+from lpm.resolver import (
+    BUILTIN,
+    resolve,
+    UNKNOWN,
 )
 
 TRUE = Boolean(True)
 FALSE = Boolean(False)
 NULL = Null()
 
+# Integers in this range are preallocated like the singletons above, and
+# equal string literals share one object. Identity is never observable for
+# them: == and != compare integers and strings by value.
+_SMALL_INTEGER_MIN = -128
+_SMALL_INTEGER_MAX = 1024
+_SMALL_INTEGERS: List[Integer] = [Integer(value) for value in range(_SMALL_INTEGER_MIN, _SMALL_INTEGER_MAX + 1)]
+_STRINGS: 'WeakValueDictionary[str, String]' = WeakValueDictionary()
+
 _TYPE_MISMATCH = 'Discrepancia de tipos: {} {} {}'
 _UNKNOWN_PREFIX_OPERATOR = 'Operador desconocido: {}{}'
 _UNKNOWN_INFIX_OPERATOR = 'Operador desconocido: {} {} {}'
 _UNKNOWN_IDENTIFIER = 'Identificador no encontrado: {}'
 _NOT_A_FUNCTION = 'No es una funcion: {}'
-
-def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
+_SYNTAX_ERROR = 'Error de sintaxis: {}'
+_MAX_DEPTH_EXCEEDED = 'Profundidad máxima de recursión excedida: {}'
+
+DEFAULT_MAX_DEPTH = 100000
+
+_MEMOIZED_TYPES = (Integer, String, Boolean, Null)
+
+# Work items of evaluate_iterative, each a tuple starting with one of these.
+(
+    _EVALUATE,
+    _PROGRAM,
+    _BLOCK,
+    _PREFIX,
+    _INFIX,
+    _BRANCH,
+    _BIND,
+    _RETURN,
+    _CALL,
+    _LEAVE_CALL,
+) = range(10)
+
+def evaluate(node: ast.ASTNode, env: Environment, memo_size: int = DEFAULT_MEMO_SIZE) -> Optional[Object]:
     node_type: Type = type(node)
 
     if node_type == ast.Program:
         node = cast(ast.Program, node)
 
+        resolve(node)
+        analyze(node, memo_size)
+        _specialize(check(node))
         return _evaluate_program(node, env)
     elif node_type == ast.ExpressionStatement:
         node = cast(ast.ExpressionStatement, node)
@@ -45,10 +100,7 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         assert node.expression is not None
         return evaluate(node.expression, env)
     elif node_type == ast.Integer:
-        node = cast(ast.Integer, node)
-
-        assert node.value is not None
-        return Integer(node.value)
+        return _integer_literal(cast(ast.Integer, node))
     elif node_type == ast.Boolean:
         node = cast(ast.Boolean, node)
 
@@ -61,6 +113,9 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         right = evaluate(node.right, env)
 
         assert right is not None
+        if node.static is not None:
+            return node.static(cast(Integer, right).value)
+
         return _evaluate_prefix_expression(node.operator, right)
     elif node_type == ast.Infix:
         node = cast(ast.Infix, node)
@@ -70,7 +125,12 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         right = evaluate(node.right, env)
 
         assert right is not None and left is not None
-        return _evaluate_infix_expression(node.operator, left, right)
+        if node.static is not None:
+            return node.static(cast(Integer, left).value, cast(Integer, right).value)
+        elif node.quick is not None and type(left) == Integer and type(right) == Integer:
+            return node.quick(cast(Integer, left).value, cast(Integer, right).value)
+
+        return _quicken(node, left, right)
     elif node_type == ast.Block:
         node = cast(ast.Block, node)
 
@@ -94,7 +154,10 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         value = evaluate(node.value, env)
 
         assert node.name is not None
-        env[node.name.value] = value
+        if node.depth == 0:
+            cast(Frame, env).values[node.slot] = value
+        else:
+            env[node.name.value] = value
     elif node_type == ast.Identifier:
         node = cast(ast.Identifier, node)
 
@@ -103,21 +166,33 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         node = cast(ast.Function, node)
 
         assert node.body is not None
-        return Function(node.parameters, node.body, env)
+        function = Function(node.parameters, node.body, env, node.slots)
+        function.types = node.types
+        # Pure procedimientos only read globals, so they are memoized when
+        # defined in the global scope, whose version tells when those change.
+        if node.memo_size > 0 and env.outer is None:
+            function.memo = Memo(node.memo_size)
+
+        return function
     elif node_type == ast.Call:
         node = cast(ast.Call, node)
 
-        function = evaluate(node.function, env)
+        callee = evaluate(node.function, env)
 
         assert node.arguments is not None
         args = _evaluate_expression(node.arguments, env)
 
-        assert function is not None
-        return _apply_function(function, args)
-    elif node_type == ast.StringLiteral:
-        node = cast(ast.StringLiteral, node)
+        assert callee is not None
+        if node.cache is None:
+            node.cache = CallSiteCache()
 
-        return String(node.value)
+        result = _apply_function(callee, args, node.cache)
+        if node.expected is not None and type(result) is not node.expected:
+            cast(FunctionTypes, node.owner).invalidate()
+
+        return result
+    elif node_type == ast.StringLiteral:
+        return _string_literal(cast(ast.StringLiteral, node))
 
     return None
 
@@ -136,40 +211,328 @@ def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object
 
     return result
 
-def _apply_function(fn: Object, args: List[Object]) -> Object:
-    if type(fn) == Function:
-        fn = cast(Function, fn)
-
-        extended_environment = _extend_function_environment(fn, args)
-        evaluated = evaluate(fn.body, extended_environment)
+# The same semantics as evaluate, on an explicit work stack: each node pushes
+# the work for its children plus an item that combines their values, which
+# the children leave on a value stack. Recursion depth is only bounded by
+# max_depth, the number of procedimiento calls in progress; going past it
+# stops the evaluation with an Error.
+def evaluate_iterative(node: ast.ASTNode,
+                       env: Environment,
+                       max_depth: int = DEFAULT_MAX_DEPTH) -> Optional[Object]:
+    work: List[Tuple[Any, ...]] = [(_EVALUATE, node, env)]
+    values: List[Any] = []
+    push = work.append
+    depth = 0
+
+    while len(work) > 0:
+        item = work.pop()
+        kind = item[0]
+
+        if kind == _EVALUATE:
+            current = item[1]
+            env = item[2]
+            node_type = type(current)
+
+            if node_type == ast.Identifier:
+                values.append(_evaluate_identifier(current, env))
+            elif node_type == ast.Integer:
+                values.append(_integer_literal(current))
+            elif node_type == ast.Infix:
+                push((_INFIX, current))
+                push((_EVALUATE, current.right, env))
+                push((_EVALUATE, current.left, env))
+            elif node_type == ast.Call:
+                push((_CALL, len(current.arguments)))
+                for argument in reversed(current.arguments):
+                    push((_EVALUATE, argument, env))
+                push((_EVALUATE, current.function, env))
+            elif node_type == ast.ExpressionStatement:
+                push((_EVALUATE, current.expression, env))
+            elif node_type == ast.If:
+                push((_BRANCH, current, env))
+                push((_EVALUATE, current.condition, env))
+            elif node_type == ast.Block:
+                push((_BLOCK, current.statements, 0, env))
+            elif node_type == ast.ReturnStatement:
+                push((_RETURN,))
+                push((_EVALUATE, current.return_value, env))
+            elif node_type == ast.LetStatement:
+                push((_BIND, current.name.value, env))
+                push((_EVALUATE, current.value, env))
+            elif node_type == ast.Prefix:
+                push((_PREFIX, current.operator))
+                push((_EVALUATE, current.right, env))
+            elif node_type == ast.Boolean:
+                values.append(_to_boolean_object(current.value))
+            elif node_type == ast.StringLiteral:
+                values.append(_string_literal(current))
+            elif node_type == ast.Function:
+                values.append(Function(current.parameters, current.body, env, current.slots))
+            elif node_type == ast.Program:
+                resolve(current)
+                push((_PROGRAM, current.statements, 0, env))
+            else:
+                values.append(None)
+        elif kind == _INFIX:
+            right = values.pop()
+            left = values[-1]
+            if item[1].quick is not None and type(left) == Integer and type(right) == Integer:
+                values[-1] = item[1].quick(left.value, right.value)
+            else:
+                values[-1] = _quicken(item[1], left, right)
+        elif kind == _CALL:
+            count = item[1]
+            args = values[len(values) - count:]
+            del values[len(values) - count:]
+            fn = values.pop()
+
+            if type(fn) != Function:
+                values.append(_apply_function(fn, args))
+                continue
+
+            body = fn.body
+            if type(body) == ast.LazyBlock:
+                lazy = cast(ast.LazyBlock, body)
+                body = lazy.parse()
+                if len(lazy.errors) > 0:
+                    values.append(_new_error(_SYNTAX_ERROR, ['; '.join(lazy.errors)]))
+                    continue
+
+            if depth == max_depth:
+                return _new_error(_MAX_DEPTH_EXCEEDED, [max_depth])
+            depth += 1
+            push((_LEAVE_CALL,))
+            push((_BLOCK, body.statements, 0, _extend_function_environment(fn, args)))
+        elif kind == _LEAVE_CALL:
+            depth -= 1
+            values[-1] = _unwrap_return_value(values[-1])
+        elif kind == _BLOCK or kind == _PROGRAM:
+            statements = item[1]
+            index = item[2]
+
+            if index > 0:
+                result = values[-1]
+                if type(result) == Error or type(result) == Return:
+                    if kind == _PROGRAM and type(result) == Return:
+                        values[-1] = result.value
+                    continue
+                elif index == len(statements):
+                    continue
+                values.pop()
+            elif len(statements) == 0:
+                values.append(None)
+                continue
+
+            push((kind, statements, index + 1, item[3]))
+            push((_EVALUATE, statements[index], item[3]))
+        elif kind == _BRANCH:
+            current = item[1]
+
+            if _is_truthy(values.pop()):
+                push((_EVALUATE, current.consequence, item[2]))
+            elif current.alternative is not None:
+                push((_EVALUATE, current.alternative, item[2]))
+            else:
+                values.append(NULL)
+        elif kind == _PREFIX:
+            values[-1] = _evaluate_prefix_expression(item[1], values[-1])
+        elif kind == _BIND:
+            item[2][item[1]] = values.pop()
+            values.append(None)
+        elif kind == _RETURN:
+            values[-1] = Return(values[-1])
+
+    return values.pop()
+
+
+class _TailCall:
+
+    # A call in tail position of a procedimiento body. Instead of running it
+    # in a nested Python frame, _evaluate_body hands it back to the
+    # trampoline in _apply_function. unwraps is 1 when the call was the last
+    # expression of the body, whose value the caller would unwrap once more.
+    def __init__(self, function: Object, args: List[Object], unwraps: int, site: CallSiteCache) -> None:
+        self.function = function
+        self.args = args
+        self.unwraps = unwraps
+        self.site = site
+
+
+# site is the inline cache of the call expression, if the call has one.
+def _apply_function(fn: Object, args: List[Object], site: Optional[CallSiteCache] = None) -> Object:
+    unwraps = 0
+    # The memo and key of the first call. The tail calls it makes are not
+    # memoized, so that tail-recursive loops run in constant space.
+    pending: Optional[Tuple[Memo, Hashable]] = None
+    tail = False
+
+    while True:
+        if site is not None and fn is site.function:
+            site.hits += 1
+            if fn.types is not None and fn.types.parameters is not None:
+                fn.types.check(args)
+            evaluated = _evaluate_body(site.statements, Frame(args + site.padding, site.slots, fn.env), True)
+        elif isinstance(fn, Function):
+            # Other engines keep their own Function subclasses in the
+            # environments they share with the evaluator.
+            if fn.memo is not None and not tail:
+                key = _memo_key(args)
+                if key is not None:
+                    cached = fn.memo.get(key, fn.env.version)
+                    if cached is not None:
+                        evaluated = cached
+                        break
+
+                    pending = (fn.memo, key)
+
+            body: ast.ASTNode = fn.body
+            if type(body) == ast.LazyBlock:
+                lazy = cast(ast.LazyBlock, body)
+                body = lazy.parse()
+                if len(lazy.errors) > 0:
+                    return _new_error(_SYNTAX_ERROR, ['; '.join(lazy.errors)])
+
+            if site is not None:
+                site.misses += 1
+                site.update(fn, args)
+
+            if fn.types is not None and fn.types.parameters is not None:
+                fn.types.check(args)
+
+            extended_environment = _extend_function_environment(fn, args)
+            evaluated = _evaluate_body(cast(ast.Block, body).statements, extended_environment, True)
+        elif type(fn) == Builtin:
+            fn = cast(Builtin, fn)
+
+            evaluated = fn.fn(*args)
+            break
+        else:
+            return _new_error(_NOT_A_FUNCTION, [fn.type().name])
 
         assert evaluated is not None
-        return _unwrap_return_value(evaluated)
-    elif type(fn) == Builtin:
-        fn = cast(Builtin, fn)
+        evaluated = _unwrap_return_value(evaluated)
+        if type(evaluated) != _TailCall:
+            break
+
+        tail_call = cast(_TailCall, evaluated)
+        fn, args, site = tail_call.function, tail_call.args, tail_call.site
+        unwraps += tail_call.unwraps
+        tail = True
+
+    # Only values compared by value, or singletons, are memoized: a memoized
+    # Error or Function would make == true between two calls.
+    if pending is not None and type(evaluated) in _MEMOIZED_TYPES:
+        memo, key = pending
+        memo.put(key, evaluated)
+
+    while unwraps > 0 and type(evaluated) == Return:
+        evaluated = _unwrap_return_value(evaluated)
+        unwraps -= 1
+
+    return evaluated
+
+
+# Evaluates a procedimiento body like _evaluate_block_statement, except that
+# calls in tail position (the value of a regresa, or the last expression when
+# tail is set) are returned as _TailCall instead of being made.
+def _evaluate_body(statements: List[ast.Statement], env: Environment, tail: bool) -> Optional[Object]:
+    result: Optional[Object] = None
+
+    for idx, statement in enumerate(statements):
+        last = tail and idx == len(statements) - 1
+        statement_type = type(statement)
+
+        if statement_type == ast.ReturnStatement:
+            statement = cast(ast.ReturnStatement, statement)
+
+            if type(statement.return_value) == ast.Call:
+                call = cast(ast.Call, statement.return_value)
+                return Return(cast(Object, _tail_call(call, env, 0)))
+
+            result = evaluate(statement, env)
+        elif statement_type == ast.ExpressionStatement:
+            expression = cast(ast.ExpressionStatement, statement).expression
+
+            if type(expression) == ast.If:
+                result = _evaluate_if_body(cast(ast.If, expression), env, last)
+                if last:
+                    return result
+            elif last and type(expression) == ast.Call:
+                return cast(Object, _tail_call(cast(ast.Call, expression), env, 1))
+            else:
+                result = evaluate(statement, env)
+        else:
+            result = evaluate(statement, env)
+
+        if result is not None and (result.type() == ObjectType.RETURN or result.type() == ObjectType.ERROR):
+            return result
+
+    return result
+
+
+def _evaluate_if_body(if_expression: ast.If, env: Environment, tail: bool) -> Optional[Object]:
+    assert if_expression.condition is not None
+    condition = evaluate(if_expression.condition, env)
 
-        return fn.fn(*args)
+    assert condition is not None
+    if _is_truthy(condition):
+        assert if_expression.consequence is not None
+        return _evaluate_body(if_expression.consequence.statements, env, tail)
+    elif if_expression.alternative is not None:
+        return _evaluate_body(if_expression.alternative.statements, env, tail)
     else:
-        return _new_error(_NOT_A_FUNCTION, [fn.type().name])
+        return NULL
+
+
+def _tail_call(call: ast.Call, env: Environment, unwraps: int) -> _TailCall:
+    function = evaluate(call.function, env)
 
-    fn = cast(Function, fn)
+    assert call.arguments is not None
+    args = _evaluate_expression(call.arguments, env)
 
-    extended_environment = _extend_function_environment(fn, args)
-    evaluated = evaluate(fn.body, extended_environment)
+    assert function is not None
+    if call.cache is None:
+        call.cache = CallSiteCache()
 
-    assert evaluated is not None
-    return _unwrap_return_value(evaluated)
+    return _TailCall(function, args, unwraps, call.cache)
 
 
 def _extend_function_environment(fn: Function, args: List[Object]) -> Environment:
+    if fn.slots is not None:
+        values: List[Any] = [_UNSET] * len(fn.slots)
+        for idx, param in enumerate(fn.parameters):
+            values[param.slot] = args[idx]
+
+        return Frame(values, fn.slots, fn.env)
+
     env = Environment(outer=fn.env)
 
     for idx, param in enumerate(fn.parameters):
-        env[param.value] = args[idx - 1]
+        env[param.value] = args[idx]
 
     return env
 
 
+# The memo key of a call's arguments, or None when some argument is not an
+# integer, string or boolean. Booleans are keyed by their singleton object so
+# that verdadero and 1 get different keys.
+def _memo_key(args: List[Object]) -> Optional[Hashable]:
+    key: List[Hashable] = []
+
+    for arg in args:
+        arg_type = type(arg)
+        if arg_type == Integer:
+            key.append(cast(Integer, arg).value)
+        elif arg_type == String:
+            key.append(cast(String, arg).value)
+        elif arg_type == Boolean:
+            key.append(arg)
+        else:
+            return None
+
+    return tuple(key)
+
+
 def _unwrap_return_value(obj: Object) -> Object:
     if type(obj) == Return:
         obj = cast(Return, obj)
@@ -180,6 +543,28 @@ def _unwrap_return_value(obj: Object) -> Object:
 def _to_boolean_object(value: bool) -> Boolean:
     return TRUE if value else FALSE
 
+def _to_integer_object(value: int) -> Integer:
+    if _SMALL_INTEGER_MIN <= value <= _SMALL_INTEGER_MAX:
+        return _SMALL_INTEGERS[value - _SMALL_INTEGER_MIN]
+
+    return Integer(value)
+
+def _integer_literal(node: ast.Integer) -> Integer:
+    if node.constant is None:
+        assert node.value is not None
+        node.constant = _to_integer_object(node.value)
+
+    return node.constant
+
+def _string_literal(node: ast.StringLiteral) -> String:
+    if node.constant is None:
+        constant = _STRINGS.get(node.value)
+        if constant is None:
+            constant = _STRINGS[node.value] = String(node.value)
+        node.constant = constant
+
+    return node.constant
+
 def _evaluate_bang_operator_expression(right: Object) -> Object:
     if right is TRUE:
         return FALSE
@@ -212,11 +597,37 @@ def _evaluate_expression(expressions: List[ast.Expression], env: Environment) ->
 
     return result
 
+# A resolved local is read from the frame of the procedimiento that declares
+# it, depth frames out; until that frame assigns it, the name still refers to
+# whatever an enclosing scope holds, as in a plain lookup by name.
 def _evaluate_identifier(node: ast.Identifier, env: Environment) -> Object:
-    try:
-        return env[node.value]
-    except KeyError:
-        return BUILTINS.get(node.value, _new_error(_UNKNOWN_IDENTIFIER, [node.value]))
+    depth = node.depth
+
+    if depth == 0:
+        value = cast(Frame, env).values[node.slot]
+        if value is not _UNSET:
+            return value
+        env = env.outer
+    elif depth is not None and depth > 0:
+        frame = env
+        while depth > 0:
+            frame = frame.outer
+            depth -= 1
+
+        value = cast(Frame, frame).values[node.slot]
+        if value is not _UNSET:
+            return value
+        env = frame.outer
+
+    value = env.get(node.value, _UNSET)
+    if value is not _UNSET:
+        return value
+    elif depth == BUILTIN:
+        return BUILTINS[node.value]
+    elif depth != UNKNOWN and node.value in BUILTINS:
+        return BUILTINS[node.value]
+
+    return _new_error(_UNKNOWN_IDENTIFIER, [node.value])
 
 def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional[Object]:
     assert if_expression.condition is not None
@@ -242,6 +653,86 @@ def _is_truthy(obj: Object) -> bool:
     else:
         return True
 
+# The slow path of an Infix node, taken while it is not specialized or when
+# its operands are not both integers. The first time it applies an integer
+# operator to two integers the node is specialized to that operation, which
+# later evaluations call directly after checking their operands. If they are
+# ever something else, the node goes back to the generic path for good.
+def _quicken(node: ast.Infix, left: Object, right: Object) -> Object:
+    if node.quick is not None:
+        node.quick = None
+        node.generic = True
+    elif not node.generic and type(left) == Integer and type(right) == Integer:
+        node.quick = _INTEGER_OPERATIONS.get(node.operator)
+
+    return _evaluate_infix_expression(node.operator, left, right)
+
+def _integer_add(left: int, right: int) -> Integer:
+    return _to_integer_object(left + right)
+
+def _integer_subtract(left: int, right: int) -> Integer:
+    return _to_integer_object(left - right)
+
+def _integer_multiply(left: int, right: int) -> Integer:
+    return _to_integer_object(left * right)
+
+def _integer_divide(left: int, right: int) -> Integer:
+    return _to_integer_object(left // right)
+
+def _integer_less_than(left: int, right: int) -> Boolean:
+    return TRUE if left < right else FALSE
+
+def _integer_greater_than(left: int, right: int) -> Boolean:
+    return TRUE if left > right else FALSE
+
+def _integer_equal(left: int, right: int) -> Boolean:
+    return TRUE if left == right else FALSE
+
+def _integer_not_equal(left: int, right: int) -> Boolean:
+    return TRUE if left != right else FALSE
+
+def _integer_negate(right: int) -> Integer:
+    return _to_integer_object(-right)
+
+def _string_concatenate(left: str, right: str) -> String:
+    return String(left + right)
+
+def _string_equal(left: str, right: str) -> Boolean:
+    return TRUE if left == right else FALSE
+
+def _string_not_equal(left: str, right: str) -> Boolean:
+    return TRUE if left != right else FALSE
+
+_INTEGER_OPERATIONS: Dict[str, Callable[[int, int], Object]] = {
+    '+': _integer_add,
+    '-': _integer_subtract,
+    '*': _integer_multiply,
+    '/': _integer_divide,
+    '<': _integer_less_than,
+    '>': _integer_greater_than,
+    '==': _integer_equal,
+    '!=': _integer_not_equal,
+}
+
+_STRING_OPERATIONS: Dict[str, Callable[[str, str], Object]] = {
+    '+': _string_concatenate,
+    '==': _string_equal,
+    '!=': _string_not_equal,
+}
+
+# Gives the Infix and Prefix nodes whose operand types lpm.typecheck inferred
+# the operation for them, which they then apply without any check.
+def _specialize(report: TypeReport) -> None:
+    for node, operand_type in report.specialized:
+        if type(node) == ast.Prefix:
+            cast(ast.Prefix, node).static = _integer_negate
+        elif operand_type == ObjectType.INTEGER:
+            infix = cast(ast.Infix, node)
+            infix.static = _INTEGER_OPERATIONS[infix.operator]
+        else:
+            infix = cast(ast.Infix, node)
+            infix.static = _STRING_OPERATIONS[infix.operator]
+
 def _evaluate_infix_expression(operator: str, left: Object, right: Object) -> Object:
     if left.type() == ObjectType.INTEGER and right.type() == ObjectType.INTEGER:
         return _evaluate_integer_infix_expression(operator, left, right)
@@ -274,13 +765,13 @@ def _evaluate_integer_infix_expression(operator: str, left: Object, right: Objec
     right_value: int = cast(Integer, right).value
 
     if operator == '+':
-        return Integer(left_value + right_value)
+        return _to_integer_object(left_value + right_value)
     elif operator == '-':
-        return Integer(left_value - right_value)
+        return _to_integer_object(left_value - right_value)
     elif operator == '*':
-        return Integer(left_value * right_value)
+        return _to_integer_object(left_value * right_value)
     elif operator == '/':
-        return Integer(left_value // right_value)
+        return _to_integer_object(left_value // right_value)
     elif operator == '<':
         return _to_boolean_object(left_value < right_value)
     elif operator == '>':
@@ -298,7 +789,7 @@ def _evaluate_minus_operator_expression(right: Object) -> Object:
 
     right = cast(Integer, right)
 
-    return Integer(-right.value)
+    return _to_integer_object(-right.value)
 
 
 def _evaluate_prefix_expression(operator: str, right: Object) -> Object:
@@ -0,0 +1,159 @@
+from array import array
+from bisect import bisect_left
+from typing import (
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from lpm.ast import (
+    Program,
+    Statement,
+)
+from lpm.lexer import (
+    TokenBuffer,
+    TokenCursor,
+    scan,
+    tokenize,
+)
+from lpm.parser import Parser
+
+
+class ParsedUnit(NamedTuple):
+    statement: Optional[Statement]
+    errors: List[str]
+
+
+class Document:
+
+    def __init__(self, source: str) -> None:
+        self.tokens: TokenBuffer = tokenize(source)
+        # Top-level statements cover the token stream back to back; unit i
+        # spans the tokens from the end of unit i - 1 up to _unit_ends[i].
+        self._units: List[ParsedUnit] = []
+        self._unit_ends: array = array('I')
+        self._parse_units(self.tokens, 0, self._units, self._unit_ends, -1, 0)
+        self.program: Program = self._build_program()
+
+    @property
+    def source(self) -> str:
+        return self.tokens.source
+
+    @property
+    def errors(self) -> List[str]:
+        return [error for unit in self._units for error in unit.errors]
+
+    def edit(self, offset: int, removed: int, inserted: str) -> Program:
+        tokens, first, old_stop, new_stop = self._relex(offset, removed, inserted)
+        token_delta = new_stop - old_stop
+        ends = self._unit_ends
+
+        # A unit depends on every token it consumed plus the one it peeked at
+        # last, which is the first token of the following unit.
+        damaged = bisect_left(ends, first)
+        restart = ends[damaged - 1] if damaged > 0 else 0
+        # Units that start at or after old_stop only saw untouched tokens.
+        reusable_from = bisect_left(ends, old_stop) + 1
+
+        units = self._units[:damaged]
+        unit_ends = ends[:damaged]
+        self._parse_units(tokens, restart, units, unit_ends, reusable_from, token_delta)
+
+        self.tokens = tokens
+        self._units = units
+        self._unit_ends = unit_ends
+        self.program = self._build_program()
+
+        return self.program
+
+    def _relex(self, offset: int, removed: int, inserted: str) -> Tuple[TokenBuffer, int, int, int]:
+        old = self.tokens
+        source = old.source[:offset] + inserted + old.source[offset + removed:]
+        delta = len(inserted) - removed
+        edit_end = offset + len(inserted)
+
+        # The first token that ends at or after the edit may grow into it, so
+        # scanning restarts right after the token before it.
+        first = bisect_left(old.ends, offset)
+        restart = old.ends[first - 1] if first > 0 else 0
+
+        kinds = old.kinds[:first]
+        starts = old.starts[:first]
+        ends = old.ends[:first]
+        literals = old.literals[:first]
+
+        resync = len(old)
+        candidate = first
+        for kind, start, end, literal in scan(source, restart):
+            if start >= edit_end:
+                while candidate < len(old) and old.starts[candidate] + delta < start:
+                    candidate += 1
+
+                # Past the edit, the text is unchanged, so an identical token
+                # at the same shifted offset means the rest of the stream is too.
+                if candidate < len(old) \
+                        and old.starts[candidate] + delta == start \
+                        and old.ends[candidate] + delta == end \
+                        and old.kinds[candidate] == kind:
+                    resync = candidate
+                    break
+
+            kinds.append(kind)
+            starts.append(start)
+            ends.append(end)
+            literals.append(literal)
+
+        new_stop = len(kinds)
+
+        kinds.extend(old.kinds[resync:])
+        literals.extend(old.literals[resync:])
+        if delta == 0:
+            starts.extend(old.starts[resync:])
+            ends.extend(old.ends[resync:])
+        else:
+            starts.extend(array('I', map(delta.__add__, old.starts[resync:])))
+            ends.extend(array('I', map(delta.__add__, old.ends[resync:])))
+
+        tokens = TokenBuffer(source)
+        tokens.kinds, tokens.starts, tokens.ends, tokens.literals = kinds, starts, ends, literals
+
+        return tokens, first, resync, new_stop
+
+    def _parse_units(self,
+                     tokens: TokenBuffer,
+                     start: int,
+                     units: List[ParsedUnit],
+                     unit_ends: array,
+                     reusable_from: int,
+                     token_delta: int) -> None:
+        old_units = self._units
+        old_ends = self._unit_ends
+        cursor = TokenCursor(tokens, start)
+        parser = Parser(cursor)
+
+        for statement in parser.parse_statements():
+            end = cursor.index - 2
+            units.append(ParsedUnit(statement, parser.errors[:]))
+            unit_ends.append(end)
+            parser.errors.clear()
+
+            # The top-level parser carries no state besides its position, so
+            # landing where an untouched unit started means the remaining
+            # units would parse exactly as before. Their nodes keep the source
+            # offsets they were parsed with; shifting them would mean walking
+            # the whole tail, so the unit's first token in self.tokens holds
+            # its current position.
+            old_end = end - token_delta
+            previous = bisect_left(old_ends, old_end)
+            if reusable_from >= 0 and previous + 1 >= reusable_from \
+                    and previous < len(old_ends) and old_ends[previous] == old_end:
+                units.extend(old_units[previous + 1:])
+                if token_delta == 0:
+                    unit_ends.extend(old_ends[previous + 1:])
+                else:
+                    unit_ends.extend(array('I', map(token_delta.__add__, old_ends[previous + 1:])))
+                break
+
+    def _build_program(self) -> Program:
+        return Program(statements=[unit.statement for unit in self._units if unit.statement is not None])
@@ -1,136 +1,345 @@
-from re import match
+from array import array
+from bisect import bisect_right
+from codecs import getincrementaldecoder
+from mmap import mmap
+from os import PathLike
+from re import (
+    compile,
+    escape,
+    DOTALL,
+    Match,
+    Pattern,
+)
+from sys import intern
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    TextIO,
+    Tuple,
+    Union,
+)
+
 from lpm.token import (
     Token,
     TokenType,
-    lookup_token_type
+    KEYWORDS,
+    TOKEN_TYPES,
+)
+
+_LETTERS = 'a-záéíóúA-ZÁÉÍÓÚñÑ_'
+
+FIXED_TOKENS: Dict[str, TokenType] = {
+    '==': TokenType.EQ,
+    '!=': TokenType.NOT_EQ,
+    '=': TokenType.ASSIGN,
+    '!': TokenType.DIFFERENT,
+    '+': TokenType.PLUS,
+    '-': TokenType.SUBSTRACT,
+    '*': TokenType.MULTIPLICATION,
+    '/': TokenType.DIVIDE,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+}
+
+# Longest lexemes first so '==' wins over '='.
+_FIXED_PATTERN = '|'.join(escape(lexeme) for lexeme in sorted(FIXED_TOKENS, key=len, reverse=True))
+
+TOKEN_REGEX: Pattern = compile(
+    r'\s*(?:'
+    rf'(?P<identifier>[{_LETTERS}][{_LETTERS}\d]*)'
+    r'|(?P<number>\d+)'
+    r'|"(?P<string>[^"]*)"?'
+    rf'|(?P<fixed>{_FIXED_PATTERN})'
+    r'|(?P<illegal>.)'
+    r'|(?P<eof>\Z)'
+    r')',
+    DOTALL,
 )
 
+# Every fixed lexeme maps to a single shared Token instance.
+_FIXED_TOKEN_CACHE: Dict[str, Token] = {
+    lexeme: Token(token_type, lexeme) for lexeme, token_type in FIXED_TOKENS.items()
+}
+_KEYWORD_TOKEN_CACHE: Dict[str, Token] = {
+    literal: Token(token_type, literal) for literal, token_type in KEYWORDS.items()
+}
+
+EOF_TOKEN: Token = Token(TokenType.EOF, '')
+
+# Keyword, fixed and EOF tokens by literal; their literals never collide.
+_SHARED_TOKENS: Dict[str, Token] = {
+    token.literal: token
+    for token in [*_FIXED_TOKEN_CACHE.values(), *_KEYWORD_TOKEN_CACHE.values(), EOF_TOKEN]
+}
+
+
+def token_from_match(match: Match) -> Token:
+    kind = match.lastgroup
+    assert kind is not None
+
+    if kind == 'identifier':
+        literal = match.group(kind)
+        return _KEYWORD_TOKEN_CACHE.get(literal) or Token(TokenType.IDENT, literal)
+    elif kind == 'fixed':
+        return _FIXED_TOKEN_CACHE[match.group(kind)]
+    elif kind == 'number':
+        return Token(TokenType.INT, match.group(kind))
+    elif kind == 'string':
+        return Token(TokenType.STRING, match.group(kind))
+    elif kind == 'eof':
+        return EOF_TOKEN
+    else:
+        return Token(TokenType.ILLEGAL, match.group(kind))
+
+
+def token_start(match: Match) -> int:
+    kind = match.lastgroup
+    assert kind is not None
+    # The string group excludes the opening quote.
+    if kind == 'string':
+        return match.start(kind) - 1
+
+    return match.start(kind)
+
+
 class Lexer:
 
     def __init__(self, source: str) -> None:
         self._source: str = source
-        self._character: str = ''
-        self._read_position: int = 0
         self._position: int = 0
+        self.start: int = 0
+
+    def next_token(self) -> Token:
+        match = TOKEN_REGEX.match(self._source, self._position)
+        assert match is not None
+        self._position = match.end()
+        self.start = token_start(match)
+
+        return token_from_match(match)
+
+
+StreamSource = Union[str, PathLike, TextIO, BinaryIO, mmap]
+
+
+class StreamLexer:
+
+    def __init__(self,
+                 source: StreamSource,
+                 chunk_size: int = 1 << 16,
+                 encoding: str = 'utf-8') -> None:
+        self._source = source
+        self._chunk_size = chunk_size
+        self._encoding = encoding
+        self._tokens: Optional[Iterator[Token]] = None
+        self.start: int = 0
+
+    def __iter__(self) -> Iterator[Token]:
+        buffer: str = ''
+        position: int = 0
+        # Offset of buffer[0] within the whole input.
+        consumed: int = 0
+        exhausted: bool = False
+        chunks = self._read_chunks()
+
+        while True:
+            match = TOKEN_REGEX.match(buffer, position)
+            assert match is not None
+
+            # A match touching the end of the window may still grow (an
+            # identifier, a string, '=' before '='), so refill and retry.
+            if match.end() == len(buffer) and not exhausted:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    consumed += position
+                    buffer = buffer[position:] + chunk
+                    position = 0
 
-        self._read_character()
+                continue
+
+            position = match.end()
+            self.start = consumed + token_start(match)
+            token = token_from_match(match)
+
+            yield token
+
+            if token is EOF_TOKEN:
+                return
 
     def next_token(self) -> Token:
-        self._skip_whitespace()
-        token_dict = {
-            #"^=$": TokenType.ASSIGN,
-            "^\+$": TokenType.PLUS,
-            "^\($": TokenType.LPAREN,
-            "^\)$": TokenType.RPAREN,
-            "^{$": TokenType.LBRACE,
-            "^}$": TokenType.RBRACE,
-            "^,$": TokenType.COMMA,
-            "^;$": TokenType.SEMICOLON,
-            "^$": TokenType.EOF,
-            "^<$": TokenType.LT,
-            "^>$": TokenType.GT,
-            "^-$": TokenType.SUBSTRACT,
-            "^/$": TokenType.DIVIDE,
-            "^\*$": TokenType.MULTIPLICATION,
-            #"^!$": TokenType.DIFFERENT,
-        }
-
-        token = None
-
-        for regex, token_type in token_dict.items():
-            if match(regex, self._character):
-                token = Token(token_type, self._character)
-                break
-        
-        if match(r'^=$', self._character):
-            if self._peek_character() == '=':
-                token = self._make_two_character_token(TokenType.EQ)
-            else:
-                token = Token(TokenType.ASSIGN, self._character)
-        elif match(r'^!$', self._character):
-            if self._peek_character() == '=':
-                token = self._make_two_character_token(TokenType.NOT_EQ)
-            else:
-                token = Token(TokenType.DIFFERENT, self._character)
-        elif match(r'^"$', self._character):
-            literal = self._read_string()
-
-            return Token(TokenType.STRING, literal)
-
-        if token is None:
-            token = Token(TokenType.ILLEGAL, self._character)
-
-        if self._is_letter(self._character):
-            literal = self._read_identifier()
-            token_type = lookup_token_type(literal)
-            return Token(token_type, literal)
-        elif self._is_number(self._character):
-            literal = self._read_number()
-            return Token(TokenType.INT, literal)
-
-        self._read_character()
-
-        return token
-
-    def _is_letter(self, character: str) -> bool:
-        return bool(match(r'^[a-záéíóúA-ZÁÉÍÓÚñÑ_]$', character))
-
-    def _is_number(self, character: str) -> bool:
-        return bool(match(r'^\d$', character))
-
-    def _make_two_character_token(self, token_type: TokenType) -> Token:
-        prefix = self._character
-        self._read_character()
-        suffix = self._character
-
-        return Token(token_type, f'{prefix}{suffix}')
-
-    def _read_identifier(self) -> str:
-        initial_position = self._position
-
-        while self._is_letter(self._character) or self._is_number(self._character):
-            self._read_character()
-        
-        return self._source[initial_position:self._position]
-
-    def _read_number(self) -> str:
-        initial_position = self._position
-
-        while self._is_number(self._character):
-            self._read_character()
-
-        return self._source[initial_position:self._position]
-
-    def _read_string(self) -> str:
-        self._read_character()
-
-        initial_position = self._position
-
-        while self._character != '"' \
-                and self._read_position <= len(self._source):
-            self._read_character()
-
-        string = self._source[initial_position:self._position]
-
-        self._read_character()
-
-        return string
-
-    def _peek_character(self) -> str:
-        if self._read_position >= len(self._source):
-            return ''
-        
-        return self._source[self._read_position]
-
-    def _skip_whitespace(self) -> None:
-        while match(r'^\s$', self._character):
-            self._read_character()
-
-    def _read_character(self) -> None:
-        if self._read_position >= len(self._source):
-            self._character = ''
+        if self._tokens is None:
+            self._tokens = iter(self)
+
+        return next(self._tokens, EOF_TOKEN)
+
+    def _read_chunks(self) -> Iterator[str]:
+        if isinstance(self._source, (str, PathLike)):
+            with open(self._source, encoding=self._encoding, newline='') as stream:
+                yield from self._read_stream(stream)
+        elif isinstance(self._source, mmap):
+            yield from self._read_mmap(self._source)
         else:
-            self._character = self._source[self._read_position]
+            yield from self._read_stream(self._source)
+
+    def _read_mmap(self, source: mmap) -> Iterator[str]:
+        decoder = getincrementaldecoder(self._encoding)()
+
+        for offset in range(0, len(source), self._chunk_size):
+            if chunk := decoder.decode(source[offset:offset + self._chunk_size]):
+                yield chunk
+
+        if tail := decoder.decode(b'', final=True):
+            yield tail
+
+    def _read_stream(self, stream: Union[TextIO, BinaryIO]) -> Iterator[str]:
+        decoder = getincrementaldecoder(self._encoding)()
+
+        while chunk := stream.read(self._chunk_size):
+            if isinstance(chunk, bytes):
+                chunk = decoder.decode(chunk)
+
+            if chunk:
+                yield chunk
+
+        if tail := decoder.decode(b'', final=True):
+            yield tail
+
+
+_LITERAL_KINDS = frozenset(token_type.value for token_type in [
+    TokenType.IDENT,
+    TokenType.INT,
+    TokenType.STRING,
+    TokenType.ILLEGAL,
+])
+
+
+class TokenSource(Protocol):
+    # Source offset of the token last returned by next_token.
+    start: int
+
+    def next_token(self) -> Token: ...
+
+
+class TokenBuffer:
+
+    def __init__(self, source: str) -> None:
+        self.source: str = source
+        self.kinds: array = array('B')
+        self.starts: array = array('I')
+        self.ends: array = array('I')
+        self.literals: List[str] = []
+        self._line_starts: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> Token:
+        kind = self.kinds[index]
+
+        if kind in _LITERAL_KINDS:
+            return Token(TOKEN_TYPES[kind], self.literals[index])  # type: ignore
+
+        return _SHARED_TOKENS[self.literals[index]]
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.kinds)):
+            yield self[index]
+
+    def position(self, index: int) -> Tuple[int, int]:
+        if self._line_starts is None:
+            self._line_starts = [0]
+            newline = self.source.find('\n')
+            while newline != -1:
+                self._line_starts.append(newline + 1)
+                newline = self.source.find('\n', newline + 1)
+
+        offset = self.starts[index]
+        line = bisect_right(self._line_starts, offset)
+
+        return line, offset - self._line_starts[line - 1] + 1
+
+
+class TokenCursor:
+
+    # Tokens from stop onwards, when given, read as the end of the input.
+    def __init__(self, buffer: TokenBuffer, index: int = 0, stop: Optional[int] = None) -> None:
+        self.buffer = buffer
+        self.index = index
+        self.stop = stop
+        self.start = 0
+
+    def next_token(self) -> Token:
+        index = self.index
+        self.index = index + 1
+
+        if self.stop is not None and index >= self.stop:
+            self.start = self.buffer.ends[self.stop - 1]
+            return EOF_TOKEN
+
+        last = len(self.buffer.kinds) - 1
+        if index > last:
+            index = last
+
+        self.start = self.buffer.starts[index]
+        return self.buffer[index]
+
+
+_STRING_KIND = TokenType.STRING.value
+_NUMBER_KIND = TokenType.INT.value
+_IDENTIFIER_KIND = TokenType.IDENT.value
+_ILLEGAL_KIND = TokenType.ILLEGAL.value
+_EOF_KIND = TokenType.EOF.value
+_FIXED_KINDS: Dict[str, Tuple[int, str]] = {
+    lexeme: (token_type.value, lexeme) for lexeme, token_type in FIXED_TOKENS.items()
+}
+_KEYWORD_KINDS: Dict[str, int] = {literal: token_type.value for literal, token_type in KEYWORDS.items()}
+
+
+def scan(source: str, position: int = 0) -> Iterator[Tuple[int, int, int, str]]:
+    for match in TOKEN_REGEX.finditer(source, position):
+        group = match.lastgroup
+        end = match.end()
+
+        if group == 'identifier':
+            literal = match.group(group)
+            yield _KEYWORD_KINDS.get(literal, _IDENTIFIER_KIND), end - len(literal), end, intern(literal)
+        elif group == 'fixed':
+            kind, literal = _FIXED_KINDS[match.group(group)]
+            yield kind, end - len(literal), end, literal
+        elif group == 'number':
+            literal = match.group(group)
+            yield _NUMBER_KIND, end - len(literal), end, literal
+        elif group == 'string':
+            yield _STRING_KIND, match.start(group) - 1, end, match.group(group)
+        elif group == 'illegal':
+            yield _ILLEGAL_KIND, end - 1, end, match.group(group)
+        else:
+            yield _EOF_KIND, end, end, ''
+            return
+
+
+def tokenize(source: str) -> TokenBuffer:
+    buffer = TokenBuffer(source)
+    kinds = buffer.kinds
+    starts = buffer.starts
+    ends = buffer.ends
+    literals = buffer.literals
+
+    for kind, start, end, literal in scan(source):
+        kinds.append(kind)
+        starts.append(start)
+        ends.append(end)
+        literals.append(literal)
 
-        self._position = self._read_position
-        self._read_position += 1
\ No newline at end of file
+    return buffer
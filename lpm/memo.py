@@ -0,0 +1,42 @@
+from collections import OrderedDict
+from typing import (
+    Any,
+    Hashable,
+    Optional,
+)
+
+
+class Memo:
+
+    # The results of one pure procedimiento by argument values, least
+    # recently used first. version is the version of the global scope the
+    # entries were computed in: rebinding any global may change what the
+    # procedimiento calls, so the entries are dropped when it changes.
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.version = -1
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = value
+        if len(self._entries) > self.size:
+            self._entries.popitem(last=False)
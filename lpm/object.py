@@ -6,18 +6,24 @@ from enum import (
     auto,
     Enum,
 )
+from types import MappingProxyType
 
 from typing import (
+    Any,
     Dict,
     List,
+    Mapping,
+    Optional,
+    Protocol,
+    Union,
 )
 
 from lpm.ast import (
     Block,
     Identifier,
+    LazyBlock,
 )
-
-from typing_extensions import Protocol
+from lpm.memo import Memo
 
 
 class ObjectType(Enum):
@@ -42,37 +48,101 @@ class Object(ABC):
         pass
 
 
-class Environment(Dict):
+# Marks a Frame slot whose variable has not been assigned yet, and is the
+# default lookups return for missing names, since None is a value a variable
+# can hold.
+_UNSET = object()
+
+_EMPTY_STORE: Mapping[str, Any] = MappingProxyType({})
+
 
+class Environment:
+    __slots__ = ('_store', 'outer', 'version', '__weakref__')
+
+    # A scope whose variables are looked up by name: the global scope, which
+    # the REPL keeps between lines, and the calls of procedimientos the
+    # resolver has not seen. version counts the assignments made to it.
+    # Engines may key state of their own on it weakly.
     def __init__(self, outer = None):
         self._store = dict()
-        self._outer = outer
+        self.outer = outer
+        self.version = 0
 
     def __getitem__(self, key):
-        try:
-            return self._store[key]
-        except KeyError as e:
-            if self._outer is not None:
-                return self._outer[key]
+        value = self.get(key, _UNSET)
+        if value is _UNSET:
+            raise KeyError(key)
 
-            raise e
+        return value
 
     def __setitem__(self, key, value):
         self._store[key] = value
+        self.version += 1
 
     def __delitem__(self, key):
         del self._store[key]
+        self.version += 1
+
+    # Reads this scope only, with a default instead of a KeyError.
+    def local(self, key, default=None):
+        return self._store.get(key, default)
+
+    def get(self, key, default=None):
+        env = self
+        while env is not None:
+            value = env.local(key, _UNSET)
+            if value is not _UNSET:
+                return value
+            env = env.outer
+
+        return default
+
+
+class Frame(Environment):
+    __slots__ = ('values', 'slots')
+
+    # The scope of one call to a resolved procedimiento: values holds its
+    # parameters and variables at the slots the resolver gave them, and
+    # slots maps their names to those indexes for lookups by name. Nothing
+    # is stored by name, so every frame shares one empty, read-only store
+    # instead of making its own on each call.
+    def __init__(self, values: List[Any], slots: Dict[str, int], outer: Optional[Environment]) -> None:
+        self._store = _EMPTY_STORE
+        self.outer = outer
+        self.version = 0
+        self.values = values
+        self.slots = slots
+
+    def __setitem__(self, key, value):
+        self.values[self.slots[key]] = value
+
+    def __delitem__(self, key):
+        self.values[self.slots[key]] = _UNSET
+
+    def local(self, key, default=None):
+        slot = self.slots.get(key)
+        if slot is None or self.values[slot] is _UNSET:
+            return default
+
+        return self.values[slot]
 
 
 class Function(Object):
 
     def __init__(self,
                  parameters: List[Identifier],
-                 body: Block,
-                 env: Environment) -> None:
+                 body: Union[Block, LazyBlock],
+                 env: Environment,
+                 slots: Optional[Dict[str, int]] = None,
+                 memo: Optional[Memo] = None) -> None:
         self.parameters = parameters
         self.body = body
         self.env = env
+        self.slots = slots
+        self.memo = memo
+        # The lpm.typecheck.FunctionTypes of the literal, when evaluated after
+        # type inference.
+        self.types: Optional[Any] = None
 
     def type(self) -> ObjectType:
         return ObjectType.FUNCTION
@@ -0,0 +1,280 @@
+from typing import (
+    cast,
+    List,
+    Optional,
+    Union,
+)
+
+import lpm.ast as ast
+from lpm.evaluator import (
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _is_truthy,
+    FALSE,
+    TRUE,
+)
+from lpm.object import (
+    Error,
+    Integer,
+    Object,
+    String,
+)
+from lpm.token import (
+    Token,
+    TokenType,
+)
+
+Literal = Union[ast.Integer, ast.StringLiteral, ast.Boolean]
+
+_LITERALS = (ast.Integer, ast.StringLiteral, ast.Boolean)
+
+
+class OptimizationReport:
+
+    # changes describes every rewrite in the order it was made; the counters
+    # summarize them by kind.
+    def __init__(self) -> None:
+        self.folded = 0
+        self.pruned = 0
+        self.removed = 0
+        self.changes: List[str] = []
+
+    @property
+    def total(self) -> int:
+        return self.folded + self.pruned + self.removed
+
+
+def optimize(program: ast.Program) -> OptimizationReport:
+    report = OptimizationReport()
+    program.statements = _Optimizer(report).statements(program.statements)
+
+    return report
+
+
+class _Optimizer:
+
+    def __init__(self, report: OptimizationReport) -> None:
+        self._report = report
+
+    # Rewrites a list of statements that run one after the other in the same
+    # environment: the top level of a program or the body of a block.
+    def statements(self, statements: List[ast.Statement]) -> List[ast.Statement]:
+        result: List[ast.Statement] = []
+        pending = list(reversed(statements))
+
+        while len(pending) > 0:
+            statement = self._statement(pending.pop())
+
+            spliced = self._splice(statement, len(pending) == 0)
+            if spliced is not None:
+                pending.extend(reversed(spliced))
+                continue
+
+            result.append(statement)
+            if _always_returns(statement) and len(pending) > 0:
+                for unreachable in reversed(pending):
+                    self._report.removed += 1
+                    self._report.changes.append(f'código inalcanzable: {unreachable}')
+                break
+
+        return result
+
+    def _statement(self, statement: ast.Statement) -> ast.Statement:
+        statement_type = type(statement)
+
+        if statement_type == ast.ExpressionStatement:
+            statement = cast(ast.ExpressionStatement, statement)
+
+            assert statement.expression is not None
+            statement.expression = self._expression(statement.expression)
+        elif statement_type == ast.LetStatement:
+            statement = cast(ast.LetStatement, statement)
+
+            assert statement.value is not None
+            statement.value = self._expression(statement.value)
+        elif statement_type == ast.ReturnStatement:
+            statement = cast(ast.ReturnStatement, statement)
+
+            assert statement.return_value is not None
+            statement.return_value = self._expression(statement.return_value)
+
+        return statement
+
+    # A si statement with a constant condition is replaced by the statements
+    # of the branch it always takes, which run in the same environment. The
+    # branch must not be empty when the si is the last statement, because its
+    # value, None, would be replaced by that of the statement before it.
+    def _splice(self, statement: ast.Statement, last: bool) -> Optional[List[ast.Statement]]:
+        if type(statement) != ast.ExpressionStatement:
+            return None
+
+        expression = cast(ast.ExpressionStatement, statement).expression
+        if type(expression) != ast.If:
+            return None
+
+        expression = cast(ast.If, expression)
+        if not _is_literal(expression.condition):
+            return None
+
+        assert expression.consequence is not None
+        if _is_truthy(_to_object(cast(Literal, expression.condition))):
+            branch: Optional[ast.Block] = expression.consequence
+            kept = 'la consecuencia'
+        else:
+            branch = expression.alternative
+            kept = 'la alternativa' if branch is not None else 'nada'
+
+        statements = branch.statements if branch is not None else []
+        if last and len(statements) == 0:
+            return None
+
+        self._report.pruned += 1
+        self._report.changes.append(f'si {expression.condition}: se conserva {kept}')
+
+        return statements
+
+    def _expression(self, node: ast.Expression) -> ast.Expression:
+        node_type = type(node)
+
+        if node_type == ast.Infix:
+            node = cast(ast.Infix, node)
+
+            assert node.right is not None
+            node.left = self._expression(node.left)
+            node.right = self._expression(node.right)
+
+            return self._fold_infix(node)
+        elif node_type == ast.Prefix:
+            node = cast(ast.Prefix, node)
+
+            assert node.right is not None
+            node.right = self._expression(node.right)
+
+            return self._fold_prefix(node)
+        elif node_type == ast.If:
+            node = cast(ast.If, node)
+
+            assert node.condition is not None and node.consequence is not None
+            node.condition = self._expression(node.condition)
+            node.consequence.statements = self.statements(node.consequence.statements)
+            if node.alternative is not None:
+                node.alternative.statements = self.statements(node.alternative.statements)
+
+            return self._prune_if(node)
+        elif node_type == ast.Call:
+            node = cast(ast.Call, node)
+
+            assert node.arguments is not None
+            node.function = self._expression(node.function)
+            node.arguments = [self._expression(argument) for argument in node.arguments]
+        elif node_type == ast.Function:
+            node = cast(ast.Function, node)
+
+            # Lazily parsed bodies that have not run yet are left unparsed.
+            body = node.body
+            if type(body) == ast.Block:
+                body = cast(ast.Block, body)
+                body.statements = self.statements(body.statements)
+            elif type(body) == ast.LazyBlock and cast(ast.LazyBlock, body).parsed:
+                block = cast(ast.LazyBlock, body).parse()
+                block.statements = self.statements(block.statements)
+
+        return node
+
+    def _fold_infix(self, node: ast.Infix) -> ast.Expression:
+        if not _is_literal(node.left) or not _is_literal(node.right):
+            return node
+
+        right = _to_object(cast(Literal, node.right))
+        if node.operator == '/' and type(right) is Integer and cast(Integer, right).value == 0:
+            return node
+
+        return self._folded(node, _evaluate_infix_expression(node.operator,
+                                                             _to_object(cast(Literal, node.left)),
+                                                             right))
+
+    def _fold_prefix(self, node: ast.Prefix) -> ast.Expression:
+        if not _is_literal(node.right):
+            return node
+
+        return self._folded(node, _evaluate_prefix_expression(node.operator, _to_object(cast(Literal, node.right))))
+
+    # Results that are errors stay as the original node, so they are still
+    # reported when, and only if, the expression runs.
+    def _folded(self, node: ast.Expression, value: Object) -> ast.Expression:
+        if type(value) is Error:
+            return node
+
+        literal = _to_literal(value, node.start)
+        self._report.folded += 1
+        self._report.changes.append(f'{node} -> {literal}')
+
+        return literal
+
+    # In expression position a si can only be replaced when the branch it
+    # always takes is a single expression: its value is the value of the si.
+    def _prune_if(self, node: ast.If) -> ast.Expression:
+        if not _is_literal(node.condition):
+            return node
+
+        assert node.consequence is not None
+        if _is_truthy(_to_object(cast(Literal, node.condition))):
+            branch: Optional[ast.Block] = node.consequence
+        else:
+            branch = node.alternative
+
+        if branch is None or len(branch.statements) != 1 or type(branch.statements[0]) != ast.ExpressionStatement:
+            return node
+
+        expression = cast(ast.ExpressionStatement, branch.statements[0]).expression
+        assert expression is not None
+        self._report.pruned += 1
+        self._report.changes.append(f'si {node.condition}: {node} -> {expression}')
+
+        return expression
+
+
+def _is_literal(node: Optional[ast.Expression]) -> bool:
+    return type(node) in _LITERALS
+
+
+def _to_object(node: Literal) -> Object:
+    if type(node) == ast.Integer:
+        return Integer(cast(int, node.value))
+    elif type(node) == ast.StringLiteral:
+        return String(cast(ast.StringLiteral, node).value)
+
+    return TRUE if node.value else FALSE
+
+
+def _to_literal(value: Object, start: int) -> ast.Expression:
+    if type(value) is Integer:
+        number = cast(Integer, value).value
+
+        return ast.Integer(Token(TokenType.INT, str(number)), number, start)
+    elif type(value) is String:
+        text = cast(String, value).value
+
+        return ast.StringLiteral(Token(TokenType.STRING, text), text, start)
+    elif value is TRUE:
+        return ast.Boolean(Token(TokenType.TRUE, 'verdadero'), True, start)
+
+    return ast.Boolean(Token(TokenType.FALSE, 'falso'), False, start)
+
+
+def _always_returns(statement: ast.Statement) -> bool:
+    if type(statement) == ast.ReturnStatement:
+        return True
+    elif type(statement) != ast.ExpressionStatement:
+        return False
+
+    expression = cast(ast.ExpressionStatement, statement).expression
+    if type(expression) != ast.If:
+        return False
+
+    expression = cast(ast.If, expression)
+    if expression.consequence is None or expression.alternative is None:
+        return False
+
+    return (any(_always_returns(inner) for inner in expression.consequence.statements) and
+            any(_always_returns(inner) for inner in expression.alternative.statements))
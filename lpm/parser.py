@@ -14,22 +14,34 @@ from lpm.ast import (
     If,
     Function,
     Call,
+    LazyBlock,
     StringLiteral,
 )
-from lpm.lexer import Lexer
+from lpm.lexer import (
+    TokenBuffer,
+    TokenCursor,
+    TokenSource,
+)
 from lpm.token import (
     Token,
-    TokenType
+    TokenType,
+    TOKEN_TYPES,
 )
 
 from typing import (
+    Any,
+    cast,
     Optional,
     List,
     Callable,
     Dict,
+    Iterator,
+    Tuple,
+    Union,
 )
 
 from enum import IntEnum
+from functools import partial
 
 PrefixParseFn = Callable[[], Optional[Expression]]
 InfixParseFn = Callable[[Expression], Optional[Expression]]
@@ -60,25 +72,105 @@ PRECEDENCES: Dict[TokenType, Precedence] = {
 }
 
 
+# Precedences indexed by token kind (TokenType.value); tokens that are not
+# infix operators bind with the lowest precedence.
+PRECEDENCE_TABLE: List[Precedence] = [
+    PRECEDENCES.get(token_type, Precedence.LOWEST)  # type: ignore
+    for token_type in TOKEN_TYPES
+]
+
+_ASSIGN = TokenType.ASSIGN.value
+_COMMA = TokenType.COMMA.value
+_ELSE = TokenType.ELSE.value
+_EOF = TokenType.EOF.value
+_IDENT = TokenType.IDENT.value
+_LBRACE = TokenType.LBRACE.value
+_LET = TokenType.LET.value
+_LPAREN = TokenType.LPAREN.value
+_RBRACE = TokenType.RBRACE.value
+_RETURN = TokenType.RETURN.value
+_RPAREN = TokenType.RPAREN.value
+_SEMICOLON = TokenType.SEMICOLON.value
+_TRUE = TokenType.TRUE.value
+
+# Tokens that panic-mode recovery stops in front of.
+_SYNCHRONIZING_KINDS = frozenset([
+    TokenType.LET.value,
+    TokenType.RETURN.value,
+    TokenType.IF.value,
+    _RBRACE,
+    _EOF,
+])
+
+_UNBALANCED_BODY = 'Llaves desbalanceadas en el cuerpo del procedimiento'
+
+# Placeholder for the current and peek tokens until the first two reads.
+_NO_TOKEN: Token = Token(TokenType.ILLEGAL, '')
+
+# Constructs waiting on the operand being parsed by the iterative parser.
+_PREFIX, _INFIX, _GROUP, _ARGUMENT = range(4)
+
+
 class Parser:
-    def __init__(self, lexer: Lexer) -> None:
-        self._lexer = lexer
-        self._current_token: Optional[Token] = None
-        self._peek_token: Optional[Token] = None
+    def __init__(self,
+                 lexer: Union[TokenSource, TokenBuffer],
+                 iterative: bool = False,
+                 lazy: bool = False,
+                 validate: bool = False) -> None:
+        if isinstance(lexer, TokenBuffer):
+            lexer = TokenCursor(lexer)
+
+        self._lexer: TokenSource = lexer
+        self._iterative: bool = iterative
+        # Skimmed bodies are parsed later from the token buffer, so other
+        # token sources always parse function bodies eagerly.
+        self._lazy: bool = lazy and isinstance(lexer, TokenCursor)
+        self._validate: bool = validate
+        self._lazy_blocks: List[LazyBlock] = []
+        if self._lazy:
+            self._parse_lazy_body = partial(_parse_lazy_body,
+                                            cast(TokenCursor, lexer).buffer,
+                                            iterative,
+                                            validate)
+        self._current_token: Token = _NO_TOKEN
+        self._peek_token: Token = _NO_TOKEN
+        self._current_kind: int = _NO_TOKEN.token_type.value
+        self._peek_kind: int = _NO_TOKEN.token_type.value
+        self._current_start: int = -1
+        self._peek_start: int = -1
         self._errors: List[str] = []
+        # Set by the first error of a statement until recovery resyncs; the
+        # errors it would cascade into are not reported meanwhile.
+        self._panicking: bool = False
+        # Offset of the last closing brace a block consumed.
+        self._closed_brace: int = -1
 
         self._prefix_parse_fns: PrefixParseFns = self._register_prefix_fns()
         self._infix_parse_fns: InfixParseFns = self._register_infix_fns()
+        # Dense copies of the registered parse functions, indexed by token kind.
+        self._prefix_table: List[Optional[PrefixParseFn]] = [
+            self._prefix_parse_fns.get(token_type) for token_type in TOKEN_TYPES  # type: ignore
+        ]
+        self._infix_table: List[Optional[InfixParseFn]] = [
+            self._infix_parse_fns.get(token_type) for token_type in TOKEN_TYPES  # type: ignore
+        ]
+        # Token kinds whose parse functions the iterative mode unrolls.
+        self._pending_prefixes: List[Optional[int]] = [
+            _PREFIX if fn == self._parse_prefix_expression else
+            _GROUP if fn == self._parse_grouped_expression else None
+            for fn in self._prefix_table
+        ]
+        self._pending_infixes: List[Optional[int]] = [
+            _INFIX if fn == self._parse_infix_expression else
+            _ARGUMENT if fn == self._parse_call else None
+            for fn in self._infix_table
+        ]
 
         self._advance_tokens()
         self._advance_tokens()
 
     def _current_precedence(self) -> Precedence:
-        assert self._current_token is not None
-        try:
-            return PRECEDENCES[self._current_token.token_type]
-        except KeyError:
-            return Precedence.LOWEST
+        return PRECEDENCE_TABLE[self._current_kind]
 
     @property
     def errors(self) -> List[str]:
@@ -87,64 +179,114 @@ class Parser:
     def parse_program(self) -> Program:
         program: Program = Program(statements=[])
 
-        assert self._current_token is not None
-        while self._current_token.token_type != TokenType.EOF:
-            statement = self._parse_statement()
+        for statement in self.parse_statements():
             if statement is not None:
                 program.statements.append(statement)
 
-            self._advance_tokens()
+        if self._validate:
+            self._validate_lazy_blocks()
 
         return program
 
+    def parse_statements(self) -> Iterator[Optional[Statement]]:
+        while self._current_kind != _EOF:
+            statement = self._parse_statement()
+
+            if self._panicking:
+                self._synchronize()
+
+            self._advance_tokens()
+
+            yield statement
+
     def _advance_tokens(self) -> None:
         self._current_token = self._peek_token
-        self._peek_token = self._lexer.next_token()
+        self._current_kind = self._peek_kind
+        self._current_start = self._peek_start
+        self._peek_token = token = self._lexer.next_token()
+        # _value_ is the plain attribute behind the slower TokenType.value.
+        self._peek_kind = token.token_type._value_
+        self._peek_start = self._lexer.start
+
+    def _error(self, message: str) -> None:
+        if not self._panicking:
+            self._errors.append(message)
+            self._panicking = True
 
-    def _expected_token(self, token_type: TokenType) -> bool:
-        assert self._peek_token is not None
-        if self._peek_token.token_type == token_type:
+    def _expected_token(self, kind: int) -> bool:
+        if self._peek_kind == kind:
             self._advance_tokens()
 
             return True
         
-        self._expected_token_error(token_type)
+        self._expected_token_error(kind)
         return False
 
-    def _expected_token_error(self, token_type: TokenType) -> None:
-        assert self._peek_token is not None
-        error = f'Se esperaba que el siguiente token fuera {token_type}' + \
+    def _expected_token_error(self, kind: int) -> None:
+        error = f'Se esperaba que el siguiente token fuera {TOKEN_TYPES[kind]}' + \
                 f' pero se obtuvo {self._peek_token.token_type}'
 
-        self._errors.append(error)
+        self._error(error)
 
     def _parse_block(self) -> Block:
-        assert self._current_token is not None
         block_statement = Block(token=self._current_token,
-                                statements=[])
+                                statements=[],
+                                start=self._current_start)
 
         self._advance_tokens()
 
-        while not self._current_token.token_type == TokenType.RBRACE \
-                and not self._current_token.token_type == TokenType.EOF:
+        while not self._current_kind == _RBRACE \
+                and not self._current_kind == _EOF:
             statement = self._parse_statement()
 
             if statement:
                 block_statement.statements.append(statement)
 
+            # Recovery may stop on this block's closing brace.
+            if self._panicking and self._synchronize():
+                continue
+
             self._advance_tokens()
 
+        self._closed_brace = self._current_start
+
         return block_statement
 
-    def _parse_boolean(self) -> Boolean:
-        assert self._current_token is not None
+    # Panic-mode recovery after a statement reported an error: skip what is
+    # left of it up to a ';' or to just before a '}' or a statement keyword,
+    # stepping over brace pairs it opens. Returns whether it stopped on the
+    # closing brace of the enclosing block instead of on the last token of
+    # the statement.
+    def _synchronize(self) -> bool:
+        depth = 0
+        self._panicking = False
+
+        while True:
+            kind = self._current_kind
+            if kind == _EOF:
+                return True
+            elif kind == _LBRACE:
+                depth += 1
+            elif kind == _RBRACE and self._current_start != self._closed_brace:
+                if depth == 0:
+                    return True
+
+                depth -= 1
+            elif kind == _SEMICOLON and depth == 0:
+                return False
+
+            if depth == 0 and self._peek_kind in _SYNCHRONIZING_KINDS:
+                return False
 
+            self._advance_tokens()
+
+    def _parse_boolean(self) -> Boolean:
         return Boolean(token=self._current_token,
-                       value=self._current_token.token_type == TokenType.TRUE)
+                       value=self._current_kind == _TRUE,
+                       start=self._current_start)
 
     def _parse_call(self, function: Expression) -> Call:
-        assert self._current_token is not None
-        call = Call(self._current_token, function)
+        call = Call(self._current_token, function, start=self._current_start)
         call.arguments = self._parse_call_arguments()
 
         return call
@@ -152,8 +294,7 @@ class Parser:
     def _parse_call_arguments(self) -> Optional[List[Expression]]:
         arguments: List[Expression] = []
 
-        assert self._peek_token is not None
-        if self._peek_token.token_type == TokenType.RPAREN:
+        if self._peek_kind == _RPAREN:
             self._advance_tokens()
 
             return arguments
@@ -162,53 +303,170 @@ class Parser:
         if expression := self._parse_expression(Precedence.LOWEST):
             arguments.append(expression)
 
-        while self._peek_token.token_type == TokenType.COMMA:
+        while self._peek_kind == _COMMA:
             self._advance_tokens()
             self._advance_tokens()
 
             if expression := self._parse_expression(Precedence.LOWEST):
                 arguments.append(expression)
 
-        if not self._expected_token(TokenType.RPAREN):
+        if not self._expected_token(_RPAREN):
             return None
 
         return arguments
 
     def _parse_expression(self, precedence: Precedence) -> Optional[Expression]:
-        assert self._current_token is not None
-        try:
-            prefix_parse_fn = self._prefix_parse_fns[self._current_token.token_type]
-        except KeyError:
+        if self._iterative:
+            return self._parse_expression_iterative(precedence)
+
+        prefix_parse_fn = self._prefix_table[self._current_kind]
+        if prefix_parse_fn is None:
             message = f'No se encontró ninguna función para parsear {self._current_token.literal}'
-            self._errors.append(message)
+            self._error(message)
 
             return None
         
         left_expression = prefix_parse_fn()
 
-        assert self._peek_token is not None
-        while not self._peek_token.token_type == TokenType.SEMICOLON and \
-                precedence < self._peek_precedence():
-            try:
-                infix_parse_fn = self._infix_parse_fns[self._peek_token.token_type]
+        infix_table = self._infix_table
+        while not self._peek_kind == _SEMICOLON and \
+                precedence < PRECEDENCE_TABLE[self._peek_kind]:
+            infix_parse_fn = infix_table[self._peek_kind]
+            if infix_parse_fn is None:
+                return left_expression
 
-                self._advance_tokens()
+            # The operand already failed and reported its error; leave the
+            # rest of the statement to error recovery.
+            if left_expression is None:
+                return None
 
-                assert left_expression is not None
-                left_expression = infix_parse_fn(left_expression)
-            except KeyError:
-                return left_expression
+            self._advance_tokens()
+
+            left_expression = infix_parse_fn(left_expression)
 
         return left_expression
 
+    # Same steps as the recursive descent through _parse_expression and the
+    # prefix, grouped, infix and call parse functions, with the pending outer
+    # constructs kept on an explicit stack instead of Python frames.
+    def _parse_expression_iterative(self, precedence: Precedence) -> Optional[Expression]:
+        pending: List[Tuple[int, Any, Precedence]] = []
+        left: Optional[Expression] = None
+
+        while True:
+            prefix_parse_fn = self._prefix_table[self._current_kind]
+            if prefix_parse_fn is None:
+                message = f'No se encontró ninguna función para parsear {self._current_token.literal}'
+                self._error(message)
+
+                left = None
+                operand_done = True
+            else:
+                pending_kind = self._pending_prefixes[self._current_kind]
+                if pending_kind == _PREFIX:
+                    pending.append((_PREFIX, Prefix(token=self._current_token,
+                                                    operator=self._current_token.literal,
+                                                    start=self._current_start), precedence))
+                    self._advance_tokens()
+                    precedence = Precedence.PREFIX
+                    continue
+                elif pending_kind == _GROUP:
+                    pending.append((_GROUP, None, precedence))
+                    self._advance_tokens()
+                    precedence = Precedence.LOWEST
+                    continue
+
+                left = prefix_parse_fn()
+                operand_done = False
+
+            # Run the infix loop of the innermost expression; once it is done,
+            # hand its value to the construct waiting for it and resume the
+            # loop that construct belongs to.
+            descend = False
+            while not descend:
+                if not operand_done:
+                    operand_precedence, left = self._parse_infix_iterative(precedence, left, pending)
+                    if operand_precedence is not None:
+                        precedence = operand_precedence
+                        break
+
+                if not pending:
+                    return left
+
+                kind, node, precedence = pending.pop()
+                operand_done = False
+
+                if kind == _PREFIX or kind == _INFIX:
+                    node.right = left
+                    left = node
+                elif kind == _GROUP:
+                    if not self._expected_token(_RPAREN):
+                        left = None
+                else:
+                    call, arguments = node
+                    if left is not None:
+                        arguments.append(left)
+
+                    if self._peek_kind == _COMMA:
+                        self._advance_tokens()
+                        self._advance_tokens()
+
+                        pending.append((kind, node, precedence))
+                        precedence = Precedence.LOWEST
+                        descend = True
+                    else:
+                        call.arguments = arguments if self._expected_token(_RPAREN) else None
+                        left = call
+
+    def _parse_infix_iterative(self,
+                               precedence: Precedence,
+                               left: Optional[Expression],
+                               pending: List[Tuple[int, Any, Precedence]]
+                               ) -> Tuple[Optional[Precedence], Optional[Expression]]:
+        while not self._peek_kind == _SEMICOLON and \
+                precedence < PRECEDENCE_TABLE[self._peek_kind]:
+            infix_parse_fn = self._infix_table[self._peek_kind]
+            if infix_parse_fn is None:
+                return None, left
+
+            if left is None:
+                return None, None
+
+            pending_kind = self._pending_infixes[self._peek_kind]
+            self._advance_tokens()
+
+            if pending_kind == _ARGUMENT:
+                call = Call(self._current_token, left, start=self._current_start)
+
+                if self._peek_kind == _RPAREN:
+                    self._advance_tokens()
+                    call.arguments = []
+                    left = call
+                    continue
+
+                self._advance_tokens()
+                pending.append((_ARGUMENT, (call, []), precedence))
+                return Precedence.LOWEST, None
+            elif pending_kind == _INFIX:
+                infix = Infix(token=self._current_token,
+                              operator=self._current_token.literal,
+                              left=left,
+                              start=self._current_start)
+                operand_precedence = self._current_precedence()
+                self._advance_tokens()
+                pending.append((_INFIX, infix, precedence))
+                return operand_precedence, None
+
+            left = infix_parse_fn(left)
+
+        return None, left
+
     def _parse_expression_statement(self) -> Optional[ExpressionStatement]:
-        assert self._current_token is not None
-        expression_statement = ExpressionStatement(token=self._current_token)
+        expression_statement = ExpressionStatement(token=self._current_token, start=self._current_start)
 
         expression_statement.expression = self._parse_expression(Precedence.LOWEST)
 
-        assert self._peek_token is not None
-        if self._peek_token.token_type == TokenType.SEMICOLON:
+        if self._peek_kind == _SEMICOLON:
             self._advance_tokens()
 
         return expression_statement
@@ -218,86 +476,118 @@ class Parser:
 
         expression = self._parse_expression(Precedence.LOWEST)
 
-        if not self._expected_token(TokenType.RPAREN):
+        if not self._expected_token(_RPAREN):
             return None
 
         return expression
 
     def _parse_function(self) -> Optional[Function]:
-        assert self._current_token is not None
-        function = Function(token=self._current_token)
+        function = Function(token=self._current_token, start=self._current_start)
 
-        if not self._expected_token(TokenType.LPAREN):
+        if not self._expected_token(_LPAREN):
             return None
 
         function.parameters = self._parse_function_parameters()
 
-        if not self._expected_token(TokenType.LBRACE):
+        if not self._expected_token(_LBRACE):
             return None
 
-        function.body = self._parse_block()
+        function.body = self._skim_block() if self._lazy else self._parse_block()
 
         return function
 
 
+    def _skim_block(self) -> LazyBlock:
+        cursor = cast(TokenCursor, self._lexer)
+        kinds = cursor.buffer.kinds
+        first = cursor.index - 2
+
+        # Without a matching brace the body runs to the end of the input,
+        # as _parse_block does.
+        last = len(kinds) - 1
+        depth = 0
+        for index in range(first, len(kinds)):
+            kind = kinds[index]
+            if kind == _LBRACE:
+                depth += 1
+            elif kind == _RBRACE:
+                depth -= 1
+                if depth == 0:
+                    last = index
+                    break
+
+        block = LazyBlock(token=self._current_token,
+                          first=first,
+                          last=last,
+                          parse=self._parse_lazy_body,
+                          start=self._current_start,
+                          end=cursor.buffer.ends[last])
+        self._lazy_blocks.append(block)
+
+        cursor.index = last
+        self._advance_tokens()
+        self._advance_tokens()
+
+        return block
+
+    def _validate_lazy_blocks(self) -> None:
+        for block in self._lazy_blocks:
+            self._errors.extend(block.errors)
+
     def _parse_function_parameters(self) -> List[Identifier]:
         params: List[Identifier] = []
 
-        assert self._peek_token is not None
-        if self._peek_token.token_type == TokenType.RPAREN:
+        if self._peek_kind == _RPAREN:
             self._advance_tokens()
 
             return params
 
         self._advance_tokens()
 
-        assert self._current_token is not None
         identifier = Identifier(token=self._current_token,
-                                value=self._current_token.literal)
+                                value=self._current_token.literal,
+                                start=self._current_start)
         params.append(identifier)
 
-        while self._peek_token.token_type == TokenType.COMMA:
+        while self._peek_kind == _COMMA:
             self._advance_tokens()
             self._advance_tokens()
 
             identifier = Identifier(token=self._current_token,
-                                    value=self._current_token.literal)
+                                    value=self._current_token.literal,
+                                    start=self._current_start)
             params.append(identifier)
 
-        if not self._expected_token(TokenType.RPAREN):
+        if not self._expected_token(_RPAREN):
             return []
 
         return params
 
     def _parse_identifier(self) -> Identifier:
-        assert self._current_token is not None
-
-        return Identifier(token=self._current_token, value=self._current_token.literal)
+        return Identifier(token=self._current_token, value=self._current_token.literal, start=self._current_start)
 
     def _parse_if(self) -> Optional[If]:
-        assert self._current_token is not None
-        if_expression = If(token=self._current_token)
+        if_expression = If(token=self._current_token, start=self._current_start)
 
-        if not self._expected_token(TokenType.LPAREN):
+        if not self._expected_token(_LPAREN):
             return None
 
         self._advance_tokens()
 
         if_expression.condition = self._parse_expression(Precedence.LOWEST)
 
-        if not self._expected_token(TokenType.RPAREN):
+        if not self._expected_token(_RPAREN):
             return None
 
-        if not self._expected_token(TokenType.LBRACE):
+        if not self._expected_token(_LBRACE):
             return None
 
         if_expression.consequence = self._parse_block()
 
-        assert self._peek_token is not None
-        if self._peek_token.token_type == TokenType.ELSE:
+        if self._peek_kind == _ELSE:
             self._advance_tokens()
 
-            if not self._expected_token(TokenType.LBRACE):
+            if not self._expected_token(_LBRACE):
                 return None
 
             if_expression.alternative = self._parse_block()
@@ -305,10 +595,10 @@ class Parser:
         return if_expression
 
     def _parse_infix_expression(self, left: Expression) -> Infix:
-        assert self._current_token is not None
         infix = Infix(token=self._current_token,
                       operator=self._current_token.literal,
-                      left=left)
+                      left=left,
+                      start=self._current_start)
 
         precedence = self._current_precedence()
 
@@ -319,45 +609,41 @@ class Parser:
         return infix
 
     def _parse_integer(self) -> Optional[Integer]:
-        assert self._current_token is not None
-        integer = Integer(token=self._current_token)
-
         try:
-            integer.value = int(self._current_token.literal)
+            value = int(self._current_token.literal)
         except ValueError:
             message = f'No se ha podido parsear {self._current_token.literal}' + \
                         'como entero.'
-            self._errors.append(message)
+            self._error(message)
 
             return None
 
-        return integer
+        return Integer(token=self._current_token, value=value, start=self._current_start)
 
     def _parse_let_statement(self) -> Optional[LetStatement]:
-        assert self._current_token is not None
-        let_statement = LetStatement(token=self._current_token)
+        let_statement = LetStatement(token=self._current_token, start=self._current_start)
 
-        if not self._expected_token(TokenType.IDENT):
+        if not self._expected_token(_IDENT):
             return None
 
         let_statement.name = self._parse_identifier()
 
-        if not self._expected_token(TokenType.ASSIGN):
+        if not self._expected_token(_ASSIGN):
             return None
 
         self._advance_tokens()
 
         let_statement.value = self._parse_expression(Precedence.LOWEST)
 
-        assert self._peek_token is not None
-        if self._peek_token.token_type == TokenType.SEMICOLON:
+        if self._peek_kind == _SEMICOLON:
             self._advance_tokens()
 
         return let_statement
 
     def _parse_prefix_expression(self) -> Prefix:
-        assert self._current_token is not None
-        prefix_expression = Prefix(token=self._current_token, operator=self._current_token.literal)
+        prefix_expression = Prefix(token=self._current_token,
+                                   operator=self._current_token.literal,
+                                   start=self._current_start)
 
         self._advance_tokens()
 
@@ -366,38 +652,30 @@ class Parser:
         return prefix_expression
 
     def _parse_return_statement(self) -> Optional[ReturnStatement]:
-        assert self._current_token is not None
-        return_statement = ReturnStatement(token=self._current_token)
+        return_statement = ReturnStatement(token=self._current_token, start=self._current_start)
         
         self._advance_tokens()
 
         return_statement.return_value = self._parse_expression(Precedence.LOWEST)
 
-        assert self._peek_token is not None
-        if self._peek_token.token_type == TokenType.SEMICOLON:
+        if self._peek_kind == _SEMICOLON:
             self._advance_tokens()
 
         return return_statement
 
     def _parse_statement(self) -> Optional[Statement]:
-        assert self._current_token is not None
-        if self._current_token.token_type == TokenType.LET:
+        if self._current_kind == _LET:
             return self._parse_let_statement()
-        elif self._current_token.token_type == TokenType.RETURN:
+        elif self._current_kind == _RETURN:
             return self._parse_return_statement()
         else:
             return self._parse_expression_statement()
 
     def _parse_string_literal(self) -> Expression:
-        assert self._current_token is not None
-        return StringLiteral(token=self._current_token, value=self._current_token.literal)
+        return StringLiteral(token=self._current_token, value=self._current_token.literal, start=self._current_start)
 
     def _peek_precedence(self) -> Precedence:
-        assert self._peek_token is not None
-        try:
-            return PRECEDENCES[self._peek_token.token_type]
-        except KeyError:
-            return Precedence.LOWEST
+        return PRECEDENCE_TABLE[self._peek_kind]
 
     def _register_infix_fns(self) -> InfixParseFns:
         return {
@@ -424,4 +702,24 @@ class Parser:
             TokenType.IF: self._parse_if,
             TokenType.FUNCTION: self._parse_function,
             TokenType.STRING: self._parse_string_literal,
-        }
\ No newline at end of file
+        }
+
+
+def _parse_lazy_body(buffer: TokenBuffer,
+                     iterative: bool,
+                     validate: bool,
+                     first: int,
+                     last: int) -> Tuple[Block, List[str]]:
+    cursor = TokenCursor(buffer, first, last + 1)
+    parser = Parser(cursor, iterative=iterative, lazy=True, validate=validate)
+    block = parser._parse_block()
+
+    # The skim matched braces by counting them; a body that is malformed
+    # enough may close at a different one.
+    if cursor.index - 2 != last:
+        parser.errors.append(_UNBALANCED_BODY)
+
+    if validate:
+        parser._validate_lazy_blocks()
+
+    return block, parser.errors
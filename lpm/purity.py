@@ -0,0 +1,113 @@
+from collections import Counter
+from typing import (
+    cast,
+    Dict,
+    List,
+    Optional,
+)
+
+import lpm.ast as ast
+from lpm.builtins import PURE_BUILTINS
+from lpm.resolver import (
+    _collect,
+    BUILTIN,
+    GLOBAL,
+)
+
+DEFAULT_MEMO_SIZE = 256
+
+
+# Marks the procedimientos of the program whose calls can be memoized, giving
+# them memo_size, and returns their names. Those are the procedimiento
+# literals bound once by a top-level variable whose bodies, nested literals
+# included, only read their own variables, pure builtins and other such
+# procedimientos. Their results then only depend on their arguments.
+def analyze(program: ast.Program, memo_size: int = DEFAULT_MEMO_SIZE) -> List[str]:
+    candidates = _candidates(program)
+
+    # Procedimientos that call each other are assumed pure until one of them
+    # turns out not to be.
+    pure = dict(candidates)
+    changed = True
+    while changed:
+        changed = False
+        for name, function in list(pure.items()):
+            if not _is_pure(function, pure):
+                del pure[name]
+                changed = True
+
+    for name, function in candidates.items():
+        function.memo_size = memo_size if name in pure else 0
+
+    return sorted(pure)
+
+
+# The procedimiento literals bound by a top-level variable that the program
+# defines once, by name.
+def _candidates(program: ast.Program) -> Dict[str, ast.Function]:
+    names: List[str] = []
+    for statement in program.statements:
+        _collect(statement, names)
+    counts = Counter(names)
+
+    candidates: Dict[str, ast.Function] = {}
+    for statement in program.statements:
+        if type(statement) == ast.LetStatement:
+            let = cast(ast.LetStatement, statement)
+
+            assert let.name is not None
+            if type(let.value) == ast.Function and counts[let.name.value] == 1:
+                candidates[let.name.value] = cast(ast.Function, let.value)
+
+    return candidates
+
+
+def _is_pure(node: Optional[ast.ASTNode], pure: Dict[str, ast.Function]) -> bool:
+    node_type = type(node)
+
+    if node_type == ast.Identifier:
+        node = cast(ast.Identifier, node)
+
+        if node.depth is None:
+            return False
+        elif node.depth == GLOBAL:
+            return node.value in pure
+        elif node.depth == BUILTIN:
+            return node.value in PURE_BUILTINS
+
+        return node.depth >= 0
+    elif node_type == ast.Function:
+        node = cast(ast.Function, node)
+
+        # Bodies the resolver has not seen may read anything.
+        if type(node.body) != ast.Block:
+            return False
+
+        return _is_pure(node.body, pure)
+    elif node_type == ast.Block:
+        return all(_is_pure(statement, pure) for statement in cast(ast.Block, node).statements)
+    elif node_type == ast.ExpressionStatement:
+        return _is_pure(cast(ast.ExpressionStatement, node).expression, pure)
+    elif node_type == ast.LetStatement:
+        return _is_pure(cast(ast.LetStatement, node).value, pure)
+    elif node_type == ast.ReturnStatement:
+        return _is_pure(cast(ast.ReturnStatement, node).return_value, pure)
+    elif node_type == ast.If:
+        node = cast(ast.If, node)
+
+        return (_is_pure(node.condition, pure)
+                and _is_pure(node.consequence, pure)
+                and (node.alternative is None or _is_pure(node.alternative, pure)))
+    elif node_type == ast.Prefix:
+        return _is_pure(cast(ast.Prefix, node).right, pure)
+    elif node_type == ast.Infix:
+        node = cast(ast.Infix, node)
+
+        return _is_pure(node.left, pure) and _is_pure(node.right, pure)
+    elif node_type == ast.Call:
+        node = cast(ast.Call, node)
+
+        return (_is_pure(node.function, pure)
+                and all(_is_pure(argument, pure) for argument in node.arguments or []))
+
+    return node_type in (ast.Integer, ast.Boolean, ast.StringLiteral)
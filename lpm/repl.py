@@ -1,10 +1,30 @@
-from typing import List
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+from lpm import (
+    closures,
+    transpiler,
+    unboxed,
+    vm,
+)
 from lpm.ast import Program
 
-from lpm.lexer import Lexer
-from lpm.object import Environment
+from lpm.lexer import (
+    Lexer,
+    tokenize,
+)
+from lpm.object import (
+    Environment,
+    Object,
+)
 from lpm.parser import Parser
-from lpm.evaluator import evaluate
+from lpm.evaluator import (
+    evaluate,
+    evaluate_iterative,
+)
 from lpm.token import (
     Token,
     TokenType,
@@ -12,26 +32,82 @@ from lpm.token import (
 
 EOF_TOKEN: Token = Token(TokenType.EOF, '')
 
+_OPENING = {TokenType.LBRACE.value, TokenType.LPAREN.value}
+_CLOSING = {TokenType.RBRACE.value, TokenType.RPAREN.value}
+
+Engine = Callable[[Program, Environment], Optional[Object]]
+
+# The ways of running a parsed program, selected by name with --engine.
+ENGINES: Dict[str, Engine] = {
+    'evaluator': evaluate,
+    'iterative': evaluate_iterative,
+    'unboxed': unboxed.execute,
+    'closures': closures.execute,
+    'vm': vm.execute,
+    'transpiler': transpiler.execute,
+}
+
+
+class Session:
+
+    def __init__(self, engine: str = 'evaluator') -> None:
+        self.engine: Engine = ENGINES[engine]
+        self.env: Environment = Environment()
+        self.history: List[str] = []
+        self.errors: List[str] = []
+
+    def execute(self, source: str) -> Optional[Object]:
+        parser: Parser = Parser(Lexer(source))
+        program: Program = parser.parse_program()
+
+        self.errors = parser.errors
+        if len(self.errors) > 0:
+            return None
+
+        self.history.append(source)
+
+        return self.engine(program, self.env)
+
+    def rebuild(self) -> None:
+        self.env = Environment()
+
+        for source in self.history:
+            self.engine(Parser(Lexer(source)).parse_program(), self.env)
+
+
+def is_complete(source: str) -> bool:
+    depth: int = 0
+
+    for kind in tokenize(source).kinds:
+        if kind in _OPENING:
+            depth += 1
+        elif kind in _CLOSING:
+            depth -= 1
+
+    return depth <= 0
+
+
 def _print_parse_errors(errors: List[str]):
     for error in errors:
         print(error)
 
-def start_repl() -> None:
-    scanned: List[str] = []
-
-    while (source := input('>> ')) != 'salir()':
-        scanned.append(source)
-        lexer: Lexer = Lexer(' '.join(scanned))
-        parser: Parser = Parser(lexer)
+def start_repl(engine: str = 'evaluator') -> None:
+    session: Session = Session(engine)
+    pending: List[str] = []
 
-        program: Program = parser.parse_program()
-        env: Environment = Environment()
+    while (source := input('.. ' if pending else '>> ')) != 'salir()':
+        pending.append(source)
 
-        if len(parser.errors) > 0:
-            _print_parse_errors(parser.errors)
+        source = ' '.join(pending)
+        if not is_complete(source):
             continue
 
-        evaluated = evaluate(program, env)
+        pending.clear()
+        evaluated = session.execute(source)
+
+        if len(session.errors) > 0:
+            _print_parse_errors(session.errors)
+            continue
 
         if evaluated is not None:
-            print(evaluated.inspect())
\ No newline at end of file
+            print(evaluated.inspect())
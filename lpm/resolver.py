@@ -0,0 +1,183 @@
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+import lpm.ast as ast
+from lpm.builtins import BUILTINS
+
+# Identifiers that are not declared by any enclosing procedimiento get one of
+# these instead of a depth: top-level variables of the program, builtins that
+# nothing in the program shadows, and names that are neither. All three are
+# still looked up in the global scope first, where an earlier program run in
+# the same environment may have defined them.
+GLOBAL = -1
+BUILTIN = -2
+UNKNOWN = -3
+
+
+class _Scope:
+
+    # The slots of one procedimiento literal: its parameters, then every
+    # variable its body may define, including those in nested si blocks.
+    def __init__(self, parent: Optional['_Scope']) -> None:
+        self.parent = parent
+        self.slots: Dict[str, int] = {}
+
+    def declare(self, name: str) -> int:
+        if name not in self.slots:
+            self.slots[name] = len(self.slots)
+
+        return self.slots[name]
+
+
+def resolve(program: ast.Program) -> None:
+    names: List[str] = []
+    for statement in program.statements:
+        _collect(statement, names)
+
+    _Resolver(set(names)).statements(program.statements, None)
+
+
+# Appends the names a statement may define in the environment it runs in;
+# procedimiento bodies define theirs in their own. Like the resolver, it walks
+# with an explicit stack so that deeply nested expressions do not exhaust
+# Python's.
+def _collect(node: Optional[ast.ASTNode], names: List[str]) -> None:
+    stack: List[Optional[ast.ASTNode]] = [node]
+
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+
+        if node_type == ast.LetStatement:
+            node = cast(ast.LetStatement, node)
+
+            assert node.name is not None
+            names.append(node.name.value)
+            stack.append(node.value)
+        elif node_type == ast.ReturnStatement:
+            stack.append(cast(ast.ReturnStatement, node).return_value)
+        elif node_type == ast.ExpressionStatement:
+            stack.append(cast(ast.ExpressionStatement, node).expression)
+        elif node_type == ast.Block:
+            stack.extend(reversed(cast(ast.Block, node).statements))
+        elif node_type == ast.If:
+            node = cast(ast.If, node)
+
+            stack.extend((node.alternative, node.consequence, node.condition))
+        elif node_type == ast.Prefix:
+            stack.append(cast(ast.Prefix, node).right)
+        elif node_type == ast.Infix:
+            node = cast(ast.Infix, node)
+
+            stack.extend((node.right, node.left))
+        elif node_type == ast.Call:
+            node = cast(ast.Call, node)
+
+            stack.extend(reversed(node.arguments or []))
+            stack.append(node.function)
+
+
+class _Restore:
+    __slots__ = ('scope',)
+
+    def __init__(self, scope: Optional[_Scope]) -> None:
+        self.scope = scope
+
+
+class _Resolver:
+
+    def __init__(self, globals_: Set[str]) -> None:
+        self._globals = globals_
+
+    # Walks with an explicit stack, so that deeply nested expressions do not
+    # exhaust Python's. A procedimiento body is pushed above a _Restore of
+    # the scope around it, which the walk returns to once past the body.
+    def statements(self, statements: List[ast.Statement], scope: Optional[_Scope]) -> None:
+        stack: List[Any] = list(reversed(statements))
+
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+
+            if node_type == ast.Identifier:
+                self._identifier(node, scope)
+            elif node_type == ast.Infix:
+                stack.append(node.right)
+                stack.append(node.left)
+            elif node_type == ast.Call:
+                if node.arguments:
+                    stack.extend(reversed(node.arguments))
+                stack.append(node.function)
+            elif node_type == ast.ExpressionStatement:
+                stack.append(node.expression)
+            elif node_type == ast.If:
+                stack.append(node.alternative)
+                stack.append(node.consequence)
+                stack.append(node.condition)
+            elif node_type == ast.Block:
+                stack.extend(reversed(node.statements))
+            elif node_type == ast.ReturnStatement:
+                stack.append(node.return_value)
+            elif node_type == ast.LetStatement:
+                assert node.name is not None
+                stack.append(node.value)
+                if scope is None:
+                    node.depth, node.slot = GLOBAL, -1
+                else:
+                    node.depth, node.slot = 0, scope.slots[node.name.value]
+            elif node_type == ast.Prefix:
+                stack.append(node.right)
+            elif node_type == ast.Function:
+                body_scope = self._function(node, scope)
+                if body_scope is not None:
+                    stack.append(_Restore(scope))
+                    stack.extend(reversed(node.body.statements))
+                    scope = body_scope
+            elif node_type == _Restore:
+                scope = node.scope
+
+    # Lazily parsed bodies are not resolved, so resolving does not parse them;
+    # their calls get an Environment and look names up by name. Neither are
+    # bodies parsed by an earlier run, which may have made functions whose
+    # calls already use an Environment. Returns the scope of the body to
+    # resolve, if any.
+    def _function(self, node: ast.Function, parent: Optional[_Scope]) -> Optional[_Scope]:
+        if type(node.body) != ast.Block:
+            return None
+
+        block = cast(ast.Block, node.body)
+        scope = _Scope(parent)
+        for parameter in node.parameters:
+            parameter.depth, parameter.slot = 0, scope.declare(parameter.value)
+
+        names: List[str] = []
+        for statement in block.statements:
+            _collect(statement, names)
+        for name in names:
+            scope.declare(name)
+
+        node.slots = scope.slots
+        return scope
+
+    def _identifier(self, node: ast.Identifier, scope: Optional[_Scope]) -> None:
+        depth = 0
+        while scope is not None:
+            if node.value in scope.slots:
+                node.depth, node.slot = depth, scope.slots[node.value]
+                return
+            depth += 1
+            scope = scope.parent
+
+        node.slot = -1
+        if node.value in self._globals:
+            node.depth = GLOBAL
+        elif node.value in BUILTINS:
+            node.depth = BUILTIN
+        else:
+            node.depth = UNKNOWN
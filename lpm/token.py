@@ -6,6 +6,8 @@ from enum import (
 from typing import (
     NamedTuple,
     Dict,
+    List,
+    Optional,
 )
 
 @unique
@@ -39,6 +41,11 @@ class TokenType(Enum):
     TRUE = auto()
     STRING = auto()
 
+# TokenType members indexed by their integer value (auto() numbers them from
+# 1 in definition order), for code that stores token kinds as plain integers.
+TOKEN_TYPES: List[Optional[TokenType]] = [None, *TokenType]
+
+
 class Token(NamedTuple):
     token_type: TokenType
     literal: str
@@ -47,15 +54,16 @@ class Token(NamedTuple):
         return f'Type: {self.token_type} Literal: {self.literal}'
 
 
+KEYWORDS: Dict[str, TokenType] = {
+    'variable': TokenType.LET,
+    'procedimiento': TokenType.FUNCTION,
+    'si': TokenType.IF,
+    'falso': TokenType.FALSE,
+    'regresa': TokenType.RETURN,
+    'si_no': TokenType.ELSE,
+    'verdadero': TokenType.TRUE,
+}
+
+
 def lookup_token_type(literal: str) -> TokenType:
-    keywords: Dict[str, TokenType] = {
-        'variable': TokenType.LET,
-        'procedimiento': TokenType.FUNCTION,
-        'si': TokenType.IF,
-        'falso': TokenType.FALSE,
-        'regresa': TokenType.RETURN,
-        'si_no': TokenType.ELSE,
-        'verdadero': TokenType.TRUE,
-    }
-
-    return keywords.get(literal, TokenType.IDENT)
\ No newline at end of file
+    return KEYWORDS.get(literal, TokenType.IDENT)
\ No newline at end of file
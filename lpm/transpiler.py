@@ -0,0 +1,504 @@
+import ast as pyast
+from types import (
+    CodeType,
+    FunctionType,
+)
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from warnings import (
+    catch_warnings,
+    simplefilter,
+)
+from weakref import WeakKeyDictionary
+
+import lpm.ast as ast
+from lpm.builtins import BUILTINS
+from lpm.evaluator import (
+    evaluate,
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpm.object import (
+    Builtin,
+    Environment,
+    Error,
+    Function,
+    Integer,
+    Object,
+    String,
+    _UNSET,
+)
+
+# LPM programs become one Python function, _programa, whose top-level
+# variables are globals of the namespace it runs in. Integers and strings
+# are plain Python values; booleans and nulo stay the evaluator's TRUE, FALSE
+# and NULL objects, so Python never mixes them with numbers. Whatever would
+# make the evaluator produce an Error (an unknown name, mismatched types, a
+# bad builtin call) raises in Python instead, and the program is run again
+# by the evaluator, which reports the error with its usual message.
+
+_PROGRAM = '_programa'
+_LITERALS = '_literales'
+_LITERAL = 'literal'
+_PREFIX = 'v_'
+_MAX_CACHED_PROGRAMS = 256
+
+
+class _Untranslatable(Exception):
+    pass
+
+
+class _Fallback(Exception):
+    pass
+
+
+class TranspiledFunction(Function):
+
+    def __init__(self, node: ast.Function, function: FunctionType, env: Environment) -> None:
+        assert node.body is not None
+        super().__init__(node.parameters, node.body, env, node.slots)
+        self.function = function
+
+
+# functions holds the procedimiento literals of the program given to
+# transpile, which _programa takes as its argument and tags its Python
+# functions with. Programs that translate alike share the rest.
+class Translation(NamedTuple):
+    code: CodeType
+    names: List[str]
+    assigned: List[str]
+    functions: List[ast.Function]
+
+
+def _not(value: Any) -> Object:
+    return TRUE if value is FALSE or value is NULL else FALSE
+
+
+def _truthy(value: Any) -> bool:
+    return value is not FALSE and value is not NULL
+
+
+def _integers(left: Any, right: Any) -> None:
+    if type(left) is not int or type(right) is not int:
+        raise _Fallback()
+
+
+def _multiply(left: Any, right: Any) -> int:
+    _integers(left, right)
+
+    return left * right
+
+
+def _less(left: Any, right: Any) -> bool:
+    _integers(left, right)
+
+    return left < right
+
+
+def _greater(left: Any, right: Any) -> bool:
+    _integers(left, right)
+
+    return left > right
+
+
+_RUNTIME: Dict[str, Any] = {
+    '_TRUE': TRUE,
+    '_FALSE': FALSE,
+    '_NULL': NULL,
+    '_not': _not,
+    '_truthy': _truthy,
+    '_multiply': _multiply,
+    '_less': _less,
+    '_greater': _greater,
+}
+
+_ARITHMETIC: Dict[str, pyast.operator] = {
+    '+': pyast.Add(),
+    '-': pyast.Sub(),
+    '/': pyast.FloorDiv(),
+}
+
+_COMPARISONS: Dict[str, pyast.cmpop] = {
+    '<': pyast.Lt(),
+    '>': pyast.Gt(),
+    '==': pyast.Eq(),
+    '!=': pyast.NotEq(),
+}
+
+_CHECKED_COMPARISONS: Dict[str, str] = {
+    '<': '_less',
+    '>': '_greater',
+}
+
+_programs: Dict[str, Translation] = {}
+# The namespace the programs run in each environment share, and the names of
+# the globals their code reads. Transpiled functions keep reading it after
+# their program has run, so it is synced with the environment, which the
+# evaluator may have changed since, before every run.
+_namespaces: WeakKeyDictionary[Environment, Tuple[Dict[str, Any], Set[str]]] = WeakKeyDictionary()
+
+
+def execute(program: ast.Program, env: Environment) -> Optional[Object]:
+    namespace, names = _namespace(env)
+    try:
+        translation = transpile(program)
+    except _Untranslatable:
+        return _fall_back(program, env, namespace, names)
+
+    names.update(translation.names)
+    _sync(namespace, names, env)
+    try:
+        exec(translation.code, namespace)
+        result = namespace[_PROGRAM](translation.functions)
+    except (NameError, TypeError, _Fallback):
+        return _fall_back(program, env, namespace, names)
+
+    for name in translation.assigned:
+        if _PREFIX + name in namespace:
+            env[name] = _to_object(namespace[_PREFIX + name], env)
+
+    return _to_object(result, env)
+
+
+# Runs the program with the evaluator, whose assignments the namespace then
+# gets, in place of any a partial run made.
+def _fall_back(program: ast.Program,
+               env: Environment,
+               namespace: Dict[str, Any],
+               names: Set[str]) -> Optional[Object]:
+    evaluated = evaluate(program, env)
+    _sync(namespace, names, env)
+
+    return evaluated
+
+
+def transpile(program: ast.Program) -> Translation:
+    translator = _Translator()
+    module = translator.program(program)
+    key = pyast.dump(module)
+
+    if key not in _programs:
+        if len(_programs) >= _MAX_CACHED_PROGRAMS:
+            del _programs[next(iter(_programs))]
+
+        with catch_warnings():
+            # Calls on literals such as 5() fail at run time, and fall back.
+            simplefilter('ignore', SyntaxWarning)
+            code = compile(module, '<lpm>', 'exec')
+        _programs[key] = Translation(code, sorted(translator.names), sorted(translator.assigned), [])
+
+    return _programs[key]._replace(functions=translator.functions)
+
+
+def _namespace(env: Environment) -> Tuple[Dict[str, Any], Set[str]]:
+    entry = _namespaces.get(env)
+    if entry is None:
+        namespace: Dict[str, Any] = {'__builtins__': {}}
+        namespace.update(_RUNTIME)
+        entry = _namespaces[env] = (namespace, set())
+
+    return entry
+
+
+# Globals with no Python value are left out of the namespace: code reading
+# them raises NameError, and its program falls back to the evaluator.
+def _sync(namespace: Dict[str, Any], names: Set[str], env: Environment) -> None:
+    for name in names:
+        value = env.get(name, _UNSET)
+        if value is _UNSET:
+            if name in BUILTINS:
+                namespace[_PREFIX + name] = _wrap_builtin(BUILTINS[name])
+            else:
+                namespace.pop(_PREFIX + name, None)
+        elif type(value) is TranspiledFunction and cast(TranspiledFunction, value).function.__globals__ is not namespace:
+            namespace.pop(_PREFIX + name, None)
+        else:
+            try:
+                namespace[_PREFIX + name] = _to_python(value)
+            except _Fallback:
+                namespace.pop(_PREFIX + name, None)
+
+
+def _to_python(value: Object) -> Any:
+    value_type = type(value)
+
+    if value_type is Integer:
+        return cast(Integer, value).value
+    elif value_type is String:
+        return cast(String, value).value
+    elif value is TRUE or value is FALSE or value is NULL:
+        return value
+    elif value_type is TranspiledFunction:
+        return cast(TranspiledFunction, value).function
+    elif value_type is Builtin:
+        return _wrap_builtin(cast(Builtin, value))
+
+    raise _Fallback()
+
+
+def _to_object(value: Any, env: Environment) -> Optional[Object]:
+    value_type = type(value)
+
+    if value_type is int:
+        return Integer(value)
+    elif value_type is str:
+        return String(value)
+    elif value_type is FunctionType and hasattr(value, _LITERAL):
+        return TranspiledFunction(getattr(value, _LITERAL), value, env)
+    elif value_type is FunctionType and hasattr(value, 'builtin'):
+        return value.builtin
+
+    return value
+
+
+def _wrap_builtin(builtin: Builtin) -> Callable[..., Any]:
+    def call(*args: Any) -> Any:
+        result = builtin.fn(*[cast(Object, _to_object(arg, Environment())) for arg in args])
+        if type(result) is Error:
+            raise _Fallback()
+
+        return _to_python(result)
+
+    setattr(call, 'builtin', builtin)
+
+    return call
+
+
+def _name(name: str, context: pyast.expr_context = pyast.Load()) -> pyast.Name:
+    return pyast.Name(id=name, ctx=context)
+
+
+def _call(function: str, args: List[pyast.expr]) -> pyast.Call:
+    return pyast.Call(func=_name(function), args=args, keywords=[])
+
+
+def _function_def(name: str, parameters: List[str], body: List[pyast.stmt]) -> pyast.FunctionDef:
+    definition = pyast.FunctionDef(
+        name=name,
+        args=pyast.arguments(posonlyargs=[],
+                             args=[pyast.arg(arg=parameter) for parameter in parameters],
+                             kwonlyargs=[],
+                             kw_defaults=[],
+                             defaults=[]),
+        body=body,
+        decorator_list=[],
+        returns=None)
+    if 'type_params' in pyast.FunctionDef._fields:
+        setattr(definition, 'type_params', [])
+
+    return definition
+
+
+class _Translator:
+
+    def __init__(self) -> None:
+        self.functions: List[ast.Function] = []
+        self.names: Set[str] = set()
+        self.assigned: Set[str] = set()
+
+    def program(self, program: ast.Program) -> pyast.Module:
+        body = self._block(program.statements, True, True)
+        if len(self.assigned) > 0:
+            body.insert(0, pyast.Global(names=sorted(_PREFIX + name for name in self.assigned)))
+
+        module = pyast.Module(body=[_function_def(_PROGRAM, [_LITERALS], body)], type_ignores=[])
+
+        return pyast.fix_missing_locations(module)
+
+    # tail marks the statements whose value is the value of the whole body;
+    # those return it.
+    def _block(self, statements: List[ast.Statement], tail: bool, top: bool) -> List[pyast.stmt]:
+        body: List[pyast.stmt] = []
+
+        for idx, statement in enumerate(statements):
+            self._statement(statement, tail and idx == len(statements) - 1, top, body)
+
+        if tail and len(statements) == 0:
+            body.append(pyast.Return(value=pyast.Constant(value=None)))
+
+        return body
+
+    def _statement(self, statement: ast.Statement, tail: bool, top: bool, body: List[pyast.stmt]) -> None:
+        statement_type = type(statement)
+
+        if statement_type == ast.LetStatement:
+            statement = cast(ast.LetStatement, statement)
+
+            if statement.name is None or statement.value is None:
+                raise _Untranslatable()
+            value = self._expression(statement.value, body)
+            if top:
+                self.assigned.add(statement.name.value)
+            body.append(pyast.Assign(targets=[_name(_PREFIX + statement.name.value, pyast.Store())], value=value))
+            if tail:
+                body.append(pyast.Return(value=pyast.Constant(value=None)))
+        elif statement_type == ast.ReturnStatement:
+            statement = cast(ast.ReturnStatement, statement)
+
+            if statement.return_value is None:
+                raise _Untranslatable()
+            body.append(pyast.Return(value=self._expression(statement.return_value, body)))
+        elif statement_type == ast.ExpressionStatement:
+            expression = cast(ast.ExpressionStatement, statement).expression
+
+            if expression is None:
+                raise _Untranslatable()
+            elif type(expression) == ast.If:
+                body.append(self._if_statement(cast(ast.If, expression), tail, top, body))
+            elif tail:
+                body.append(pyast.Return(value=self._expression(expression, body)))
+            else:
+                body.append(pyast.Expr(value=self._expression(expression, body)))
+        else:
+            raise _Untranslatable()
+
+    def _if_statement(self, node: ast.If, tail: bool, top: bool, body: List[pyast.stmt]) -> pyast.If:
+        if node.condition is None or node.consequence is None:
+            raise _Untranslatable()
+
+        test = self._condition(node.condition, body)
+        consequence = self._block(node.consequence.statements, tail, top)
+        if node.alternative is not None:
+            alternative = self._block(node.alternative.statements, tail, top)
+        elif tail:
+            alternative = [pyast.Return(value=_name('_NULL'))]
+        else:
+            alternative = []
+
+        return pyast.If(test=test, body=consequence or [pyast.Pass()], orelse=alternative)
+
+    # Function literals are hoisted into definitions in front of the
+    # statement that uses them; creating one has no other effect.
+    def _expression(self, node: ast.Expression, body: List[pyast.stmt]) -> pyast.expr:
+        node_type = type(node)
+
+        if node_type == ast.Identifier:
+            name = cast(ast.Identifier, node).value
+            self.names.add(name)
+
+            return _name(_PREFIX + name)
+        elif node_type == ast.Integer:
+            return pyast.Constant(value=cast(ast.Integer, node).value)
+        elif node_type == ast.StringLiteral:
+            return pyast.Constant(value=cast(ast.StringLiteral, node).value)
+        elif node_type == ast.Boolean:
+            return _name('_TRUE' if cast(ast.Boolean, node).value else '_FALSE')
+        elif node_type == ast.Infix:
+            node = cast(ast.Infix, node)
+
+            if node.operator in _COMPARISONS:
+                return pyast.IfExp(test=self._condition(node, body), body=_name('_TRUE'), orelse=_name('_FALSE'))
+            elif node.right is None:
+                raise _Untranslatable()
+
+            left = self._expression(node.left, body)
+            right = self._expression(node.right, body)
+            if node.operator in _ARITHMETIC:
+                return pyast.BinOp(left=left, op=_ARITHMETIC[node.operator], right=right)
+            elif node.operator == '*':
+                return _call('_multiply', [left, right])
+        elif node_type == ast.Prefix:
+            node = cast(ast.Prefix, node)
+
+            if node.right is None:
+                raise _Untranslatable()
+            elif node.operator == '-':
+                return pyast.UnaryOp(op=pyast.USub(), operand=self._expression(node.right, body))
+            elif node.operator == '!':
+                return _call('_not', [self._expression(node.right, body)])
+        elif node_type == ast.Call:
+            node = cast(ast.Call, node)
+
+            if node.arguments is None:
+                raise _Untranslatable()
+
+            return pyast.Call(func=self._expression(node.function, body),
+                              args=[self._expression(argument, body) for argument in node.arguments],
+                              keywords=[])
+        elif node_type == ast.Function:
+            return self._function(cast(ast.Function, node), body)
+        elif node_type == ast.If:
+            return self._if_expression(cast(ast.If, node), body)
+
+        raise _Untranslatable()
+
+    def _condition(self, node: ast.Expression, body: List[pyast.stmt]) -> pyast.expr:
+        if type(node) == ast.Boolean:
+            return pyast.Constant(value=bool(cast(ast.Boolean, node).value))
+        elif type(node) != ast.Infix or cast(ast.Infix, node).operator not in _COMPARISONS:
+            return _call('_truthy', [self._expression(node, body)])
+
+        node = cast(ast.Infix, node)
+        if node.right is None:
+            raise _Untranslatable()
+
+        left = self._expression(node.left, body)
+        right = self._expression(node.right, body)
+        # Python orders strings too; a literal integer operand rules them out.
+        if (node.operator in _CHECKED_COMPARISONS
+                and type(node.left) != ast.Integer and type(node.right) != ast.Integer):
+            return _call(_CHECKED_COMPARISONS[node.operator], [left, right])
+
+        return pyast.Compare(left=left, ops=[_COMPARISONS[node.operator]], comparators=[right])
+
+    # A si used as a value only translates when each branch is a single
+    # expression; otherwise its regresa and errors would have to become
+    # Return and Error objects.
+    def _if_expression(self, node: ast.If, body: List[pyast.stmt]) -> pyast.expr:
+        if node.condition is None or node.consequence is None:
+            raise _Untranslatable()
+
+        test = self._condition(node.condition, body)
+        consequence = self._branch(node.consequence, body)
+        alternative = self._branch(node.alternative, body) if node.alternative is not None else _name('_NULL')
+
+        return pyast.IfExp(test=test, body=consequence, orelse=alternative)
+
+    def _branch(self, block: ast.Block, body: List[pyast.stmt]) -> pyast.expr:
+        if len(block.statements) == 0:
+            return pyast.Constant(value=None)
+        elif len(block.statements) > 1 or type(block.statements[0]) != ast.ExpressionStatement:
+            raise _Untranslatable()
+
+        expression = cast(ast.ExpressionStatement, block.statements[0]).expression
+        if expression is None:
+            raise _Untranslatable()
+
+        return self._expression(expression, body)
+
+    def _function(self, node: ast.Function, body: List[pyast.stmt]) -> pyast.expr:
+        if node.body is None:
+            raise _Untranslatable()
+
+        block = node.body
+        if type(block) == ast.LazyBlock:
+            lazy = cast(ast.LazyBlock, block)
+            block = lazy.parse()
+            if len(lazy.errors) > 0:
+                raise _Untranslatable()
+
+        index = len(self.functions)
+        name = f'_procedimiento_{index}'
+        self.functions.append(node)
+        parameters = [_PREFIX + parameter.value for parameter in node.parameters]
+        if len(set(parameters)) != len(parameters):
+            raise _Untranslatable()
+
+        statements = self._block(cast(ast.Block, block).statements, True, False)
+        body.append(_function_def(name, parameters, statements))
+        # Tags the function with its literal, for _to_object.
+        body.append(pyast.Assign(
+            targets=[pyast.Attribute(value=_name(name), attr=_LITERAL, ctx=pyast.Store())],
+            value=pyast.Subscript(value=_name(_LITERALS), slice=pyast.Constant(value=index), ctx=pyast.Load())))
+
+        return _name(name)
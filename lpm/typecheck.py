@@ -0,0 +1,441 @@
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import lpm.ast as ast
+from lpm.object import (
+    Boolean,
+    Integer,
+    Null,
+    Object,
+    ObjectType,
+    String,
+)
+from lpm.purity import _candidates
+from lpm.resolver import GLOBAL
+
+# Inferred types are ObjectType members, or None when a value may have more
+# than one type. _NOTHING is the value of statements without one, and
+# _BOTTOM stands for no value at all yet: the parameters of a procedimiento
+# before any call to it has been seen, and the value of a regresa, which
+# never falls through. Joining _BOTTOM with a type gives the type.
+_NOTHING = object()
+_BOTTOM = object()
+_UNASSIGNED = object()
+
+# As the evaluator reports them.
+_TYPE_MISMATCH = 'Discrepancia de tipos: {} {} {}'
+_UNKNOWN_PREFIX_OPERATOR = 'Operador desconocido: {}{}'
+_UNKNOWN_INFIX_OPERATOR = 'Operador desconocido: {} {} {}'
+
+_INTEGER_OPERATORS = {'+', '-', '*', '/'}
+_COMPARISON_OPERATORS = {'<', '>'}
+
+_CLASSES: Dict[ObjectType, Type[Object]] = {
+    ObjectType.INTEGER: Integer,
+    ObjectType.STRING: String,
+    ObjectType.BOOLEAN: Boolean,
+    ObjectType.NULL: Null,
+}
+
+
+class FunctionTypes:
+
+    # What the evaluator may assume while running one procedimiento literal,
+    # or the top level of a program: that its arguments have the classes in
+    # parameters (None for any), and from there, the operand types of the
+    # Infix and Prefix nodes in nodes that have a static operation and the
+    # result classes of their Call nodes that have an expected one. Any call
+    # breaking an assumption invalidates them, here and in the procedimientos
+    # nested in this one, which may have read its variables.
+    def __init__(self, parameters: Optional[List[Optional[Type[Object]]]]) -> None:
+        self.parameters = parameters
+        self.nodes: List[ast.Expression] = []
+        self.children: List['FunctionTypes'] = []
+
+    def check(self, args: List[Object]) -> None:
+        assert self.parameters is not None
+        for expected, arg in zip(self.parameters, args):
+            if expected is not None and type(arg) is not expected:
+                self.invalidate()
+                return
+
+    def invalidate(self) -> None:
+        self.parameters = None
+        for node in self.nodes:
+            if type(node) == ast.Call:
+                cast(ast.Call, node).expected = None
+            else:
+                cast(ast.Infix, node).static = None
+
+        children, self.nodes, self.children = self.children, [], []
+        for child in children:
+            child.invalidate()
+
+
+class TypeReport:
+
+    # errors are the source offset and message of every operation that can
+    # only fail, and specialized the Infix and Prefix nodes whose operands
+    # are known to have the given type.
+    def __init__(self) -> None:
+        self.errors: List[Tuple[int, str]] = []
+        self.specialized: List[Tuple[ast.Expression, ObjectType]] = []
+
+
+class _Scope:
+
+    # The variables of one procedimiento call, or of the top level, that are
+    # assigned at the current point of the walk, with their types. trail has
+    # one entry per si branch being walked, with what the variables the
+    # branch assigned held before it.
+    def __init__(self, function: Optional[ast.Function], parent: Optional['_Scope'], types: FunctionTypes) -> None:
+        self.function = function
+        self.parent = parent
+        self.types = types
+        self.assigned: Dict[str, Any] = {}
+        self.trail: List[Dict[str, Any]] = []
+        self.returns: Any = _BOTTOM
+
+    def set(self, name: str, value: Any) -> None:
+        if self.trail and name not in self.trail[-1]:
+            self.trail[-1][name] = self.assigned.get(name, _UNASSIGNED)
+        self.assigned[name] = value
+
+    # Walks statements as a si branch, then undoes its assignments, returning
+    # what the walk gave, what the variables it assigned held before it and
+    # what they held after it.
+    def branch(self, walk: Callable[[], Tuple[Any, bool]]) -> Tuple[Any, bool, Dict[str, Any], Dict[str, Any]]:
+        self.trail.append({})
+        value, returns = walk()
+        before = self.trail.pop()
+
+        after = {name: self.assigned.get(name, _UNASSIGNED) for name in before}
+        for name, previous in before.items():
+            if previous is _UNASSIGNED:
+                del self.assigned[name]
+            else:
+                self.assigned[name] = previous
+
+        return value, returns, before, after
+
+
+def check(program: ast.Program) -> TypeReport:
+    checker = _Checker(program)
+
+    # The types of parameters, results and variables only grow, from
+    # _BOTTOM to a type to None, so each loop stops after a few walks. The
+    # first one assumes that procedimientos nothing calls, or that never
+    # return, could take or give anything; the second one drops that.
+    checker.walk(False, False)
+    while checker.changed:
+        checker.walk(False, False)
+
+    checker.walk(True, False)
+    while checker.changed:
+        checker.walk(True, False)
+
+    checker.walk(True, True)
+    return checker.report
+
+
+def _join(left: Any, right: Any) -> Any:
+    if left is _BOTTOM:
+        return right
+    elif right is _BOTTOM or left == right:
+        return left
+
+    return None
+
+
+def _known(value: Any) -> Optional[ObjectType]:
+    return value if type(value) == ObjectType else None
+
+
+class _Checker:
+
+    def __init__(self, program: ast.Program) -> None:
+        self.program = program
+        self.candidates = _candidates(program)
+        self.names: Dict[ast.Function, str] = {function: name for name, function in self.candidates.items()}
+        self.escaping: Set[str] = set()
+        self.parameters: Dict[ast.Function, List[Any]] = {
+            function: [_BOTTOM] * len(function.parameters) for function in self.names
+        }
+        self.returns: Dict[ast.Function, Any] = {function: _BOTTOM for function in self.names}
+        # Every type each variable of a procedimiento, or of the top level
+        # under None, is assigned anywhere, for the procedimientos nested in
+        # it, which read it at any later time.
+        self.variables: Dict[Optional[ast.Function], Dict[str, Any]] = {}
+        self.changed = False
+        self.final = False
+        self.annotate = False
+        self.report = TypeReport()
+
+    def walk(self, final: bool, annotate: bool) -> None:
+        self.changed = False
+        self.final = final
+        self.annotate = annotate
+
+        scope = _Scope(None, None, FunctionTypes(None))
+        self._statements(self.program.statements, scope)
+
+    def _grow(self, table: Dict[Any, Any], key: Any, value: Any) -> None:
+        current = table.get(key, _BOTTOM)
+        joined = _join(current, value)
+        if joined is not current:
+            table[key] = joined
+            self.changed = True
+
+    def _assign(self, scope: _Scope, name: str, value: Any) -> None:
+        scope.set(name, value)
+        self._grow(self.variables.setdefault(scope.function, {}), name, value)
+
+    # The type of the value of a list of statements, and whether a regresa in
+    # them may end it. A statement that may yield an Error before the last
+    # one may end it with that Error.
+    def _statements(self, statements: List[ast.Statement], scope: _Scope) -> Tuple[Any, bool]:
+        result: Any = None
+        returns = False
+        ended = False
+
+        for idx, statement in enumerate(statements):
+            value, statement_returns = self._statement(statement, scope)
+            returns = returns or statement_returns
+
+            if ended:
+                continue
+            elif type(statement) == ast.ReturnStatement:
+                result, ended = _BOTTOM, True
+            elif idx < len(statements) - 1 and value is None:
+                result, ended = None, True
+            else:
+                result = None if value is _NOTHING else value
+
+        return result, returns
+
+    def _statement(self, node: ast.Statement, scope: _Scope) -> Tuple[Any, bool]:
+        node_type = type(node)
+
+        if node_type == ast.LetStatement:
+            let = cast(ast.LetStatement, node)
+
+            assert let.name is not None
+            value = self._expression(let.value, scope)
+            if let.depth == 0 or (let.depth == GLOBAL and scope.function is None):
+                self._assign(scope, let.name.value, value)
+
+            return _NOTHING, False
+        elif node_type == ast.ReturnStatement:
+            scope.returns = _join(scope.returns, self._expression(cast(ast.ReturnStatement, node).return_value, scope))
+
+            return _BOTTOM, True
+        elif node_type == ast.ExpressionStatement:
+            expression = cast(ast.ExpressionStatement, node).expression
+            if type(expression) == ast.If:
+                return self._if(cast(ast.If, expression), scope)
+
+            return self._expression(expression, scope), False
+
+        return None, False
+
+    def _if(self, node: ast.If, scope: _Scope) -> Tuple[Any, bool]:
+        assert node.consequence is not None
+        consequence_block, alternative_block = node.consequence, node.alternative
+        self._expression(node.condition, scope)
+
+        consequence, consequence_returns, before, after_consequence = scope.branch(
+            lambda: self._statements(consequence_block.statements, scope))
+        if alternative_block is not None:
+            alternative, alternative_returns, alternative_before, after_alternative = scope.branch(
+                lambda: self._statements(alternative_block.statements, scope))
+            before.update(alternative_before)
+        else:
+            alternative, alternative_returns, after_alternative = ObjectType.NULL, False, {}
+
+        # Variables assigned before the si stay assigned, with the types either
+        # branch may have left in them.
+        for name, previous in before.items():
+            if previous is not _UNASSIGNED:
+                scope.set(name, _join(after_consequence.get(name, previous), after_alternative.get(name, previous)))
+
+        return _join(consequence, alternative), consequence_returns or alternative_returns
+
+    def _expression(self, node: Optional[ast.ASTNode], scope: _Scope) -> Any:
+        node_type = type(node)
+
+        if node_type == ast.Integer:
+            return ObjectType.INTEGER
+        elif node_type == ast.Boolean:
+            return ObjectType.BOOLEAN
+        elif node_type == ast.StringLiteral:
+            return ObjectType.STRING
+        elif node_type == ast.Identifier:
+            return self._identifier(cast(ast.Identifier, node), scope)
+        elif node_type == ast.Infix:
+            return self._infix(cast(ast.Infix, node), scope)
+        elif node_type == ast.Prefix:
+            return self._prefix(cast(ast.Prefix, node), scope)
+        elif node_type == ast.Call:
+            return self._call(cast(ast.Call, node), scope)
+        elif node_type == ast.If:
+            # A regresa in a si used as a value makes the value a Return.
+            value, returns = self._if(cast(ast.If, node), scope)
+
+            return None if returns else value
+        elif node_type == ast.Function:
+            self._function(cast(ast.Function, node), scope)
+
+            return ObjectType.FUNCTION
+
+        return None
+
+    def _identifier(self, node: ast.Identifier, scope: _Scope) -> Any:
+        depth = node.depth
+
+        if depth == GLOBAL:
+            if node.value in self.candidates and node.value not in self.escaping:
+                self.escaping.add(node.value)
+                self.changed = True
+            if scope.function is None:
+                return scope.assigned.get(node.value)
+        elif depth == 0:
+            return scope.assigned.get(node.value)
+        elif depth is not None and depth > 0:
+            outer = scope
+            while depth > 0:
+                outer = cast(_Scope, outer.parent)
+                depth -= 1
+
+            # Read after the procedimiento is made, by which time the
+            # variable may have been assigned again.
+            if node.value in outer.assigned:
+                return self.variables.get(outer.function, {}).get(node.value)
+
+        return None
+
+    def _infix(self, node: ast.Infix, scope: _Scope) -> Any:
+        if self.annotate:
+            node.static = None
+        left = self._expression(node.left, scope)
+        right = self._expression(node.right, scope)
+        operator = node.operator
+
+        if operator == '==' or operator == '!=':
+            result: Any = ObjectType.BOOLEAN
+        elif left is _BOTTOM or right is _BOTTOM:
+            return _BOTTOM
+        elif _known(left) is None or _known(right) is None:
+            return None
+        elif left == ObjectType.INTEGER and right == ObjectType.INTEGER and operator in _INTEGER_OPERATORS:
+            result = ObjectType.INTEGER
+        elif left == ObjectType.INTEGER and right == ObjectType.INTEGER and operator in _COMPARISON_OPERATORS:
+            result = ObjectType.BOOLEAN
+        elif left == ObjectType.STRING and right == ObjectType.STRING and operator == '+':
+            result = ObjectType.STRING
+        else:
+            if self.annotate:
+                message = _TYPE_MISMATCH if left != right else _UNKNOWN_INFIX_OPERATOR
+                self.report.errors.append((node.start, message.format(left.name, operator, right.name)))
+
+            return None
+
+        if self.annotate and left == right and left in (ObjectType.INTEGER, ObjectType.STRING):
+            self.report.specialized.append((node, left))
+            scope.types.nodes.append(node)
+
+        return result
+
+    def _prefix(self, node: ast.Prefix, scope: _Scope) -> Any:
+        if self.annotate:
+            node.static = None
+        right = self._expression(node.right, scope)
+
+        if node.operator == '!':
+            return ObjectType.BOOLEAN
+        elif right is _BOTTOM:
+            return _BOTTOM
+        elif _known(right) is None:
+            return None
+        elif node.operator == '-' and right == ObjectType.INTEGER:
+            if self.annotate:
+                self.report.specialized.append((node, right))
+                scope.types.nodes.append(node)
+
+            return ObjectType.INTEGER
+
+        if self.annotate:
+            self.report.errors.append((node.start, _UNKNOWN_PREFIX_OPERATOR.format(node.operator, right.name)))
+
+        return None
+
+    def _call(self, node: ast.Call, scope: _Scope) -> Any:
+        if self.annotate:
+            node.expected, node.owner = None, None
+
+        callee: Optional[ast.Function] = None
+        if type(node.function) == ast.Identifier:
+            identifier = cast(ast.Identifier, node.function)
+            if identifier.depth == GLOBAL and identifier.value in self.candidates:
+                callee = self.candidates[identifier.value]
+        else:
+            self._expression(node.function, scope)
+
+        args = [self._expression(argument, scope) for argument in node.arguments or []]
+        if callee is None:
+            return None
+
+        parameters = self.parameters[callee]
+        for idx in range(min(len(parameters), len(args))):
+            joined = _join(parameters[idx], args[idx])
+            if joined is not parameters[idx]:
+                parameters[idx] = joined
+                self.changed = True
+
+        result = self.returns[callee]
+        if self.final and result is _BOTTOM:
+            return None
+        elif self.annotate and result in _CLASSES:
+            node.expected, node.owner = _CLASSES[result], scope.types
+            scope.types.nodes.append(node)
+
+        return result
+
+    def _function(self, node: ast.Function, parent: _Scope) -> None:
+        if self.annotate:
+            node.types = None
+        if type(node.body) != ast.Block:
+            return
+
+        body = cast(ast.Block, node.body)
+        if node in self.names and self.names[node] not in self.escaping:
+            parameters = self.parameters[node]
+        else:
+            parameters = [None] * len(node.parameters)
+        if self.final:
+            parameters = [None if value is _BOTTOM else value for value in parameters]
+
+        types = FunctionTypes([_CLASSES.get(value) for value in parameters])
+        scope = _Scope(node, parent, types)
+        for parameter, value in zip(node.parameters, parameters):
+            self._assign(scope, parameter.value, value)
+
+        value, _ = self._statements(body.statements, scope)
+        result = _join(scope.returns, value)
+        if node in self.returns:
+            self._grow(self.returns, node, result)
+
+        if self.annotate:
+            if all(expected is None for expected in types.parameters or []):
+                types.parameters = None
+            node.types = types
+            parent.types.children.append(types)
+
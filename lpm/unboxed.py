@@ -0,0 +1,376 @@
+from typing import (
+    Any,
+    cast,
+    Dict,
+    List,
+    Optional,
+)
+
+import lpm.ast as ast
+from lpm.builtins import BUILTINS
+from lpm.evaluator import (
+    _extend_function_environment,
+    _new_error,
+    _NOT_A_FUNCTION,
+    _SYNTAX_ERROR,
+    _TYPE_MISMATCH,
+    _UNKNOWN_IDENTIFIER,
+    _UNKNOWN_INFIX_OPERATOR,
+    _UNKNOWN_PREFIX_OPERATOR,
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpm.object import (
+    _UNSET,
+    Boolean,
+    Builtin,
+    Environment,
+    Error,
+    Frame,
+    Function,
+    Integer,
+    Null,
+    Object,
+    Return,
+    String,
+)
+from lpm.resolver import (
+    BUILTIN,
+    resolve,
+    UNKNOWN,
+)
+
+# The tree-walking evaluator with LPM integers, booleans, strings and nulo
+# held as plain Python int, bool, str and None. Functions, builtins, errors
+# and Return wrappers stay objects. Values are boxed back into lpm.object
+# only where they leave: the result of execute and the arguments of builtins.
+# Variables in the Environment hold the unboxed values.
+
+# The value of statements that have none, like a let; None is nulo here.
+_NOTHING = object()
+
+_TYPE_NAMES: Dict[type, str] = {
+    int: 'INTEGER',
+    bool: 'BOOLEAN',
+    str: 'STRING',
+    type(None): 'NULL',
+}
+
+
+class _TailCall:
+
+    # As in lpm.evaluator: a call in tail position handed back to the
+    # trampoline in _apply_function.
+    def __init__(self, function: Any, args: List[Any], unwraps: int) -> None:
+        self.function = function
+        self.args = args
+        self.unwraps = unwraps
+
+
+def execute(program: ast.Program, env: Environment) -> Optional[Object]:
+    resolve(program)
+    result: Any = _NOTHING
+
+    for statement in program.statements:
+        result = _evaluate(statement, env)
+
+        if type(result) is Return:
+            return box(cast(Return, result).value)
+        elif type(result) is Error:
+            return result
+
+    return box(result)
+
+
+def box(value: Any) -> Optional[Object]:
+    value_type = type(value)
+
+    if value_type is int:
+        return Integer(value)
+    elif value_type is bool:
+        return TRUE if value else FALSE
+    elif value_type is str:
+        return String(value)
+    elif value is None:
+        return NULL
+    elif value is _NOTHING:
+        return None
+    elif value_type is Return:
+        return Return(cast(Object, box(cast(Return, value).value)))
+
+    return cast(Object, value)
+
+
+def unbox(value: Optional[Object]) -> Any:
+    value_type = type(value)
+
+    if value_type is Integer:
+        return cast(Integer, value).value
+    elif value_type is Boolean:
+        return cast(Boolean, value).value
+    elif value_type is String:
+        return cast(String, value).value
+    elif value_type is Null:
+        return None
+    elif value is None:
+        return _NOTHING
+
+    return value
+
+
+def _evaluate(node: ast.ASTNode, env: Environment) -> Any:
+    node_type = type(node)
+
+    if node_type == ast.ExpressionStatement:
+        expression = cast(ast.ExpressionStatement, node).expression
+
+        assert expression is not None
+        return _evaluate(expression, env)
+    elif node_type == ast.Identifier:
+        return _evaluate_identifier(cast(ast.Identifier, node), env)
+    elif node_type == ast.Integer:
+        return cast(ast.Integer, node).value
+    elif node_type == ast.Infix:
+        node = cast(ast.Infix, node)
+
+        assert node.right is not None
+        return _evaluate_infix_expression(node.operator, _evaluate(node.left, env), _evaluate(node.right, env))
+    elif node_type == ast.Call:
+        node = cast(ast.Call, node)
+
+        function = _evaluate(node.function, env)
+
+        assert node.arguments is not None
+        return _apply_function(function, [_evaluate(argument, env) for argument in node.arguments])
+    elif node_type == ast.If:
+        node = cast(ast.If, node)
+
+        assert node.condition is not None and node.consequence is not None
+        condition = _evaluate(node.condition, env)
+        if condition is not None and condition is not False:
+            return _evaluate_block(node.consequence.statements, env)
+        elif node.alternative is not None:
+            return _evaluate_block(node.alternative.statements, env)
+
+        return None
+    elif node_type == ast.ReturnStatement:
+        node = cast(ast.ReturnStatement, node)
+
+        assert node.return_value is not None
+        return Return(_evaluate(node.return_value, env))
+    elif node_type == ast.LetStatement:
+        node = cast(ast.LetStatement, node)
+
+        assert node.name is not None and node.value is not None
+        value = _evaluate(node.value, env)
+        if node.depth == 0:
+            cast(Frame, env).values[node.slot] = value
+        else:
+            env[node.name.value] = value
+
+        return _NOTHING
+    elif node_type == ast.Prefix:
+        node = cast(ast.Prefix, node)
+
+        assert node.right is not None
+        return _evaluate_prefix_expression(node.operator, _evaluate(node.right, env))
+    elif node_type == ast.Boolean:
+        return cast(ast.Boolean, node).value
+    elif node_type == ast.StringLiteral:
+        return cast(ast.StringLiteral, node).value
+    elif node_type == ast.Function:
+        node = cast(ast.Function, node)
+
+        assert node.body is not None
+        return Function(node.parameters, node.body, env, node.slots)
+    elif node_type == ast.Block:
+        return _evaluate_block(cast(ast.Block, node).statements, env)
+
+    return _NOTHING
+
+
+def _evaluate_block(statements: List[ast.Statement], env: Environment) -> Any:
+    result: Any = _NOTHING
+
+    for statement in statements:
+        result = _evaluate(statement, env)
+
+        if type(result) is Return or type(result) is Error:
+            return result
+
+    return result
+
+
+def _evaluate_identifier(node: ast.Identifier, env: Environment) -> Any:
+    depth = node.depth
+
+    if depth == 0:
+        value = cast(Frame, env).values[node.slot]
+        if value is not _UNSET:
+            return value
+        env = env.outer
+    elif depth is not None and depth > 0:
+        frame = env
+        while depth > 0:
+            frame = frame.outer
+            depth -= 1
+
+        value = cast(Frame, frame).values[node.slot]
+        if value is not _UNSET:
+            return value
+        env = frame.outer
+
+    value = env.get(node.value, _UNSET)
+    if value is not _UNSET:
+        return value
+    elif depth == BUILTIN:
+        return BUILTINS[node.value]
+    elif depth != UNKNOWN and node.value in BUILTINS:
+        return BUILTINS[node.value]
+
+    return _new_error(_UNKNOWN_IDENTIFIER, [node.value])
+
+
+def _type_name(value: Any) -> str:
+    try:
+        return _TYPE_NAMES[type(value)]
+    except KeyError:
+        return cast(Object, value).type().name
+
+
+def _evaluate_infix_expression(operator: str, left: Any, right: Any) -> Any:
+    left_type = type(left)
+    right_type = type(right)
+
+    if left_type is int and right_type is int:
+        if operator == '+':
+            return left + right
+        elif operator == '-':
+            return left - right
+        elif operator == '*':
+            return left * right
+        elif operator == '/':
+            return left // right
+        elif operator == '<':
+            return left < right
+        elif operator == '>':
+            return left > right
+        elif operator == '==':
+            return left == right
+        elif operator == '!=':
+            return left != right
+    elif left_type is str and right_type is str:
+        if operator == '+':
+            return left + right
+        elif operator == '==':
+            return left == right
+        elif operator == '!=':
+            return left != right
+    # Any other pair of values is only equal when it is the same object, as
+    # with boxed values: verdadero, falso and nulo are singletons there too.
+    elif operator == '==':
+        return left is right
+    elif operator == '!=':
+        return left is not right
+    elif _type_name(left) != _type_name(right):
+        return _new_error(_TYPE_MISMATCH, [_type_name(left), operator, _type_name(right)])
+
+    return _new_error(_UNKNOWN_INFIX_OPERATOR, [_type_name(left), operator, _type_name(right)])
+
+
+def _evaluate_prefix_expression(operator: str, right: Any) -> Any:
+    if operator == '!':
+        return right is False or right is None
+    elif operator == '-' and type(right) is int:
+        return -right
+
+    return _new_error(_UNKNOWN_PREFIX_OPERATOR, [operator, _type_name(right)])
+
+
+def _apply_function(fn: Any, args: List[Any]) -> Any:
+    unwraps = 0
+
+    while True:
+        if type(fn) is Function:
+            body: ast.ASTNode = fn.body
+            if type(body) == ast.LazyBlock:
+                lazy = cast(ast.LazyBlock, body)
+                body = lazy.parse()
+                if len(lazy.errors) > 0:
+                    return _new_error(_SYNTAX_ERROR, ['; '.join(lazy.errors)])
+
+            evaluated = _evaluate_body(cast(ast.Block, body).statements,
+                                       _extend_function_environment(fn, args),
+                                       True)
+            if type(evaluated) is Return:
+                evaluated = evaluated.value
+            if type(evaluated) is not _TailCall:
+                break
+
+            fn, args, unwraps = evaluated.function, evaluated.args, unwraps + evaluated.unwraps
+        elif type(fn) is Builtin:
+            evaluated = unbox(fn.fn(*[cast(Object, box(arg)) for arg in args]))
+            break
+        else:
+            return _new_error(_NOT_A_FUNCTION, [_type_name(fn)])
+
+    while unwraps > 0 and type(evaluated) is Return:
+        evaluated = evaluated.value
+        unwraps -= 1
+
+    return evaluated
+
+
+# Mirrors lpm.evaluator._evaluate_body: calls in tail position are handed back
+# to _apply_function as _TailCall instead of being made.
+def _evaluate_body(statements: List[ast.Statement], env: Environment, tail: bool) -> Any:
+    result: Any = _NOTHING
+
+    for idx, statement in enumerate(statements):
+        last = tail and idx == len(statements) - 1
+        statement_type = type(statement)
+
+        if statement_type == ast.ReturnStatement:
+            value = cast(ast.ReturnStatement, statement).return_value
+            if type(value) == ast.Call:
+                return Return(cast(Object, _tail_call(cast(ast.Call, value), env, 0)))
+
+            result = _evaluate(statement, env)
+        elif statement_type == ast.ExpressionStatement:
+            expression = cast(ast.ExpressionStatement, statement).expression
+
+            if type(expression) == ast.If:
+                result = _evaluate_if_body(cast(ast.If, expression), env, last)
+                if last:
+                    return result
+            elif last and type(expression) == ast.Call:
+                return _tail_call(cast(ast.Call, expression), env, 1)
+            else:
+                result = _evaluate(statement, env)
+        else:
+            result = _evaluate(statement, env)
+
+        if type(result) is Return or type(result) is Error:
+            return result
+
+    return result
+
+
+def _evaluate_if_body(node: ast.If, env: Environment, tail: bool) -> Any:
+    assert node.condition is not None and node.consequence is not None
+    condition = _evaluate(node.condition, env)
+
+    if condition is not None and condition is not False:
+        return _evaluate_body(node.consequence.statements, env, tail)
+    elif node.alternative is not None:
+        return _evaluate_body(node.alternative.statements, env, tail)
+
+    return None
+
+
+def _tail_call(call: ast.Call, env: Environment, unwraps: int) -> _TailCall:
+    function = _evaluate(call.function, env)
+
+    assert call.arguments is not None
+    return _TailCall(function, [_evaluate(argument, env) for argument in call.arguments], unwraps)
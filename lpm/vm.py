@@ -0,0 +1,269 @@
+from typing import (
+    Any,
+    cast,
+    List,
+    Optional,
+    Tuple,
+)
+
+import lpm.ast as ast
+from lpm.builtins import BUILTINS
+from lpm.compiler import (
+    ADD,
+    CALL,
+    CHECK,
+    CHECK_JUMP,
+    CLOSURE,
+    Code,
+    compile_function,
+    compile_program,
+    DIVIDE,
+    EQUAL,
+    GREATER,
+    INFIX,
+    JUMP,
+    JUMP_IF_FALSE,
+    LESS,
+    LOAD_CONSTANT,
+    LOAD_FREE,
+    LOAD_GLOBAL,
+    LOAD_LOCAL,
+    MULTIPLY,
+    NEGATE,
+    NOT,
+    NOT_EQUAL,
+    POP,
+    PREFIX,
+    PUSH_NONE,
+    RETURN,
+    STORE_GLOBAL,
+    STORE_LOCAL,
+    SUBTRACT,
+    WRAP_RETURN,
+)
+from lpm.evaluator import (
+    _apply_function,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _MAX_DEPTH_EXCEEDED,
+    _new_error,
+    _SYNTAX_ERROR,
+    _UNKNOWN_IDENTIFIER,
+    DEFAULT_MAX_DEPTH,
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpm.object import (
+    Environment,
+    Error,
+    Function,
+    Integer,
+    Object,
+    Return,
+    _UNSET,
+)
+
+Slots = List[Any]
+
+
+class Closure(Function):
+
+    # scopes holds the slots of the enclosing procedimiento calls, innermost
+    # first, so nested functions see later assignments to them.
+    def __init__(self, code: Code, scopes: Tuple[Slots, ...], env: Environment) -> None:
+        assert code.function is not None and code.function.body is not None
+        super().__init__(code.function.parameters, code.function.body, env)
+        self.code = code
+        self.scopes = scopes
+
+
+def execute(program: ast.Program, env: Environment, max_depth: int = DEFAULT_MAX_DEPTH) -> Optional[Object]:
+    return run(compile_program(program), env, max_depth)
+
+
+# max_depth bounds the number of procedimiento calls in progress, as in
+# evaluate_iterative; going past it stops the run with an Error.
+def run(code: Code, env: Environment, max_depth: int = DEFAULT_MAX_DEPTH) -> Optional[Object]:
+    assert code.instructions is not None
+    instructions = code.instructions
+    constants = code.constants
+    slots: Slots = []
+    scopes: Tuple[Slots, ...] = ()
+    globals_ = env
+
+    stack: List[Any] = []
+    push = stack.append
+    pop = stack.pop
+    frames: List[Tuple[Any, ...]] = []
+    pc = 0
+
+    while True:
+        opcode, argument = instructions[pc]
+        pc += 1
+
+        if opcode == LOAD_LOCAL:
+            value = slots[argument]
+            if value is _UNSET:
+                value = _lookup(code.names[argument], code, slots, scopes, globals_)
+            push(value)
+        elif opcode == LOAD_CONSTANT:
+            push(constants[argument])
+        elif opcode == LOAD_GLOBAL:
+            try:
+                push(globals_[argument])
+            except KeyError:
+                push(_builtin(argument))
+        elif opcode == CALL:
+            base = len(stack) - argument
+            function = stack[base - 1]
+            args = stack[base:]
+            del stack[base - 1:]
+
+            if type(function) is not Closure:
+                push(_apply_function(function, args))
+                continue
+
+            callee = function.code
+            if callee.instructions is None:
+                compile_function(callee)
+            if len(callee.errors) > 0:
+                push(_new_error(_SYNTAX_ERROR, ['; '.join(callee.errors)]))
+                continue
+
+            if len(frames) == max_depth:
+                return _new_error(_MAX_DEPTH_EXCEEDED, [max_depth])
+            frames.append((code, instructions, constants, pc, slots, scopes, globals_))
+            code = callee
+            instructions = cast(List[Any], callee.instructions)
+            constants = callee.constants
+            pc = 0
+            if argument != callee.arity:
+                args = (args + [_UNSET] * callee.arity)[:callee.arity]
+            args.extend([_UNSET] * (len(callee.names) - callee.arity))
+            slots = args
+            scopes = function.scopes
+            globals_ = function.env
+        elif opcode == RETURN:
+            if len(frames) == 0:
+                return pop()
+            code, instructions, constants, pc, slots, scopes, globals_ = frames.pop()
+        elif opcode == JUMP_IF_FALSE:
+            value = pop()
+            if value is FALSE or value is NULL:
+                pc = argument
+        elif opcode == ADD:
+            right = pop()
+            left = stack[-1]
+            if type(left) is Integer and type(right) is Integer:
+                stack[-1] = Integer(left.value + right.value)
+            else:
+                stack[-1] = _evaluate_infix_expression('+', left, right)
+        elif opcode == SUBTRACT:
+            right = pop()
+            left = stack[-1]
+            if type(left) is Integer and type(right) is Integer:
+                stack[-1] = Integer(left.value - right.value)
+            else:
+                stack[-1] = _evaluate_infix_expression('-', left, right)
+        elif opcode == LESS:
+            right = pop()
+            left = stack[-1]
+            if type(left) is Integer and type(right) is Integer:
+                stack[-1] = TRUE if left.value < right.value else FALSE
+            else:
+                stack[-1] = _evaluate_infix_expression('<', left, right)
+        elif opcode == GREATER:
+            right = pop()
+            left = stack[-1]
+            if type(left) is Integer and type(right) is Integer:
+                stack[-1] = TRUE if left.value > right.value else FALSE
+            else:
+                stack[-1] = _evaluate_infix_expression('>', left, right)
+        elif opcode == JUMP:
+            pc = argument
+        elif opcode == POP:
+            pop()
+        elif opcode == CHECK:
+            value = stack[-1]
+            if type(value) is Error or type(value) is Return:
+                if type(value) is Return:
+                    value = value.value
+                if len(frames) == 0:
+                    return value
+                code, instructions, constants, pc, slots, scopes, globals_ = frames.pop()
+                stack[-1] = value
+        elif opcode == STORE_LOCAL:
+            slots[argument] = pop()
+        elif opcode == STORE_GLOBAL:
+            globals_[argument] = pop()
+        elif opcode == LOAD_FREE:
+            depth, slot, name = argument
+            value = scopes[depth][slot]
+            if value is _UNSET:
+                value = _lookup(name, code, slots, scopes, globals_)
+            push(value)
+        elif opcode == CLOSURE:
+            push(Closure(constants[argument], (slots,) + scopes, globals_))
+        elif opcode == MULTIPLY:
+            right = pop()
+            left = stack[-1]
+            if type(left) is Integer and type(right) is Integer:
+                stack[-1] = Integer(left.value * right.value)
+            else:
+                stack[-1] = _evaluate_infix_expression('*', left, right)
+        elif opcode == DIVIDE:
+            right = pop()
+            stack[-1] = _evaluate_infix_expression('/', stack[-1], right)
+        elif opcode == EQUAL:
+            right = pop()
+            stack[-1] = _evaluate_infix_expression('==', stack[-1], right)
+        elif opcode == NOT_EQUAL:
+            right = pop()
+            stack[-1] = _evaluate_infix_expression('!=', stack[-1], right)
+        elif opcode == NEGATE:
+            stack[-1] = _evaluate_prefix_expression('-', stack[-1])
+        elif opcode == NOT:
+            stack[-1] = _evaluate_prefix_expression('!', stack[-1])
+        elif opcode == PUSH_NONE:
+            push(None)
+        elif opcode == CHECK_JUMP:
+            if type(stack[-1]) is Error or type(stack[-1]) is Return:
+                pc = argument
+        elif opcode == WRAP_RETURN:
+            stack[-1] = Return(stack[-1])
+        elif opcode == INFIX:
+            right = pop()
+            stack[-1] = _evaluate_infix_expression(argument, stack[-1], right)
+        elif opcode == PREFIX:
+            stack[-1] = _evaluate_prefix_expression(argument, stack[-1])
+
+
+def _builtin(name: str) -> Object:
+    try:
+        return BUILTINS[name]
+    except KeyError:
+        return _new_error(_UNKNOWN_IDENTIFIER, [name])
+
+
+# The slow path for a variable whose slot is still unset: search the frame and
+# the enclosing scopes by name, then the globals and the builtins.
+def _lookup(name: str,
+            code: Code,
+            slots: Slots,
+            scopes: Tuple[Slots, ...],
+            env: Environment) -> Object:
+    frame_slots = (slots,) + scopes
+    depth = 0
+    scope: Optional[Code] = code
+
+    while scope is not None and scope.function is not None:
+        if name in scope.slots and frame_slots[depth][scope.slots[name]] is not _UNSET:
+            return frame_slots[depth][scope.slots[name]]
+        depth += 1
+        scope = scope.parent
+
+    try:
+        return env[name]
+    except KeyError:
+        return _builtin(name)
@@ -1,9 +1,88 @@
-from lpm.repl import start_repl
+from argparse import ArgumentParser
+from sys import stderr
+from typing import (
+    List,
+    Optional,
+)
+
+from lpm.ast import Program
+from lpm.cache import ParseCache
+from lpm.lexer import Lexer
+from lpm.object import Environment
+from lpm.optimizer import optimize
+from lpm.parser import Parser
+from lpm.repl import (
+    ENGINES,
+    start_repl,
+)
+from lpm.resolver import resolve
+from lpm.typecheck import check
+
+
+def run_file(file_path: str,
+             cache_dir: Optional[str] = None,
+             engine: str = 'evaluator',
+             optimized: bool = False,
+             checked: bool = False,
+             verbose: bool = False) -> None:
+    with open(file_path, encoding='utf-8') as stream:
+        source = stream.read()
+
+    errors: List[str]
+    if cache_dir is not None:
+        program, errors = ParseCache(cache_dir).parse(source)
+    else:
+        parser: Parser = Parser(Lexer(source))
+        program = parser.parse_program()
+        errors = parser.errors
+
+    if len(errors) > 0:
+        for error in errors:
+            print(error)
+        return
+
+    if optimized:
+        report = optimize(program)
+        if verbose:
+            for change in report.changes:
+                print(change, file=stderr)
+            print(f'{report.folded} expresiones simplificadas, {report.pruned} condiciones resueltas, '
+                  f'{report.removed} sentencias eliminadas', file=stderr)
+
+    if checked:
+        resolve(program)
+        for start, message in check(program).errors:
+            line = source.count('\n', 0, start) + 1
+            print(f'línea {line}: {message}')
+
+    evaluated = ENGINES[engine](program, Environment())
+
+    if evaluated is not None:
+        print(evaluated.inspect())
+
 
 def main() -> None:
+    arguments = ArgumentParser(description='Intérprete de LPM.')
+    arguments.add_argument('archivo', nargs='?', help='programa a ejecutar; sin él se abre la consola')
+    arguments.add_argument('--cache-dir', help='directorio para guardar los programas ya parseados')
+    arguments.add_argument('--engine', choices=list(ENGINES), default='evaluator',
+                           help='cómo ejecutar el programa')
+    arguments.add_argument('--optimize', action='store_true',
+                           help='simplificar las expresiones constantes antes de ejecutar')
+    arguments.add_argument('--verbose', action='store_true',
+                           help='mostrar qué simplificó --optimize')
+    arguments.add_argument('--check', action='store_true',
+                           help='informar de las operaciones que siempre fallan antes de ejecutar')
+    options = arguments.parse_args()
+
+    if options.archivo is not None:
+        run_file(options.archivo, options.cache_dir, options.engine, options.optimize, options.check,
+                 options.verbose)
+        return
+
     print('**************** BIENVENIDO ****************')
     print('Escribe una oración para comenzar.')
-    start_repl()
+    start_repl(options.engine)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -6,6 +6,7 @@ from lpm.ast import (
     Program,
     ExpressionStatement,
     Integer,
+    StringLiteral,
 )
 from lpm.token import (
     Token,
@@ -65,4 +66,17 @@ class ASTTest(TestCase):
         ])
 
         program_str = str(program)
-        self.assertEquals(program_str, 'variable cinco = 5;')
\ No newline at end of file
+        self.assertEquals(program_str, 'variable cinco = 5;')
+
+    def test_nodes_have_no_instance_dict(self) -> None:
+        identifier = Identifier(token=Token(TokenType.IDENT, literal='x'), value='x', start=4)
+
+        self.assertFalse(hasattr(identifier, '__dict__'))
+        self.assertEqual(identifier.start, 4)
+        self.assertEqual(identifier.token, Token(TokenType.IDENT, 'x'))
+
+    def test_string_literal(self) -> None:
+        string_literal = StringLiteral(token=Token(TokenType.STRING, literal='hola'), value='hola')
+
+        self.assertEqual(str(string_literal), 'hola')
+        self.assertEqual(string_literal.token_literal(), 'hola')
@@ -0,0 +1,127 @@
+from os import (
+    listdir,
+    mkdir,
+    path,
+    utime,
+)
+from tempfile import TemporaryDirectory
+from typing import cast
+from unittest import TestCase
+
+from lpm.ast import (
+    ExpressionStatement,
+    Infix,
+    Program,
+)
+from lpm.cache import (
+    ParseCache,
+    decode,
+    encode,
+)
+from lpm.lexer import Lexer
+from lpm.parser import Parser
+
+
+class ParseCacheTest(TestCase):
+
+    def test_encode_round_trip(self) -> None:
+        source: str = '''
+            variable suma = procedimiento(x, y) { regresa x + y; };
+            si (suma(1, -2) < 3) { !verdadero } si_no { falso };
+            suma(5, 5) == 10;
+            (007 + 1);
+        '''
+        program: Program = Parser(Lexer(source)).parse_program()
+
+        decoded = decode(encode(program))
+
+        self.assertIsInstance(decoded, Program)
+        self.assertEqual(str(decoded), str(program))
+        self.assertEqual([statement.token_literal() for statement in decoded.statements],
+                         ['variable', 'si', 'suma', '('])
+        self.assertEqual(cast(Infix, cast(ExpressionStatement, decoded.statements[3]).expression).left.token_literal(),
+                         '007')
+
+    def test_hit_skips_parsing(self) -> None:
+        source: str = 'variable a = 5; a * 2;'
+
+        with TemporaryDirectory() as directory:
+            cache: ParseCache = ParseCache(directory)
+
+            program, errors = cache.parse(source)
+            cached_program, cached_errors = cache.parse(source)
+
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(errors, [])
+            self.assertEqual(cached_errors, [])
+            self.assertEqual(str(cached_program), str(program))
+            self.assertIsNot(cached_program, program)
+
+    def test_programs_with_errors_are_not_stored(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache: ParseCache = ParseCache(directory)
+
+            program, errors = cache.parse('variable x 5;')
+
+            self.assertEqual(len(errors), 1)
+            self.assertEqual(listdir(directory), [])
+
+    def test_corrupted_entry_is_discarded(self) -> None:
+        source: str = 'variable a = 5;'
+
+        with TemporaryDirectory() as directory:
+            cache: ParseCache = ParseCache(directory)
+            cache.parse(source)
+
+            with open(path.join(directory, listdir(directory)[0]), 'wb') as stream:
+                stream.write(b'LPMC basura')
+
+            program, errors = cache.parse(source)
+
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+            self.assertEqual(str(program), 'variable a = 5;')
+
+    def test_entries_too_deep_to_decode_are_discarded(self) -> None:
+        source: str = ' + '.join(['1'] * 700) + ';'
+
+        with TemporaryDirectory() as directory:
+            cache: ParseCache = ParseCache(directory)
+            program, _ = cache.parse(source)
+            self.assertEqual(len(listdir(directory)), 1)
+
+            reparsed, errors = cache.parse(source)
+
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+            self.assertEqual(errors, [])
+            self.assertEqual(len(reparsed.statements), 1)
+
+    def test_failed_writes_leave_no_temporary_files(self) -> None:
+        source: str = 'variable a = 5;'
+
+        with TemporaryDirectory() as directory:
+            cache: ParseCache = ParseCache(directory)
+            mkdir(path.join(directory, cache.key(source) + '.lpmc'))
+
+            program, errors = cache.parse(source)
+
+            self.assertEqual(errors, [])
+            self.assertEqual(listdir(directory), [cache.key(source) + '.lpmc'])
+
+    def test_eviction_removes_least_recently_used(self) -> None:
+        sources = [f'variable a{idx} = {idx};' for idx in range(3)]
+
+        with TemporaryDirectory() as directory:
+            cache: ParseCache = ParseCache(directory)
+            for idx, source in enumerate(sources):
+                cache.parse(source)
+                utime(path.join(directory, cache.key(source) + '.lpmc'), (idx, idx))
+
+            entry_size = max(path.getsize(path.join(directory, name)) for name in listdir(directory))
+            cache.max_bytes = entry_size * 3
+            cache.load(cache.key(sources[0]))
+            cache.parse('variable a3 = 3;')
+
+            remaining = set(listdir(directory))
+            self.assertIn(cache.key(sources[0]) + '.lpmc', remaining)
+            self.assertNotIn(cache.key(sources[1]) + '.lpmc', remaining)
+            self.assertEqual(len(remaining), 3)
@@ -0,0 +1,76 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+from unittest import TestCase
+
+from lpm.ast import Program
+from lpm.callsite import statistics
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Integer,
+)
+from lpm.parser import Parser
+from lpm.repl import Session
+
+
+class CallSiteCacheTest(TestCase):
+
+    def test_hits_and_misses(self) -> None:
+        program, evaluated = self._evaluate('''
+            variable k = 1;
+            variable doble = procedimiento(x) { variable y = x * 2; y + k - 1 };
+            variable bucle = procedimiento(n, total) {
+                si (n < 1) { regresa total; }
+                bucle(n - 1, total + doble(n))
+            };
+            bucle(10, 0);
+        ''')
+
+        self.assertEqual(cast(Integer, evaluated).value, 110)
+        self.assertEqual(statistics(program), [
+            ('doble(n)', 9, 1),
+            ('bucle((n - 1), (total + doble(n)))', 9, 1),
+            ('bucle(10, 0)', 0, 1),
+        ])
+
+    def test_calls_of_another_procedimiento_replace_the_cache(self) -> None:
+        program, evaluated = self._evaluate('''
+            variable k = 0;
+            variable uno = procedimiento(x) { x + 1 + k };
+            variable dos = procedimiento(x) { x + 2 + k };
+            variable aplica = procedimiento(f, x) { f(x) };
+            aplica(uno, 1) + aplica(uno, 1) + aplica(dos, 1) + aplica(dos, 1) + aplica(uno, 1);
+        ''')
+
+        self.assertEqual(cast(Integer, evaluated).value, 12)
+        self.assertIn(('f(x)', 2, 3), statistics(program))
+
+    def test_rebound_procedimientos_are_not_reused(self) -> None:
+        session: Session = Session()
+        session.execute('variable k = 0; variable f = procedimiento(x) { x + k }; variable g = procedimiento() { f(1) };')
+
+        self.assertEqual(cast(Integer, session.execute('g() + g();')).value, 2)
+        session.execute('variable f = procedimiento(x) { x * 10 + k };')
+        self.assertEqual(cast(Integer, session.execute('g();')).value, 10)
+
+    def test_generic_calls(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('variable k = 0; variable f = procedimiento(x, x) { x + k }; f(1, 2) + f(1, 2);', 4),
+            ('variable k = 0; variable f = procedimiento(x) { x + k }; f(1, 2) + f(3, 4);', 4),
+            ('variable f = procedimiento(n) { si (n == 0) { 0 } si_no { f(n - 1) } }; f(5) + f(5);', 0),
+        ]
+
+        for source, expected in tests:
+            program, evaluated = self._evaluate(source)
+
+            self.assertEqual(cast(Integer, evaluated).value, expected, source)
+            self.assertEqual([hits for _, hits, _ in statistics(program)], [0] * len(statistics(program)), source)
+
+    def _evaluate(self, source: str) -> Tuple[Program, object]:
+        program: Program = Parser(tokenize(source)).parse_program()
+
+        return program, evaluate(program, Environment())
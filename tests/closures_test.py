@@ -0,0 +1,66 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+
+import tests.evaluator_test as evaluator_test
+from lpm.closures import (
+    CompiledFunction,
+    execute,
+)
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Object,
+)
+from lpm.parser import Parser
+
+
+class ClosuresTest(evaluator_test.EvaluatorTest):
+
+    def test_closures(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable suma = procedimiento(x) { procedimiento(y) { procedimiento(z) { x + y + z } } };
+                 suma(1)(2)(3);
+             ''', 6),
+            ('''
+                 variable f = procedimiento(x) {
+                     variable g = procedimiento() { y };
+                     variable y = x * 2;
+                     g()
+                 };
+                 f(4);
+             ''', 8),
+            ('variable resta = procedimiento(a, b) { a - b }; resta(10, 3);', 7),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+    def test_functions_share_the_environment_model(self) -> None:
+        env: Environment = Environment()
+        execute(Parser(tokenize('variable doble = procedimiento(x) { x * 2 };')).parse_program(), env)
+
+        self.assertIsInstance(env['doble'], CompiledFunction)
+        self.assertIs(cast(CompiledFunction, env['doble']).env, env)
+        self._test_integer_object(cast(Object, execute(Parser(tokenize('doble(21);')).parse_program(), env)), 42)
+
+    def test_syntax_error_in_body_is_reported_on_call(self) -> None:
+        source: str = '''
+            variable roto = procedimiento(x) { regresa x + ; };
+            roto(1);
+        '''
+
+        self._test_error_object(self._evaluate_tests(source),
+                                'Error de sintaxis: No se encontró ninguna función para parsear ;')
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program = Parser(tokenize(source), lazy=True).parse_program()
+
+        evaluated = execute(program, Environment())
+
+        assert evaluated is not None
+        return evaluated
@@ -1,18 +1,33 @@
 from typing import (
     cast,
     List,
+    Optional,
     Tuple,
     Any,
     Union,
 )
 from unittest import TestCase
 
-from lpm.ast import Program
+from lpm.ast import (
+    Expression,
+    ExpressionStatement,
+    Function as ASTFunction,
+    Infix,
+    Integer as ASTInteger,
+    LetStatement,
+    Prefix,
+    Program,
+)
 from lpm.evaluator import (
     evaluate,
+    evaluate_iterative,
     NULL,
+    TRUE,
+)
+from lpm.lexer import (
+    Lexer,
+    tokenize,
 )
-from lpm.lexer import Lexer
 from lpm.object import (
     Integer,
     Object,
@@ -23,6 +38,10 @@ from lpm.object import (
     String,
 )
 from lpm.parser import Parser
+from lpm.token import (
+    Token,
+    TokenType,
+)
 
 
 class EvaluatorTest(TestCase):
@@ -259,6 +278,27 @@ class EvaluatorTest(TestCase):
             evaluated = self._evaluate_tests(source)
             self._test_integer_object(evaluated, expected)
 
+    def test_arguments_bind_in_order(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('variable resta = procedimiento(x, y) { x - y }; resta(10, 3);', 7),
+            ('variable f = procedimiento(a, b, c) { a * 100 + b * 10 + c }; f(1, 2, 3);', 123),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+    def test_arguments_bind_in_order_without_resolution(self) -> None:
+        # Evaluating statements one by one skips the resolver, so parameters
+        # are bound by name in an Environment.
+        program: Program = Parser(Lexer('variable resta = procedimiento(x, y) { x - y }; resta(10, 3);')).parse_program()
+        env: Environment = Environment()
+
+        evaluate(program.statements[0], env)
+        evaluated = evaluate(program.statements[1], env)
+
+        self._test_integer_object(cast(Object, evaluated), 7)
+
     def test_string_evaluation(self) -> None:
         tests: List[Tuple[str, str]] = [
             ('"Hello world!"', 'Hello world!'),
@@ -330,4 +370,201 @@ class EvaluatorTest(TestCase):
         self.assertIsInstance(evaluated, String)
 
         evaluated = cast(String, evaluated)
-        self.assertEquals(evaluated.value, expected)
\ No newline at end of file
+        self.assertEquals(evaluated.value, expected)
+
+class TailCallTest(TestCase):
+
+    def test_tail_calls_run_in_constant_stack(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable cuenta = procedimiento(n, total) {
+                     si (n == 0) { regresa total; }
+                     regresa cuenta(n - 1, total + 1);
+                 };
+                 cuenta(5000, 0);
+             ''', 5000),
+            ('''
+                 variable cuenta = procedimiento(n, total) {
+                     si (n == 0) { total } si_no { cuenta(n - 1, total + 1) }
+                 };
+                 cuenta(5000, 0);
+             ''', 5000),
+            ('''
+                 variable par = procedimiento(n) { si (n == 0) { verdadero } si_no { impar(n - 1) } };
+                 variable impar = procedimiento(n) { si (n == 0) { falso } si_no { par(n - 1) } };
+                 si (par(5001)) { 0 } si_no { 1 };
+             ''', 1),
+        ]
+
+        for source, expected in tests:
+            evaluated = evaluate(Parser(tokenize(source)).parse_program(), Environment())
+
+            self.assertIsInstance(evaluated, Integer)
+            self.assertEqual(cast(Integer, evaluated).value, expected)
+
+
+class ValueCacheTest(TestCase):
+
+    def test_literals_are_materialized_once(self) -> None:
+        for source in ('5000', '"hola"'):
+            program: Program = Parser(tokenize(source)).parse_program()
+
+            self.assertIs(evaluate(program, Environment()), evaluate(program, Environment()))
+
+    def test_small_integers_are_shared(self) -> None:
+        self.assertIs(self._evaluate('2 + 3'), self._evaluate('10 / 2'))
+        self.assertIs(self._evaluate('-1'), self._evaluate('1 - 2'))
+        self.assertIsNot(self._evaluate('2000 + 1'), self._evaluate('2000 + 1'))
+
+    def test_equal_string_literals_are_shared(self) -> None:
+        self.assertIs(self._evaluate('"hola"'), self._evaluate('"hola"'))
+        self.assertIsNot(self._evaluate('"hola"'), self._evaluate('"ho" + "la"'))
+        self.assertIs(self._evaluate('"hola" == "ho" + "la"'), TRUE)
+
+    def _evaluate(self, source: str) -> Optional[Object]:
+        return evaluate(Parser(tokenize(source)).parse_program(), Environment())
+
+
+class QuickeningTest(TestCase):
+
+    def test_integer_operations_specialize(self) -> None:
+        for engine in (evaluate, evaluate_iterative):
+            # f is also used as a value, so lpm.typecheck cannot know the
+            # types of its parameters.
+            program: Program = Parser(tokenize('''
+                variable f = procedimiento(a, b) { a + b };
+                variable g = f;
+                f(1, 2) + g(30, 40);
+            ''')).parse_program()
+            evaluated = engine(program, Environment())
+
+            self.assertEqual(cast(Integer, evaluated).value, 73)
+            function = cast(ASTFunction, cast(LetStatement, program.statements[0]).value)
+            assert function.body is not None
+            body = cast(ExpressionStatement, function.body.statements[0])
+            infix = cast(Infix, body.expression)
+            self.assertIsNotNone(infix.quick)
+            self.assertFalse(infix.generic)
+
+    def test_other_operands_deoptimize(self) -> None:
+        for engine in (evaluate, evaluate_iterative):
+            program: Program = Parser(tokenize('''
+                variable f = procedimiento(a, b) { a + b };
+                variable x = f(1, 2);
+                variable y = f("a", "b");
+                variable z = f(3, 4);
+                variable e = f(verdadero, 1);
+            ''')).parse_program()
+            env: Environment = Environment()
+            engine(program, env)
+
+            self.assertEqual(cast(Integer, env['x']).value, 3)
+            self.assertEqual(cast(String, env['y']).value, 'ab')
+            self.assertEqual(cast(Integer, env['z']).value, 7)
+            self.assertEqual(cast(Error, env['e']).message, 'Discrepancia de tipos: BOOLEAN + INTEGER')
+            function = cast(ASTFunction, cast(LetStatement, program.statements[0]).value)
+            assert function.body is not None
+            body = cast(ExpressionStatement, function.body.statements[0])
+            infix = cast(Infix, body.expression)
+            self.assertIsNone(infix.quick)
+            self.assertTrue(infix.generic)
+
+    def test_specialized_results(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('variable f = procedimiento(a, b) { a - b }; f(1, 2) + f(2000, 1);', 1998),
+            ('variable f = procedimiento(a, b) { a * b }; f(3, 4) + f(-5, 6);', -18),
+            ('variable f = procedimiento(a, b) { a / b }; f(7, 2) + f(-7, 2);', -1),
+            ('variable f = procedimiento(a, b) { a < b }; f(1, 2) == f(3, 2);', False),
+            ('variable f = procedimiento(a, b) { a > b }; f(1, 2) == f(1, 3);', True),
+            ('variable f = procedimiento(a, b) { a == b }; f(1, 1) == f(2, 2);', True),
+            ('variable f = procedimiento(a, b) { a != b }; f(1, 1) != f(1, 2);', True),
+        ]
+
+        for source, expected in tests:
+            evaluated = evaluate(Parser(tokenize(source)).parse_program(), Environment())
+
+            if type(expected) == bool:
+                self.assertIs(cast(Boolean, evaluated).value, expected, source)
+            else:
+                self.assertEqual(cast(Integer, evaluated).value, expected, source)
+
+    def test_division_by_zero_still_raises(self) -> None:
+        program: Program = Parser(tokenize('''
+            variable f = procedimiento(a, b) { a / b };
+            f(4, 2);
+            f(1, 0);
+        ''')).parse_program()
+
+        with self.assertRaises(ZeroDivisionError):
+            evaluate(program, Environment())
+
+
+class LazyEvaluatorTest(EvaluatorTest):
+
+    def test_syntax_error_in_body_is_reported_on_call(self) -> None:
+        source: str = '''
+            variable roto = procedimiento(x) { regresa x + ; };
+            variable bien = procedimiento(x) { regresa x; };
+        '''
+        program: Program = Parser(tokenize(source), lazy=True).parse_program()
+        env: Environment = Environment()
+        evaluate(program, env)
+
+        bien = evaluate(Parser(tokenize('bien(1)')).parse_program(), env)
+        roto = evaluate(Parser(tokenize('roto(1)')).parse_program(), env)
+
+        assert bien is not None and roto is not None
+        self._test_integer_object(bien, 1)
+        self._test_error_object(roto, 'Error de sintaxis: No se encontró ninguna función para parsear ;')
+
+    def _evaluate_tests(self, source: str) -> Object:
+        parser: Parser = Parser(tokenize(source), lazy=True)
+        program: Program = parser.parse_program()
+        env: Environment = Environment()
+
+        evaluated = evaluate(program, env)
+
+        assert evaluated is not None
+        return evaluated
+
+
+class IterativeEvaluatorTest(EvaluatorTest):
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            variable cuenta = procedimiento(n) { si (n == 0) { 0 } si_no { 1 + cuenta(n - 1) } };
+            cuenta(20000);
+        '''
+
+        self._test_integer_object(self._evaluate_tests(source), 20000)
+
+    def test_deep_expressions(self) -> None:
+        # The parser recurses on nested prefixes, so that tree is built here.
+        expression: Expression = ASTInteger(Token(TokenType.INT, '1'), 1)
+        for _ in range(5000):
+            expression = Prefix(Token(TokenType.SUBSTRACT, '-'), '-', expression)
+        program: Program = Program([ExpressionStatement(Token(TokenType.SUBSTRACT, '-'), expression)])
+
+        self._test_integer_object(cast(Object, evaluate_iterative(program, Environment())), 1)
+        self._test_integer_object(self._evaluate_tests(' + '.join(['1'] * 5000) + ';'), 5000)
+        self._test_integer_object(self._evaluate_tests(
+            'variable f = procedimiento(x) { ' + ' + '.join(['x'] * 5000) + ' }; f(2);'), 10000)
+
+    def test_max_depth(self) -> None:
+        source: str = '''
+            variable cuenta = procedimiento(n) { si (n == 0) { 0 } si_no { 1 + cuenta(n - 1) } };
+            cuenta(100);
+        '''
+        program: Program = Parser(tokenize(source)).parse_program()
+
+        self._test_integer_object(cast(Object, evaluate_iterative(program, Environment(), max_depth=101)), 100)
+        self._test_error_object(cast(Object, evaluate_iterative(program, Environment(), max_depth=100)),
+                                'Profundidad máxima de recursión excedida: 100')
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program: Program = Parser(tokenize(source)).parse_program()
+
+        evaluated = evaluate_iterative(program, Environment())
+
+        assert evaluated is not None
+        return evaluated
@@ -0,0 +1,83 @@
+from unittest import TestCase
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+
+from lpm.ast import (
+    ExpressionStatement,
+    Infix,
+    LetStatement,
+    Program,
+)
+from lpm.incremental import Document
+from lpm.lexer import tokenize
+from lpm.parser import Parser
+
+
+class IncrementalTest(TestCase):
+
+    def test_edit_matches_full_parse(self) -> None:
+        source: str = '''
+            variable a = 5;
+            variable suma = procedimiento(x, y) { regresa x + y; };
+            a
+            suma(a, 10);
+        '''
+        tests: List[Tuple[int, int, str]] = [
+            (source.index('5;'), 1, '50'),
+            (source.index('x + y'), 0, 'x * '),
+            (source.index('\n            suma(a'), 0, ' + 1'),
+            (source.index('variable a'), 8, 'variablex'),
+            (source.index('{ regresa'), 1, ''),
+            (len(source), 0, 'verdadero'),
+        ]
+
+        for offset, removed, inserted in tests:
+            document: Document = Document(source)
+            program: Program = document.edit(offset, removed, inserted)
+
+            new_source = source[:offset] + inserted + source[offset + removed:]
+            parser: Parser = Parser(tokenize(new_source))
+            expected_program: Program = parser.parse_program()
+
+            self.assertEqual(document.source, new_source)
+            self.assertEqual(list(document.tokens), list(tokenize(new_source)))
+            self.assertEqual(str(program), str(expected_program))
+            self.assertEqual(document.errors, parser.errors)
+
+    def test_edit_reuses_unchanged_statements(self) -> None:
+        source: str = 'variable a = 1;\n' * 50
+        document: Document = Document(source)
+        before = list(document.program.statements)
+
+        program: Program = document.edit(source.index('1', 16 * 20), 1, '2 + 3')
+
+        self.assertEqual(len(program.statements), 50)
+        for idx, statement in enumerate(program.statements):
+            if idx == 20:
+                self.assertIsNot(statement, before[idx])
+                self.assertIsInstance(cast(LetStatement, statement).value, Infix)
+            else:
+                self.assertIs(statement, before[idx])
+
+    def test_edit_merges_statements(self) -> None:
+        document: Document = Document('a\nb;\nc;')
+
+        program: Program = document.edit(2, 0, '+ ')
+
+        self.assertEqual(len(program.statements), 2)
+        self.assertIsInstance(program.statements[0], ExpressionStatement)
+        self.assertEqual(str(program), '(a + b)c')
+
+    def test_edit_reports_errors(self) -> None:
+        document: Document = Document('variable x = 5;\nvariable y = 6;')
+
+        document.edit(11, 1, '')
+
+        self.assertEqual(len(document.errors), 1)
+
+        document.edit(11, 0, '=')
+
+        self.assertEqual(document.errors, [])
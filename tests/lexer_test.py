@@ -1,11 +1,25 @@
+from io import (
+    BytesIO,
+    StringIO,
+)
+from mmap import mmap
+from tempfile import TemporaryFile
 from unittest import TestCase
-from typing import List
+from typing import (
+    List,
+    Union,
+)
 
 from lpm.token import (
     Token,
     TokenType
 )
-from lpm.lexer import Lexer
+from lpm.lexer import (
+    Lexer,
+    StreamLexer,
+    TokenBuffer,
+    tokenize,
+)
 
 class LexerTest(TestCase):
 
@@ -248,4 +262,143 @@ class LexerTest(TestCase):
             Token(TokenType.SEMICOLON, ';'),
         ]
 
-        self.assertEquals(tokens, expected_tokens)
\ No newline at end of file
+        self.assertEquals(tokens, expected_tokens)
+
+    def test_unterminated_string(self) -> None:
+        source: str = 'variable a = "sin cierre'
+        lexer: Lexer = Lexer(source)
+
+        tokens: List[Token] = []
+        for i in range(6):
+            tokens.append(lexer.next_token())
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.LET, 'variable'),
+            Token(TokenType.IDENT, 'a'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.STRING, 'sin cierre'),
+            Token(TokenType.EOF, ''),
+            Token(TokenType.EOF, ''),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
+    def test_accented_identifiers_and_numbers(self) -> None:
+        source: str = 'año_2 =! cañón1 10x'
+        lexer: Lexer = Lexer(source)
+
+        tokens: List[Token] = []
+        for i in range(7):
+            tokens.append(lexer.next_token())
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.IDENT, 'año_2'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.DIFFERENT, '!'),
+            Token(TokenType.IDENT, 'cañón1'),
+            Token(TokenType.INT, '10'),
+            Token(TokenType.IDENT, 'x'),
+            Token(TokenType.EOF, ''),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
+
+    def test_stream_matches_in_memory_lexer(self) -> None:
+        source: str = '''
+            variable año = procedimiento(x, y) {
+                si (x == y) { regresa "iguales"; } si_no { regresa x != y; }
+            };
+            año(10, 20) <= ¡@ "sin cierre
+        '''
+        lexer: Lexer = Lexer(source)
+
+        expected_tokens: List[Token] = []
+        while (token := lexer.next_token()).token_type != TokenType.EOF:
+            expected_tokens.append(token)
+        expected_tokens.append(token)
+
+        for chunk_size in [1, 2, 3, 7, 64]:
+            tokens = list(StreamLexer(StringIO(source), chunk_size=chunk_size))
+            self.assertEqual(tokens, expected_tokens)
+
+            tokens = list(StreamLexer(BytesIO(source.encode('utf-8')), chunk_size=chunk_size))
+            self.assertEqual(tokens, expected_tokens)
+
+    def test_stream_from_file_and_mmap(self) -> None:
+        source: str = 'variable cañón = "Platzi";\n' * 100
+
+        with TemporaryFile() as stream:
+            stream.write(source.encode('utf-8'))
+            stream.flush()
+
+            mapped = mmap(stream.fileno(), 0)
+            tokens = list(StreamLexer(mapped, chunk_size=5))
+            mapped.close()
+
+        self.assertEqual(len(tokens), 501)
+        self.assertEqual(tokens[1], Token(TokenType.IDENT, 'cañón'))
+        self.assertEqual(tokens[3], Token(TokenType.STRING, 'Platzi'))
+        self.assertEqual(tokens[-1], Token(TokenType.EOF, ''))
+
+    def test_stream_next_token_keeps_returning_eof(self) -> None:
+        lexer: StreamLexer = StreamLexer(StringIO('5;'))
+
+        tokens: List[Token] = []
+        for i in range(4):
+            tokens.append(lexer.next_token())
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.INT, '5'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.EOF, ''),
+            Token(TokenType.EOF, ''),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
+    def test_tokenize_matches_lexer(self) -> None:
+        source: str = '''
+            variable suma = procedimiento(x, y) {
+                regresa x + y;
+            };
+            si (suma(1, 2) != 3) { "mal" } si_no { ¡ }
+        '''
+        lexer: Lexer = Lexer(source)
+
+        expected_tokens: List[Token] = []
+        while (token := lexer.next_token()).token_type != TokenType.EOF:
+            expected_tokens.append(token)
+        expected_tokens.append(token)
+
+        buffer: TokenBuffer = tokenize(source)
+
+        self.assertEqual(list(buffer), expected_tokens)
+        self.assertEqual(len(buffer), len(expected_tokens))
+        self.assertEqual(list(buffer.kinds), [token.token_type.value for token in expected_tokens])
+
+    def test_tokenize_offsets_and_positions(self) -> None:
+        source: str = 'variable x = "hola";\n  x == 10;'
+        buffer: TokenBuffer = tokenize(source)
+
+        spans = [source[start:end] for start, end in zip(buffer.starts, buffer.ends)]
+
+        self.assertEqual(spans, ['variable', 'x', '=', '"hola"', ';', 'x', '==', '10', ';', ''])
+        self.assertEqual(buffer.position(0), (1, 1))
+        self.assertEqual(buffer.position(3), (1, 14))
+        self.assertEqual(buffer.position(5), (2, 3))
+        self.assertEqual(buffer.position(9), (2, 11))
+        self.assertIs(buffer.literals[1], buffer.literals[5])
+
+    def test_token_starts(self) -> None:
+        source: str = 'variable x = "hola";\n  x == 10;'
+        expected_starts: List[int] = list(tokenize(source).starts)
+
+        lexers: List[Union[Lexer, StreamLexer]] = [Lexer(source), StreamLexer(StringIO(source), chunk_size=3)]
+        for lexer in lexers:
+            starts: List[int] = []
+            while lexer.next_token().token_type != TokenType.EOF:
+                starts.append(lexer.start)
+            starts.append(lexer.start)
+
+            self.assertEqual(starts, expected_starts)
@@ -0,0 +1,76 @@
+from typing import cast
+from unittest import TestCase
+
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    _UNSET,
+    Environment,
+    Frame,
+    Function,
+    Integer,
+)
+from lpm.parser import Parser
+
+
+class EnvironmentTest(TestCase):
+
+    def test_lookup_by_name(self) -> None:
+        outer: Environment = Environment()
+        outer['a'] = Integer(1)
+        outer['b'] = None
+        env: Environment = Environment(outer=outer)
+        env['a'] = Integer(2)
+
+        self.assertEqual(cast(Integer, env['a']).value, 2)
+        self.assertIsNone(env['b'])
+        self.assertIsNone(env.local('b'))
+        self.assertEqual(env.get('c', 3), 3)
+        with self.assertRaises(KeyError):
+            env['c']
+
+        del env['a']
+        self.assertEqual(cast(Integer, env['a']).value, 1)
+
+    def test_frames(self) -> None:
+        outer: Environment = Environment()
+        outer['x'] = Integer(1)
+        frame = Frame([Integer(2), _UNSET], {'y': 0, 'x': 1}, outer)
+
+        self.assertEqual(cast(Integer, frame['y']).value, 2)
+        # A slot that has not been assigned yet falls through to the outer scope.
+        self.assertEqual(cast(Integer, frame['x']).value, 1)
+        self.assertIsNone(frame.local('x'))
+
+        frame['x'] = Integer(3)
+        self.assertEqual(cast(Integer, frame.values[1]).value, 3)
+        self.assertEqual(cast(Integer, Environment(outer=frame)['x']).value, 3)
+
+        del frame['x']
+        self.assertEqual(cast(Integer, frame['x']).value, 1)
+        with self.assertRaises(KeyError):
+            frame['z']
+
+    def test_frames_are_environments(self) -> None:
+        outer: Environment = Environment()
+        outer['x'] = Integer(1)
+        frame = Frame([_UNSET], {'y': 0}, outer)
+
+        self.assertEqual(cast(Integer, Environment.local(frame, 'x', Integer(2))).value, 2)
+        self.assertEqual(cast(Integer, Environment.get(frame, 'x')).value, 1)
+        self.assertEqual(frame.version, 0)
+        with self.assertRaises(TypeError):
+            Environment.__setitem__(frame, 'x', Integer(3))
+
+    def test_calls_use_frames(self) -> None:
+        env: Environment = Environment()
+        program = Parser(tokenize('''
+            variable f = procedimiento(a, b) { variable c = a + b; procedimiento() { c } };
+            variable g = f(1, 2);
+        ''')).parse_program()
+        evaluate(program, env)
+
+        closure = cast(Function, env['g'])
+        self.assertIsInstance(closure.env, Frame)
+        self.assertEqual(cast(Frame, closure.env).slots, {'a': 0, 'b': 1, 'c': 2})
+        self.assertEqual([cast(Integer, value).value for value in cast(Frame, closure.env).values], [1, 2, 3])
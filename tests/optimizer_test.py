@@ -0,0 +1,120 @@
+from typing import (
+    List,
+    Tuple,
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from lpm.ast import Program
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Object,
+)
+from lpm.optimizer import (
+    optimize,
+    OptimizationReport,
+)
+from lpm.parser import Parser
+
+
+class OptimizedEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program: Program = Parser(tokenize(source)).parse_program()
+        optimize(program)
+
+        evaluated = evaluate(program, Environment())
+
+        assert evaluated is not None
+        return evaluated
+
+
+class OptimizerTest(TestCase):
+
+    def test_constant_folding(self) -> None:
+        tests: List[Tuple[str, str, int]] = [
+            ('2 * (5 - 3);', '4', 2),
+            ('-5 + 10;', '5', 2),
+            ('!falso;', 'verdadero', 1),
+            ('!!5;', 'verdadero', 2),
+            ('1 < 2 == verdadero;', 'verdadero', 2),
+            ('"a" + "b";', 'ab', 1),
+            ('"a" == "a";', 'verdadero', 1),
+            ('1 == verdadero;', 'falso', 1),
+            ('x * (2 + 3);', '(x * 5)', 1),
+        ]
+
+        for source, expected, folded in tests:
+            program, report = self._optimize(source)
+
+            self.assertEqual(str(program), expected)
+            self.assertEqual(report.folded, folded)
+
+    def test_errors_are_not_folded(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('10 / 0;', '(10 / 0)'),
+            ('5 + verdadero;', '(5 + verdadero)'),
+            ('verdadero + falso;', '(verdadero + falso)'),
+            ('-verdadero;', '(-verdadero)'),
+            ('"a" - "b";', '(a - b)'),
+            ('1 + 2 / 0;', '(1 + (2 / 0))'),
+        ]
+
+        for source, expected in tests:
+            program, report = self._optimize(source)
+
+            self.assertEqual(str(program), expected)
+            self.assertEqual(report.total, 0)
+
+    def test_branch_pruning(self) -> None:
+        tests: List[Tuple[str, str, int]] = [
+            ('si (verdadero) { 1 } si_no { 2 };', '1', 1),
+            ('si (1 > 2) { 1 } si_no { 2 };', '2', 1),
+            ('variable a = si (falso) { 1 } si_no { 2 };', 'variable a = 2;', 1),
+            ('si ("") { variable a = 1; a } si_no { 2 };', 'variable a = 1;a', 1),
+            ('si (falso) { 1 }; 3;', '3', 1),
+            ('si (x) { 1 } si_no { 2 };', 'si x 1si_no 2', 0),
+            ('variable a = si (verdadero) { variable b = 1; b };', 'variable a = si verdadero variable b = 1;b;', 0),
+            ('5; si (falso) { 1 };', '5si falso 1', 0),
+        ]
+
+        for source, expected, pruned in tests:
+            program, report = self._optimize(source)
+
+            self.assertEqual(str(program), expected)
+            self.assertEqual(report.pruned, pruned)
+
+    def test_dead_code_removal(self) -> None:
+        tests: List[Tuple[str, str, int]] = [
+            ('regresa 1; 2; 3;', 'regresa 1;', 2),
+            ('procedimiento(x) { regresa x; x + 1; };', 'procedimiento(x) regresa x;', 1),
+            ('si (x) { regresa 1; } si_no { regresa 2; }; 3;', 'si x regresa 1;si_no regresa 2;', 1),
+            ('si (x) { regresa 1; }; 3;', 'si x regresa 1;3', 0),
+            ('si (verdadero) { regresa 1; }; 2;', 'regresa 1;', 1),
+        ]
+
+        for source, expected, removed in tests:
+            program, report = self._optimize(source)
+
+            self.assertEqual(str(program), expected)
+            self.assertEqual(report.removed, removed)
+
+    def test_report(self) -> None:
+        _, report = self._optimize('si (1 < 2) { regresa 3 * 4; 5; };')
+
+        self.assertEqual(report.changes, [
+            '(1 < 2) -> verdadero',
+            '(3 * 4) -> 12',
+            'código inalcanzable: 5',
+            'si verdadero: se conserva la consecuencia',
+        ])
+        self.assertEqual(report.total, 4)
+
+    def _optimize(self, source: str) -> Tuple[Program, OptimizationReport]:
+        parser: Parser = Parser(tokenize(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        return program, optimize(program)
@@ -1,7 +1,14 @@
 from unittest import TestCase
 
-from lpm.lexer import Lexer
+from lpm.lexer import (
+    Lexer,
+    tokenize,
+)
 from lpm.parser import Parser
+from lpm.token import (
+    Token,
+    TokenType,
+)
 from lpm.ast import (
     Expression,
     ExpressionStatement,
@@ -17,6 +24,7 @@ from lpm.ast import (
     If,
     Function,
     Call,
+    LazyBlock,
     StringLiteral,
 )
 
@@ -39,6 +47,159 @@ class ParserTest(TestCase):
         self.assertIsNotNone(program)
         self.assertIsInstance(program, Program)
 
+    def test_parse_from_token_buffer(self) -> None:
+        source: str = '''
+            variable suma = procedimiento(x, y) { regresa x + y * 2; };
+            si (suma(1, -2) < 3) { !verdadero } si_no { falso };
+            variable x 5;
+        '''
+        lexer_parser: Parser = Parser(Lexer(source))
+        lexer_program: Program = lexer_parser.parse_program()
+
+        buffer_parser: Parser = Parser(tokenize(source))
+        buffer_program: Program = buffer_parser.parse_program()
+
+        self.assertEqual(str(buffer_program), str(lexer_program))
+        self.assertEqual(buffer_parser.errors, lexer_parser.errors)
+
+    def test_node_offsets(self) -> None:
+        source: str = 'variable suma = procedimiento(x) { regresa -x + "uno"; };'
+        program: Program = Parser(tokenize(source)).parse_program()
+
+        let_statement = cast(LetStatement, program.statements[0])
+        function = cast(Function, let_statement.value)
+        assert function.body is not None
+        return_statement = cast(ReturnStatement, function.body.statements[0])
+        infix = cast(Infix, return_statement.return_value)
+
+        self.assertEqual(let_statement.start, 0)
+        self.assertEqual(cast(Identifier, let_statement.name).start, source.index('suma'))
+        self.assertEqual(function.start, source.index('procedimiento'))
+        self.assertEqual(function.parameters[0].start, source.index('x'))
+        self.assertEqual(function.body.start, source.index('{'))
+        self.assertEqual(return_statement.start, source.index('regresa'))
+        self.assertEqual(cast(Prefix, infix.left).start, source.index('-'))
+        self.assertEqual(infix.start, source.index('+'))
+        self.assertEqual(cast(StringLiteral, infix.right).start, source.index('"'))
+        self.assertEqual(infix.token_literal(), '+')
+
+    def test_iterative_matches_recursive(self) -> None:
+        sources: List[str] = [
+            'variable suma = procedimiento(x, y) { regresa x + y * 2; };',
+            'si (suma(1, -2) < 3) { !verdadero } si_no { falso };',
+            '-(5 + 5) * 2 / (3 - !x) == f(a, b * c, g(h(1)))(2);',
+            'a + b * c + d / e - f; (((1)));',
+            'variable x 5; (1 + ; -; 2 * ;',
+        ]
+
+        for source in sources:
+            recursive_parser: Parser = Parser(tokenize(source))
+            recursive_program: Program = recursive_parser.parse_program()
+
+            iterative_parser: Parser = Parser(tokenize(source), iterative=True)
+            iterative_program: Program = iterative_parser.parse_program()
+
+            self.assertEqual(str(iterative_program), str(recursive_program))
+            self.assertEqual(iterative_parser.errors, recursive_parser.errors)
+
+    def test_iterative_deep_nesting(self) -> None:
+        depth: int = 100000
+        source: str = '(' * depth + '-f(' * depth + '1' + ')' * depth * 2 + ';'
+
+        parser: Parser = Parser(tokenize(source), iterative=True)
+        program: Program = parser.parse_program()
+
+        self._test_program_statements(parser, program)
+        node = cast(ExpressionStatement, program.statements[0]).expression
+        for _ in range(depth):
+            prefix = cast(Prefix, node)
+            call = cast(Call, prefix.right)
+            self.assertEqual(prefix.operator, '-')
+            self.assertEqual(cast(Identifier, call.function).value, 'f')
+            assert call.arguments is not None
+            node = call.arguments[0]
+
+        assert node is not None
+        self._test_literal_expression(node, 1)
+
+    def test_lazy_function_bodies(self) -> None:
+        source: str = '''
+            variable suma = procedimiento(x, y) {
+                variable interna = procedimiento(z) { regresa z * 2; };
+                regresa interna(x) + y;
+            };
+            suma(1, 2);
+            procedimiento() { si (verdadero) { 1 } }
+        '''
+        eager_program: Program = Parser(tokenize(source)).parse_program()
+
+        parser: Parser = Parser(tokenize(source), lazy=True)
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        function = cast(Function, cast(LetStatement, program.statements[0]).value)
+        body = cast(LazyBlock, function.body)
+        self.assertIsInstance(body, LazyBlock)
+        self.assertFalse(body.parsed)
+        self.assertEqual(source[body.start:body.end], source[source.index('{'):source.index('suma(1, 2)')].rstrip()[:-1])
+
+        self.assertEqual(str(program), str(eager_program))
+        self.assertTrue(body.parsed)
+        self.assertEqual(body.errors, [])
+
+    def test_lazy_validation_reports_body_errors(self) -> None:
+        source: str = '''
+            variable f = procedimiento(x) { regresa x + ; };
+            variable g = procedimiento() { procedimiento() { variable 5; } };
+        '''
+        eager_parser: Parser = Parser(tokenize(source))
+        eager_parser.parse_program()
+
+        lazy_parser: Parser = Parser(tokenize(source), lazy=True)
+        lazy_parser.parse_program()
+
+        validating_parser: Parser = Parser(tokenize(source), lazy=True, validate=True)
+        validating_parser.parse_program()
+
+        self.assertEqual(lazy_parser.errors, [])
+        self.assertEqual(validating_parser.errors, eager_parser.errors)
+
+    def test_error_recovery(self) -> None:
+        source: str = '''
+            variable x 5;
+            si (x { variable a = 1; } si_no { 2 };
+            variable f = procedimiento(y) { regresa (y + ) * 2; variable b = y; };
+            (1 + ;
+            variable z = 10;
+        '''
+        for iterative in [False, True]:
+            parser: Parser = Parser(tokenize(source), iterative=iterative)
+            program: Program = parser.parse_program()
+
+            self.assertEqual(parser.errors, [
+                'Se esperaba que el siguiente token fuera TokenType.ASSIGN pero se obtuvo TokenType.INT',
+                'Se esperaba que el siguiente token fuera TokenType.RPAREN pero se obtuvo TokenType.LBRACE',
+                'No se encontró ninguna función para parsear )',
+                'No se encontró ninguna función para parsear ;',
+            ])
+
+            let_statements = [statement for statement in program.statements
+                              if isinstance(statement, LetStatement)]
+            self.assertEqual([str(statement.name) for statement in let_statements], ['f', 'z'])
+
+            function = cast(Function, let_statements[0].value)
+            assert function.body is not None
+            self.assertEqual(str(function.body.statements[-1]), 'variable b = y;')
+
+    def test_statement_tokens(self) -> None:
+        source: str = '(1 + 2) * 3; 007 + 1; f(1);'
+        program: Program = Parser(tokenize(source)).parse_program()
+
+        self.assertEqual([statement.token_literal() for statement in program.statements], ['(', '007', 'f'])
+        integer = cast(Infix, cast(ExpressionStatement, program.statements[1]).expression).left
+        self.assertEqual(integer.token, Token(TokenType.INT, '007'))
+        self.assertEqual(cast(Integer, integer).value, 7)
+
     def test_let_statements(self) -> None:
         source: str = '''
             variable x = 5;
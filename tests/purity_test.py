@@ -0,0 +1,133 @@
+from typing import (
+    cast,
+    List,
+)
+from unittest import TestCase
+
+from lpm.ast import (
+    Function,
+    Identifier,
+    LetStatement,
+    Program,
+)
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.memo import Memo
+from lpm.object import (
+    Environment,
+    Error,
+    Function as FunctionObject,
+    Integer,
+)
+from lpm.parser import Parser
+from lpm.purity import analyze
+from lpm.repl import Session
+from lpm.resolver import resolve
+
+
+class PurityTest(TestCase):
+
+    def test_pure_procedimientos(self) -> None:
+        program = self._analyze('''
+            variable k = 1;
+            variable fib = procedimiento(n) { si (n < 2) { n } si_no { fib(n - 1) + fib(n - 2) } };
+            variable par = procedimiento(n) { si (n == 0) { verdadero } si_no { impar(n - 1) } };
+            variable impar = procedimiento(n) { si (n == 0) { falso } si_no { par(n - 1) } };
+            variable mide = procedimiento(s) { variable t = s + "!"; longitud(t) };
+            variable anidado = procedimiento(a) { variable f = procedimiento(b) { a + b }; f(a) };
+            variable suma_k = procedimiento(x) { x + k };
+            variable usa_suma_k = procedimiento(x) { suma_k(x) };
+            variable llama = procedimiento(f, x) { f(x) };
+            variable desconocido = procedimiento(x) { nada(x) };
+            variable dos_veces = procedimiento(x) { x };
+            variable dos_veces = procedimiento(x) { x };
+        ''', 16)
+
+        self.assertEqual(analyze(program, 16), ['anidado', 'fib', 'impar', 'llama', 'mide', 'par'])
+        sizes = [(cast(Identifier, cast(LetStatement, statement).name).value,
+                  cast(Function, cast(LetStatement, statement).value).memo_size)
+                 for statement in program.statements[1:]]
+        self.assertEqual(sizes[0], ('fib', 16))
+        self.assertIn(('suma_k', 0), sizes)
+        self.assertIn(('usa_suma_k', 0), sizes)
+        self.assertIn(('dos_veces', 0), sizes)
+
+    def test_memoized_results(self) -> None:
+        env: Environment = Environment()
+        evaluated = evaluate(Parser(tokenize('''
+            variable fib = procedimiento(n) { si (n < 2) { n } si_no { fib(n - 1) + fib(n - 2) } };
+            fib(60);
+        ''')).parse_program(), env)
+
+        self.assertEqual(cast(Integer, evaluated).value, 1548008755920)
+        memo = cast(Memo, cast(FunctionObject, env['fib']).memo)
+        self.assertEqual(memo.misses, 61)
+        self.assertEqual(memo.hits, 58)
+
+    def test_tail_calls_are_not_memoized(self) -> None:
+        env: Environment = Environment()
+        evaluated = evaluate(Parser(tokenize('''
+            variable suma = procedimiento(n, total) { si (n < 1) { regresa total; } suma(n - 1, total + n) };
+            suma(1000, 0);
+        ''')).parse_program(), env)
+
+        self.assertEqual(cast(Integer, evaluated).value, 500500)
+        memo = cast(Memo, cast(FunctionObject, env['suma']).memo)
+        self.assertEqual(len(memo), 1)
+        self.assertEqual(memo.misses, 1)
+
+    def test_results_match_unmemoized_evaluation(self) -> None:
+        tests: List[str] = [
+            'variable f = procedimiento(x) { x }; f(1) == f(1);',
+            'variable f = procedimiento(x) { x + 1 }; variable a = f(verdadero); variable b = f(1); b;',
+            'variable f = procedimiento(x) { si (x) { 1 } si_no { 2 } }; f(1) + f(verdadero) + f(falso);',
+            'variable f = procedimiento(x) { x - 1 }; f("a") == f("a");',
+            'variable f = procedimiento(x) { procedimiento() { x } }; f(1) == f(1);',
+            'variable f = procedimiento(x) { si (x) { regresa si (verdadero) { regresa 1 } } 2 }; f(verdadero);',
+            'variable f = procedimiento(n) { si (n == 0) { 0 } si_no { f(n - 1) } }; f(3) + f(3);',
+        ]
+
+        for source in tests:
+            memoized = evaluate(Parser(tokenize(source)).parse_program(), Environment())
+            plain = evaluate(Parser(tokenize(source)).parse_program(), Environment(), 0)
+
+            self.assertEqual(type(memoized), type(plain), source)
+            self.assertEqual(cast(Integer, memoized).inspect(), cast(Integer, plain).inspect(), source)
+
+    def test_rebinding_globals_drops_results(self) -> None:
+        session: Session = Session()
+
+        session.execute('variable f = procedimiento(x) { g(x) }; variable y = f(1);')
+        self.assertIsInstance(session.execute('y;'), Error)
+
+        session.execute('variable g = procedimiento(x) { x * 2 };')
+        self.assertEqual(cast(Integer, session.execute('f(1);')).value, 2)
+
+        session.execute('variable g = procedimiento(x) { x * 3 };')
+        self.assertEqual(cast(Integer, session.execute('f(1);')).value, 3)
+
+    def test_least_recently_used_results_are_evicted(self) -> None:
+        memo = Memo(2)
+
+        self.assertIsNone(memo.get((1,), 0))
+        memo.put((1,), Integer(1))
+        memo.put((2,), Integer(2))
+        self.assertEqual(cast(Integer, memo.get((1,), 0)).value, 1)
+        memo.put((3,), Integer(3))
+
+        self.assertEqual(len(memo), 2)
+        self.assertIsNone(memo.get((2,), 0))
+        self.assertIsNotNone(memo.get((3,), 0))
+        self.assertEqual((memo.hits, memo.misses), (2, 2))
+
+        self.assertIsNone(memo.get((3,), 1))
+        self.assertEqual(len(memo), 0)
+
+    def _analyze(self, source: str, memo_size: int) -> Program:
+        parser: Parser = Parser(tokenize(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        resolve(program)
+        analyze(program, memo_size)
+        return program
@@ -0,0 +1,73 @@
+from unittest import TestCase
+from typing import cast
+
+from lpm.object import (
+    Error,
+    Integer,
+)
+from lpm.repl import (
+    ENGINES,
+    Session,
+    is_complete,
+)
+
+
+class SessionTest(TestCase):
+
+    def test_state_persists_between_lines(self) -> None:
+        session: Session = Session()
+
+        session.execute('variable a = 5;')
+        session.execute('variable doble = procedimiento(x) { regresa x * 2; };')
+        evaluated = session.execute('doble(a) + 1;')
+
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEqual(cast(Integer, evaluated).value, 11)
+        self.assertEqual(len(session.history), 3)
+
+    def test_parse_errors_are_not_recorded(self) -> None:
+        session: Session = Session()
+
+        session.execute('variable a = 5;')
+        evaluated = session.execute('variable b 5;')
+
+        self.assertIsNone(evaluated)
+        self.assertEqual(len(session.errors), 1)
+        self.assertEqual(session.history, ['variable a = 5;'])
+
+        evaluated = session.execute('a;')
+
+        self.assertEqual(session.errors, [])
+        self.assertEqual(cast(Integer, evaluated).value, 5)
+
+    def test_rebuild_replays_history(self) -> None:
+        session: Session = Session()
+
+        session.execute('variable a = 5;')
+        session.execute('variable b = a * 3;')
+        session.rebuild()
+
+        evaluated = session.execute('b;')
+
+        self.assertEqual(cast(Integer, evaluated).value, 15)
+
+        session.history.clear()
+        session.rebuild()
+        evaluated = session.execute('b;')
+
+        self.assertIsInstance(evaluated, Error)
+
+    def test_is_complete(self) -> None:
+        self.assertTrue(is_complete('variable a = 5;'))
+        self.assertFalse(is_complete('variable f = procedimiento(x) {'))
+        self.assertFalse(is_complete('f(1,'))
+        self.assertTrue(is_complete('variable f = procedimiento(x) { x };'))
+
+    def test_engines(self) -> None:
+        for engine in ENGINES:
+            session: Session = Session(engine)
+
+            session.execute('variable suma = procedimiento(x, y) { x + y };')
+            evaluated = session.execute('suma(2, 3);')
+
+            self.assertEqual(cast(Integer, evaluated).value, 5, engine)
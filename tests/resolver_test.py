@@ -0,0 +1,136 @@
+from typing import (
+    cast,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from unittest import TestCase
+
+from lpm.ast import (
+    ExpressionStatement,
+    Function,
+    Identifier,
+    Infix,
+    LetStatement,
+    Program,
+)
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Error,
+    Integer,
+)
+from lpm.parser import Parser
+from lpm.repl import Session
+from lpm.resolver import (
+    BUILTIN,
+    GLOBAL,
+    resolve,
+    UNKNOWN,
+)
+
+
+class ResolverTest(TestCase):
+
+    def test_locals_and_free_variables(self) -> None:
+        program = self._resolve('''
+            variable a = procedimiento(x, y) {
+                variable z = x;
+                procedimiento(w) { w + z + y + a + longitud + nada }
+            };
+        ''')
+
+        let = cast(LetStatement, program.statements[0])
+        self.assertEqual((let.depth, let.slot), (GLOBAL, -1))
+
+        outer = cast(Function, let.value)
+        self.assertEqual(outer.slots, {'x': 0, 'y': 1, 'z': 2})
+        assert outer.body is not None
+        inner_let = cast(LetStatement, outer.body.statements[0])
+        self.assertEqual((inner_let.depth, inner_let.slot), (0, 2))
+
+        inner = cast(Function, cast(ExpressionStatement, outer.body.statements[1]).expression)
+        self.assertEqual(inner.slots, {'w': 0})
+        assert inner.body is not None
+        identifiers = self._identifiers(cast(ExpressionStatement, inner.body.statements[0]).expression)
+        self.assertEqual([(identifier.value, identifier.depth, identifier.slot) for identifier in identifiers], [
+            ('w', 0, 0),
+            ('z', 1, 2),
+            ('y', 1, 1),
+            ('a', GLOBAL, -1),
+            ('longitud', BUILTIN, -1),
+            ('nada', UNKNOWN, -1),
+        ])
+
+    def test_variables_in_nested_blocks_get_slots(self) -> None:
+        program = self._resolve('''
+            procedimiento(n) {
+                si (n > 0) { variable a = 1; } si_no { variable b = 2; };
+                variable c = 1 + si (verdadero) { variable d = 3; d };
+                procedimiento() { variable e = 4; };
+            };
+        ''')
+
+        function = cast(Function, cast(ExpressionStatement, program.statements[0]).expression)
+        self.assertEqual(list(cast(Dict[str, int], function.slots)), ['n', 'a', 'b', 'c', 'd'])
+
+    def test_shadowed_builtins_are_globals(self) -> None:
+        program = self._resolve('variable longitud = 1; longitud;')
+
+        identifier = cast(Identifier, cast(ExpressionStatement, program.statements[1]).expression)
+        self.assertEqual(identifier.depth, GLOBAL)
+
+    def test_evaluation(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('variable x = 1; variable f = procedimiento() { variable a = x; variable x = 5; a + x }; f();', 6),
+            ('variable f = procedimiento(x) { variable x = x + 1; x }; f(1);', 2),
+            ('variable longitud = procedimiento(x) { 42 }; longitud("abc");', 42),
+            ('''
+                 variable f = procedimiento(a) {
+                     procedimiento(b) { procedimiento(c) { procedimiento(d) { a * b + c * d } } }
+                 };
+                 f(1)(2)(3)(4);
+             ''', 14),
+            ('''
+                 variable f = procedimiento(n) {
+                     variable g = procedimiento() { si (n > 0) { variable m = n - 1; f(m) } si_no { 7 } };
+                     g()
+                 };
+                 f(3);
+             ''', 7),
+        ]
+
+        for source, expected in tests:
+            evaluated = evaluate(Parser(tokenize(source)).parse_program(), Environment())
+
+            self.assertIsInstance(evaluated, Integer, source)
+            self.assertEqual(cast(Integer, evaluated).value, expected, source)
+
+    def test_names_defined_by_earlier_programs(self) -> None:
+        session: Session = Session()
+
+        session.execute('variable longitud = 5; variable f = procedimiento() { nada };')
+        self.assertEqual(cast(Integer, session.execute('longitud;')).value, 5)
+        self.assertIsInstance(session.execute('f();'), Error)
+
+        session.execute('variable nada = 3;')
+        self.assertEqual(cast(Integer, session.execute('f() + nada;')).value, 6)
+
+    def _resolve(self, source: str) -> Program:
+        parser: Parser = Parser(tokenize(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        resolve(program)
+        return program
+
+    def _identifiers(self, node: Optional[object]) -> List[Identifier]:
+        if type(node) == Identifier:
+            return [cast(Identifier, node)]
+        elif type(node) == Infix:
+            node = cast(Infix, node)
+            return self._identifiers(node.left) + self._identifiers(node.right)
+
+        return []
@@ -0,0 +1,167 @@
+from gc import collect
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+
+import lpm.transpiler as transpiler
+import tests.evaluator_test as evaluator_test
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Integer,
+    Object,
+)
+from lpm.parser import Parser
+from lpm.repl import Session
+from lpm.transpiler import (
+    execute,
+    transpile,
+    TranspiledFunction,
+)
+
+
+class TranspilerTest(evaluator_test.EvaluatorTest):
+
+    def test_closures(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable suma = procedimiento(x) { procedimiento(y) { procedimiento(z) { x + y + z } } };
+                 suma(1)(2)(3);
+             ''', 6),
+            ('''
+                 variable f = procedimiento(x) {
+                     variable g = procedimiento() { y };
+                     variable y = x * 2;
+                     g()
+                 };
+                 f(4);
+             ''', 8),
+            ('variable f = procedimiento(x) { si (x > 1) { 1 } si_no { 2 } + 1 }; f(0);', 3),
+            ('variable resta = procedimiento(a, b) { a - b }; resta(10, 3);', 7),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+    def test_falls_back_to_the_evaluator(self) -> None:
+        tests: List[str] = [
+            'variable x = 1; variable f = procedimiento() { variable a = x; variable x = 5; a + x }; f();',
+            'variable f = procedimiento(c) { variable r = si (c) { regresa 1; } si_no { 2 }; r }; f(verdadero);',
+            'variable f = procedimiento(c) { 1 + si (c) { regresa 1; } }; f(verdadero);',
+            'variable f = procedimiento(x, y) { x }; f(1, 2, 3);',
+            '"a" < "b";',
+            '"ab" * 2;',
+            'longitud("abc") + longitud(1);',
+            'longitud(1); 5;',
+        ]
+
+        for source in tests:
+            expected = evaluate(Parser(tokenize(source)).parse_program(), Environment())
+            evaluated = self._evaluate_tests(source)
+
+            assert expected is not None
+            self.assertEqual(type(evaluated), type(expected))
+            self.assertEqual(evaluated.inspect(), expected.inspect())
+
+    def test_code_is_cached(self) -> None:
+        source: str = 'variable doble = procedimiento(x) { x * 2 }; doble(4);'
+
+        first = transpile(Parser(tokenize(source)).parse_program())
+        second = transpile(Parser(tokenize(source)).parse_program())
+
+        self.assertIs(first.code, second.code)
+
+    def test_state_persists_between_runs(self) -> None:
+        env: Environment = Environment()
+        execute(Parser(tokenize('variable a = 1; variable f = procedimiento() { a };')).parse_program(), env)
+        execute(Parser(tokenize('variable a = 2;')).parse_program(), env)
+        evaluated = execute(Parser(tokenize('f() + a;')).parse_program(), env)
+
+        self.assertIsInstance(env['f'], TranspiledFunction)
+        self.assertIsInstance(env['a'], Integer)
+        self.assertEqual(cast(Integer, evaluated).value, 4)
+
+    def test_fallback_after_state_persisted(self) -> None:
+        env: Environment = Environment()
+        execute(Parser(tokenize('variable f = procedimiento(x) { x * 2 };')).parse_program(), env)
+        tests: List[Tuple[str, str]] = [
+            ('f("a");', 'Error: Discrepancia de tipos: STRING * INTEGER'),
+            ('f(3) + verdadero;', 'Error: Discrepancia de tipos: INTEGER + BOOLEAN'),
+            ('f(4);', '8'),
+        ]
+
+        self.assertIsInstance(env['f'], TranspiledFunction)
+        for source, expected in tests:
+            evaluated = execute(Parser(tokenize(source)).parse_program(), env)
+
+            assert evaluated is not None
+            self.assertEqual(evaluated.inspect(), expected, source)
+
+    def test_sessions_match_the_evaluator(self) -> None:
+        tests: List[List[str]] = [
+            ['variable x = 5; variable f = procedimiento() { x + 1 }; f();', 'variable x = "a";', 'f();'],
+            ['variable x = 1; variable f = procedimiento() { x };',
+             'variable y = longitud(1) == 1; variable x = 2;',
+             'f();'],
+            ['variable f = procedimiento() { g(1) }; variable g = procedimiento(x) { x };',
+             'f();',
+             'variable g = procedimiento(c) { variable r = si (c) { regresa 1; } si_no { 2 }; r };',
+             'f();',
+             'variable g = procedimiento(x) { x * 3 };',
+             'f();'],
+        ]
+
+        for lines in tests:
+            transpiled: Session = Session('transpiler')
+            evaluated: Session = Session()
+            for line in lines:
+                expected = evaluated.execute(line)
+                result = transpiled.execute(line)
+
+                self.assertEqual(result is None, expected is None, line)
+                if result is not None and expected is not None:
+                    self.assertEqual(result.inspect(), expected.inspect(), line)
+
+    def test_literals_of_programs_sharing_code(self) -> None:
+        sources: List[str] = [
+            'variable h = procedimiento(y, z) { y };',
+            'variable h = procedimiento(y, z) { regresa y; };',
+        ]
+        sessions: List[Session] = [Session('transpiler') for _ in sources]
+
+        for session, source in zip(sessions, sources):
+            session.execute(source)
+        for session, source in zip(sessions, sources):
+            expected = Session().execute(source + ' h;')
+            evaluated = session.execute('h;')
+
+            assert expected is not None and evaluated is not None
+            self.assertEqual(evaluated.inspect(), expected.inspect(), source)
+        self.assertIs(transpile(Parser(tokenize(sources[0])).parse_program()).code,
+                      transpile(Parser(tokenize(sources[1])).parse_program()).code)
+
+    def test_equal_code_of_other_programs(self) -> None:
+        first: Environment = Environment()
+        second: Environment = Environment()
+        execute(Parser(tokenize('variable f = procedimiento(x) { x };')).parse_program(), first)
+        execute(Parser(tokenize('variable g = procedimiento(x) { x }; 1;')).parse_program(), second)
+
+        # Drops the first program's code, which the second one's equals.
+        del first
+        transpiler._programs.clear()
+        collect()
+        evaluated = execute(Parser(tokenize('g;')).parse_program(), second)
+
+        self.assertIsInstance(evaluated, TranspiledFunction)
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program = Parser(tokenize(source), lazy=True).parse_program()
+
+        evaluated = execute(program, Environment())
+
+        assert evaluated is not None
+        return evaluated
@@ -0,0 +1,164 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+from unittest import TestCase
+
+from lpm.ast import (
+    Function,
+    LetStatement,
+    Program,
+)
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Error,
+    Integer,
+    ObjectType,
+    String,
+)
+from lpm.parser import Parser
+from lpm.repl import Session
+from lpm.resolver import resolve
+from lpm.typecheck import (
+    check,
+    FunctionTypes,
+    TypeReport,
+)
+
+
+class TypeCheckTest(TestCase):
+
+    def test_guaranteed_errors(self) -> None:
+        source = '''
+            variable malo = procedimiento(x) { x + "a" };
+            malo(1);
+            -"a";
+            1 + verdadero;
+            "a" - "b";
+            verdadero + falso;
+        '''
+        report = self._check(source)
+
+        self.assertEqual([message for _, message in report.errors], [
+            'Discrepancia de tipos: INTEGER + STRING',
+            'Operador desconocido: -STRING',
+            'Discrepancia de tipos: INTEGER + BOOLEAN',
+            'Operador desconocido: STRING - STRING',
+            'Operador desconocido: BOOLEAN + BOOLEAN',
+        ])
+        self.assertEqual(report.errors[0][0], source.index('+ "a"'))
+
+    def test_uncertain_operations_are_not_errors(self) -> None:
+        report = self._check('''
+            variable f = procedimiento(x) { x + 1 };
+            variable g = f;
+            variable y = si (verdadero) { 1 } si_no { "a" };
+            variable z = procedimiento(a) { a - 1 };
+            f(1) + y;
+            z("a");
+            z(1);
+            nada + 1;
+        ''')
+
+        self.assertEqual(report.errors, [])
+
+    def test_specialized_operations(self) -> None:
+        report = self._check('''
+            variable fib = procedimiento(n) { si (n < 2) { n } si_no { fib(n - 1) + fib(n - 2) } };
+            variable saluda = procedimiento(s) { variable t = "hola " + s; t == "hola mundo" };
+            variable x = fib(10);
+            saluda("mundo");
+            -x;
+        ''')
+
+        self.assertEqual([(str(node), operand_type) for node, operand_type in report.specialized], [
+            ('(n < 2)', ObjectType.INTEGER),
+            ('(n - 1)', ObjectType.INTEGER),
+            ('(n - 2)', ObjectType.INTEGER),
+            ('(fib((n - 1)) + fib((n - 2)))', ObjectType.INTEGER),
+            ('(hola  + s)', ObjectType.STRING),
+            ('(t == hola mundo)', ObjectType.STRING),
+            ('(-x)', ObjectType.INTEGER),
+        ])
+
+    def test_inferred_parameters(self) -> None:
+        program: Program = self._parse('''
+            variable suma = procedimiento(n, total) { si (n < 1) { regresa total; } suma(n - 1, total + n) };
+            variable repite = procedimiento(s, n) { si (n < 1) { s } si_no { repite(s + s, n - 1) } };
+            variable mezcla = procedimiento(x) { x };
+            variable nunca = procedimiento(x) { x };
+            suma(10, 0);
+            repite("a", 3);
+            mezcla(1);
+            mezcla("a");
+        ''')
+        check(program)
+
+        parameters = [cast(FunctionTypes, cast(Function, cast(LetStatement, statement).value).types).parameters
+                      for statement in program.statements[:4]]
+        self.assertEqual(parameters, [[Integer, Integer], [String, Integer], None, None])
+
+    def test_closures_see_every_assignment(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('variable x = 1; variable f = procedimiento() { x + 1 }; variable x = "a"; f();',
+             'Discrepancia de tipos: STRING + INTEGER'),
+            ('variable f = procedimiento(a) { variable g = procedimiento() { a * 2 }; variable a = "b"; g() }; f(1);',
+             'Discrepancia de tipos: STRING * INTEGER'),
+            ('variable f = procedimiento(a) { procedimiento() { -a } }; f(1)(); f("a")();',
+             'Operador desconocido: -STRING'),
+        ]
+
+        for source, expected in tests:
+            report = self._check(source)
+            evaluated = evaluate(self._parse(source), Environment())
+
+            self.assertEqual(report.errors, [], source)
+            self.assertEqual(cast(Error, evaluated).message, expected, source)
+
+    def test_failed_assumptions_fall_back_to_checks(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('variable f = procedimiento(x) { x + x }; variable g = f; f(1); g("a");', 'aa'),
+            ('variable f = procedimiento(x) { x * 2 }; variable g = f; f(1); g("a");',
+             'Error: Discrepancia de tipos: STRING * INTEGER'),
+            ('variable f = procedimiento(x) { procedimiento() { x + x } }; variable c = f(1); '
+             'variable g = f; variable d = g("a"); d();', 'aa'),
+        ]
+
+        for source, expected in tests:
+            evaluated = evaluate(self._parse(source), Environment())
+
+            assert evaluated is not None
+            self.assertEqual(evaluated.inspect(), expected, source)
+
+    def test_results_of_rebound_procedimientos(self) -> None:
+        session: Session = Session()
+        session.execute('''
+            variable f = procedimiento(x) { x + 1 };
+            variable g = procedimiento(x) { f(x) + f(x) };
+            g(1);
+        ''')
+
+        self.assertEqual(cast(Integer, session.execute('g(1);')).value, 4)
+        session.execute('variable f = procedimiento(x) { "a" };')
+        self.assertEqual(cast(String, session.execute('g(1);')).value, 'aa')
+
+    def test_calls_from_later_inputs(self) -> None:
+        session: Session = Session()
+        session.execute('variable f = procedimiento(x) { x + x }; f(1);')
+
+        self.assertEqual(cast(String, session.execute('f("a");')).value, 'aa')
+        self.assertEqual(cast(Integer, session.execute('f(2);')).value, 4)
+
+    def _check(self, source: str) -> TypeReport:
+        return check(self._parse(source))
+
+    def _parse(self, source: str) -> Program:
+        parser: Parser = Parser(tokenize(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        resolve(program)
+        return program
@@ -0,0 +1,97 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+
+import tests.evaluator_test as evaluator_test
+from lpm.evaluator import (
+    FALSE,
+    NULL,
+    TRUE,
+)
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Error,
+    Integer,
+    Object,
+    String,
+)
+from lpm.parser import Parser
+from lpm.unboxed import (
+    box,
+    execute,
+    unbox,
+)
+
+
+class UnboxedTest(evaluator_test.EvaluatorTest):
+
+    def test_values_are_unboxed(self) -> None:
+        env: Environment = Environment()
+        execute(Parser(tokenize('''
+            variable a = 1 + 2; variable b = "x" + "y"; variable c = 1 < 2; variable d = si (falso) { 1 };
+        ''')).parse_program(), env)
+
+        self.assertEqual([env['a'], env['b'], env['c'], env['d']], [3, 'xy', True, None])
+
+    def test_boxing(self) -> None:
+        tests: List[Tuple[object, Object]] = [
+            (5, Integer(5)),
+            ('abc', String('abc')),
+            (True, TRUE),
+            (False, FALSE),
+            (None, NULL),
+        ]
+
+        for value, expected in tests:
+            boxed = box(value)
+
+            assert boxed is not None
+            self.assertEqual(boxed.inspect(), expected.inspect())
+            self.assertIs(type(boxed), type(expected))
+            self.assertEqual(unbox(boxed), value)
+            self.assertIs(type(unbox(boxed)), type(value))
+
+    def test_equality_across_types(self) -> None:
+        tests: List[Tuple[str, bool]] = [
+            ('1 == verdadero', False),
+            ('0 != falso', True),
+            ('verdadero == (1 < 2)', True),
+            ('"1" == 1', False),
+            ('si (falso) { 1 } == si (falso) { 2 }', True),
+        ]
+
+        for source, expected in tests:
+            self._test_boolean_object(self._evaluate_tests(source), expected)
+
+    def test_error_type_names(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('verdadero + 1;', 'Discrepancia de tipos: BOOLEAN + INTEGER'),
+            ('"a" * "b";', 'Operador desconocido: STRING * STRING'),
+            ('-"a";', 'Operador desconocido: -STRING'),
+            ('si (falso) { 1 } - 1;', 'Discrepancia de tipos: NULL - INTEGER'),
+            ('(1 + verdadero) + 1;', 'Discrepancia de tipos: ERROR + INTEGER'),
+            ('longitud + 1;', 'Discrepancia de tipos: BUILTIN + INTEGER'),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            self.assertIsInstance(evaluated, Error)
+            self.assertEqual(cast(Error, evaluated).message, expected)
+
+    def test_tail_calls(self) -> None:
+        evaluated = self._evaluate_tests('''
+            variable cuenta = procedimiento(n, total) { si (n == 0) { total } si_no { cuenta(n - 1, total + n) } };
+            cuenta(5000, 0);
+        ''')
+
+        self._test_integer_object(evaluated, 12502500)
+
+    def _evaluate_tests(self, source: str) -> Object:
+        evaluated = execute(Parser(tokenize(source)).parse_program(), Environment())
+
+        assert evaluated is not None
+        return evaluated
@@ -0,0 +1,122 @@
+from typing import (
+    cast,
+    List,
+    Tuple,
+)
+
+import tests.evaluator_test as evaluator_test
+from lpm.compiler import LOAD_LOCAL
+from lpm.evaluator import evaluate
+from lpm.lexer import tokenize
+from lpm.object import (
+    Environment,
+    Integer,
+    Object,
+)
+from lpm.parser import Parser
+from lpm.vm import (
+    Closure,
+    execute,
+)
+
+
+class VMTest(evaluator_test.EvaluatorTest):
+
+    def test_closures(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                 variable suma = procedimiento(x) { procedimiento(y) { procedimiento(z) { x + y + z } } };
+                 suma(1)(2)(3);
+             ''', 6),
+            ('''
+                 variable f = procedimiento(x) {
+                     variable g = procedimiento() { y };
+                     variable y = x * 2;
+                     g()
+                 };
+                 f(4);
+             ''', 8),
+            ('''
+                 variable x = 1;
+                 variable f = procedimiento() { variable a = x; variable x = 5; a + x };
+                 f();
+             ''', 6),
+            ('variable resta = procedimiento(a, b) { a - b }; resta(10, 3);', 7),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
+    def test_matches_evaluator_on_return_and_error_values(self) -> None:
+        tests: List[str] = [
+            'variable f = procedimiento(c) { variable r = si (c) { regresa 1; } si_no { 2 }; r }; f(verdadero);',
+            'variable f = procedimiento(c) { 1 + si (c) { regresa 1; } }; f(verdadero);',
+            'variable f = procedimiento(c) { si (c) { 5 + verdadero; 3 }; 9 }; f(verdadero);',
+            'variable f = procedimiento(x) { x }; f(si (verdadero) { regresa 7; });',
+            'variable f = procedimiento() { regresa foo; 5 }; f();',
+            'longitud("abc") + longitud(1);',
+            '1; 2; regresa 3; 4;',
+            '5();',
+        ]
+
+        for source in tests:
+            expected = evaluate(Parser(tokenize(source)).parse_program(), Environment())
+            evaluated = self._evaluate_tests(source)
+
+            assert expected is not None
+            self.assertEqual(type(evaluated), type(expected))
+            self.assertEqual(evaluated.inspect(), expected.inspect())
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            variable cuenta = procedimiento(n) { si (n > 0) { cuenta(n - 1) } si_no { 0 } };
+            cuenta(20000);
+        '''
+
+        self._test_integer_object(self._evaluate_tests(source), 0)
+
+    def test_max_depth(self) -> None:
+        source: str = '''
+            variable cuenta = procedimiento(n) { si (n == 0) { 0 } si_no { 1 + cuenta(n - 1) } };
+            cuenta(100);
+        '''
+        program = Parser(tokenize(source)).parse_program()
+
+        self._test_integer_object(cast(Object, execute(program, Environment(), max_depth=101)), 100)
+        self._test_error_object(cast(Object, execute(program, Environment(), max_depth=100)),
+                                'Profundidad máxima de recursión excedida: 100')
+        self._test_error_object(self._evaluate_tests('variable f = procedimiento(n) { f(n) + 1 }; f(1);'),
+                                'Profundidad máxima de recursión excedida: 100000')
+
+    def test_locals_use_slots(self) -> None:
+        env: Environment = Environment()
+        execute(Parser(tokenize('variable f = procedimiento(x) { x }; f(1);')).parse_program(), env)
+
+        closure = cast(Closure, env['f'])
+        assert closure.code.instructions is not None
+        self.assertEqual(closure.code.instructions[0], (LOAD_LOCAL, 0))
+
+    def test_syntax_error_in_body_is_reported_on_call(self) -> None:
+        source: str = '''
+            variable roto = procedimiento(x) { regresa x + ; };
+            roto(1);
+        '''
+
+        self._test_error_object(self._evaluate_tests(source),
+                                'Error de sintaxis: No se encontró ninguna función para parsear ;')
+
+    def test_state_persists_between_runs(self) -> None:
+        env: Environment = Environment()
+        execute(Parser(tokenize('variable doble = procedimiento(x) { x * 2 };')).parse_program(), env)
+        evaluated = execute(Parser(tokenize('doble(21);')).parse_program(), env)
+
+        self.assertEqual(cast(Integer, evaluated).value, 42)
+
+    def _evaluate_tests(self, source: str) -> Object:
+        program = Parser(tokenize(source), lazy=True).parse_program()
+
+        evaluated = execute(program, Environment())
+
+        assert evaluated is not None
+        return evaluated